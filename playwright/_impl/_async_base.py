@@ -16,6 +16,7 @@ import asyncio
 from typing import Any, Callable, Coroutine, Generic, Optional, TypeVar, cast
 
 from playwright._impl._impl_to_api_mapping import ImplToApiMapping, ImplWrapper
+from playwright._impl._logger import debug_enabled, log_api, log_api_call
 
 mapping = ImplToApiMapping()
 
@@ -49,6 +50,8 @@ class AsyncEventContextManager(Generic[T]):
 
 
 class AsyncBase(ImplWrapper):
+    __slots__ = ("_loop",)
+
     def __init__(self, impl_obj: Any) -> None:
         super().__init__(impl_obj)
         self._loop = impl_obj._loop
@@ -59,6 +62,25 @@ class AsyncBase(ImplWrapper):
     def _sync(self, future: asyncio.Future) -> Any:
         return self._loop.run_until_complete(future)
 
+    def _call(self, api_name: str, impl_method: Callable, **kwargs: Any) -> Any:
+        if not debug_enabled:
+            return impl_method(**kwargs)
+        return log_api_call(api_name, lambda: impl_method(**kwargs))
+
+    async def _call_async(
+        self, api_name: str, impl_method: Callable, **kwargs: Any
+    ) -> Any:
+        if not debug_enabled:
+            return await impl_method(**kwargs)
+        log_api(f"=> {api_name} started")
+        try:
+            result = await impl_method(**kwargs)
+        except Exception:
+            log_api(f"<= {api_name} failed")
+            raise
+        log_api(f"<= {api_name} succeded")
+        return result
+
     def _wrap_handler(self, handler: Any) -> Callable[..., None]:
         if callable(handler):
             return mapping.wrap_handler(handler)
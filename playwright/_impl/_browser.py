@@ -15,7 +15,6 @@
 import json
 import sys
 from pathlib import Path
-from types import SimpleNamespace
 from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 
 from playwright._impl._api_structures import StorageState
@@ -36,10 +35,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class Browser(ChannelOwner):
-
-    Events = SimpleNamespace(
-        Disconnected="disconnected",
-    )
+    class Events:
+        Disconnected = "disconnected"
 
     def __init__(
         self, parent: "BrowserType", type: str, guid: str, initializer: Dict
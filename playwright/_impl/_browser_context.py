@@ -13,11 +13,9 @@
 # limitations under the License.
 
 import asyncio
-import inspect
 import json
 from pathlib import Path
-from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union, cast
 
 from playwright._impl._api_structures import Cookie, StorageState
 from playwright._impl._api_types import Error
@@ -42,11 +40,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class BrowserContext(ChannelOwner):
-
-    Events = SimpleNamespace(
-        Close="close",
-        Page="page",
-    )
+    class Events:
+        Close = "close"
+        Page = "page"
 
     def __init__(
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
@@ -55,7 +51,7 @@ class BrowserContext(ChannelOwner):
         self._pages: List[Page] = []
         self._routes: List[RouteHandlerEntry] = []
         self._bindings: Dict[str, Any] = {}
-        self._pending_wait_for_events: List[PendingWaitEvent] = []
+        self._pending_wait_for_events: Set[PendingWaitEvent] = set()
         self._timeout_settings = TimeoutSettings(None)
         self._browser: Optional["Browser"] = None
         self._owner_page: Optional[Page] = None
@@ -83,19 +79,20 @@ class BrowserContext(ChannelOwner):
         self.emit(BrowserContext.Events.Page, page)
 
     def _on_route(self, route: Route, request: Request) -> None:
+        url = request.url
         for handler_entry in self._routes:
-            if handler_entry.matcher.matches(request.url):
+            if handler_entry.matcher.matches(url):
                 result = cast(Any, handler_entry.handler)(route, request)
-                if inspect.iscoroutine(result):
-                    asyncio.create_task(result)
+                if asyncio.iscoroutine(result):
+                    self._loop.create_task(result)
                 return
-        asyncio.create_task(route.continue_())
+        self._loop.create_task(route.continue_())
 
     def _on_binding(self, binding_call: BindingCall) -> None:
         func = self._bindings.get(binding_call._initializer["name"])
         if func is None:
             return
-        asyncio.create_task(binding_call.call(func))
+        self._loop.create_task(binding_call.call(func))
 
     def set_default_navigation_timeout(self, timeout: float) -> None:
         self._timeout_settings.set_navigation_timeout(timeout)
@@ -163,8 +160,7 @@ class BrowserContext(ChannelOwner):
         self, script: str = None, path: Union[str, Path] = None
     ) -> None:
         if path:
-            with open(path, "r") as file:
-                script = file.read()
+            script = await self._loop.run_in_executor(None, Path(path).read_text)
         if not isinstance(script, str):
             raise Error("Either path or source parameter must be specified")
         await self._channel.send("addInitScript", dict(source=script))
@@ -197,12 +193,13 @@ class BrowserContext(ChannelOwner):
     async def unroute(
         self, url: URLMatch, handler: Optional[RouteHandler] = None
     ) -> None:
-        self._routes = list(
-            filter(
-                lambda r: r.matcher.match != url or (handler and r.handler != handler),
-                self._routes,
-            )
-        )
+        if not self._routes:
+            return
+        self._routes = [
+            r
+            for r in self._routes
+            if r.matcher.match != url or (handler and r.handler != handler)
+        ]
         if len(self._routes) == 0:
             await self._channel.send(
                 "setNetworkInterceptionEnabled", dict(enabled=False)
@@ -258,11 +255,11 @@ class BrowserContext(ChannelOwner):
         predicate: Callable[[Any], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl:
-        return EventContextManagerImpl(self.wait_for_event(event, predicate, timeout))
+        return EventContextManagerImpl(self.wait_for_event, event, predicate, timeout)
 
     def expect_page(
         self,
         predicate: Callable[[Page], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl[Page]:
-        return EventContextManagerImpl(self.wait_for_event("page", predicate, timeout))
+        return self.expect_event(BrowserContext.Events.Page, predicate, timeout)
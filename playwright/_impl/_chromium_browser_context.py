@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from types import SimpleNamespace
 from typing import Dict, List, Set
 
 from playwright._impl._browser_context import BrowserContext
@@ -22,11 +21,9 @@ from playwright._impl._page import Page, Worker
 
 
 class ChromiumBrowserContext(BrowserContext):
-
-    Events = SimpleNamespace(
-        BackgroundPage="backgroundpage",
-        ServiceWorker="serviceworker",
-    )
+    class Events:
+        BackgroundPage = "backgroundpage"
+        ServiceWorker = "serviceworker"
 
     def __init__(
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
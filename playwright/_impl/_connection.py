@@ -16,7 +16,7 @@ import asyncio
 import sys
 import traceback
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from greenlet import greenlet
 from pyee import AsyncIOEventEmitter
@@ -123,6 +123,7 @@ class Connection:
         self._dispatcher_fiber: Any = dispatcher_fiber
         self._transport = Transport(driver_executable)
         self._transport.on_message = lambda msg: self._dispatch(msg)
+        self._transport.on_send_error = self._on_send_error
         self._waiting_for_object: Dict[str, Any] = {}
         self._last_id = 0
         self._objects: Dict[str, ChannelOwner] = {}
@@ -178,6 +179,12 @@ class Connection:
         self._callbacks[id] = callback
         return callback
 
+    def _on_send_error(self, ids: List[int], error: Exception) -> None:
+        for id in ids:
+            callback = self._callbacks.pop(id, None)
+            if callback and not callback.future.done():
+                callback.future.set_exception(error)
+
     def _dispatch(self, msg: ParsedMessagePayload) -> None:
         id = msg.get("id")
         if id:
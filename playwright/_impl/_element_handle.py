@@ -212,10 +212,14 @@ class ElementHandle(JSHandle):
         if "path" in params:
             del params["path"]
         encoded_binary = await self._channel.send("screenshot", params)
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = await self._loop.run_in_executor(
+            None, base64.b64decode, encoded_binary
+        )
+        del encoded_binary
         if path:
-            with open(path, "wb") as fd:
-                fd.write(decoded_binary)
+            await self._loop.run_in_executor(
+                None, Path(path).write_bytes, decoded_binary
+            )
         return decoded_binary
 
     async def query_selector(self, selector: str) -> Optional["ElementHandle"]:
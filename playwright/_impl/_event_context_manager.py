@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import asyncio
-from typing import Any, Coroutine, Generic, Optional, TypeVar, cast
+from typing import Any, Callable, Coroutine, Generic, Optional, TypeVar, cast
 
 T = TypeVar("T")
 
@@ -33,10 +33,15 @@ class EventInfoImpl(Generic[T]):
 
 
 class EventContextManagerImpl(Generic[T]):
-    def __init__(self, coroutine: Coroutine) -> None:
-        self._event: EventInfoImpl = EventInfoImpl(coroutine)
+    def __init__(self, wait_for: Callable[..., Coroutine], *args: Any) -> None:
+        # The wait coroutine is only created once the context is entered, so a
+        # context manager that is never used does not leave one un-awaited.
+        self._wait_for = wait_for
+        self._args = args
+        self._event: EventInfoImpl
 
     async def __aenter__(self) -> EventInfoImpl[T]:
+        self._event = EventInfoImpl(self._wait_for(*self._args))
         return self._event
 
     async def __aexit__(self, *args: Any) -> None:
@@ -92,6 +92,9 @@ class Frame(ChannelOwner):
 
     def _on_frame_navigated(self, event: FrameNavigatedEvent) -> None:
         self._url = event["url"]
+        if event["name"] != self._name and hasattr(self, "_page") and self._page:
+            # A rename can change which frame page.frame(name=...) finds first.
+            self._page._frames_by_name.clear()
         self._name = event["name"]
         self._event_emitter.emit("navigated", event)
         if "error" not in event and hasattr(self, "_page") and self._page:
@@ -487,7 +490,7 @@ class Frame(ChannelOwner):
         await self._channel.send("uncheck", locals_to_params(locals()))
 
     async def wait_for_timeout(self, timeout: float) -> None:
-        await self._connection._loop.create_task(asyncio.sleep(timeout / 1000))
+        await asyncio.sleep(timeout / 1000)
 
     async def wait_for_function(
         self,
@@ -512,7 +515,7 @@ class Frame(ChannelOwner):
         state: DocumentLoadState = None,
         timeout: float = None,
     ) -> EventContextManagerImpl[Optional[Response]]:
-        return EventContextManagerImpl(self.wait_for_load_state(state, timeout))
+        return EventContextManagerImpl(self.wait_for_load_state, state, timeout)
 
     def expect_navigation(
         self,
@@ -521,5 +524,5 @@ class Frame(ChannelOwner):
         timeout: float = None,
     ) -> EventContextManagerImpl[Optional[Response]]:
         return EventContextManagerImpl(
-            self.wait_for_navigation(url, waitUntil, timeout)
+            self.wait_for_navigation, url, waitUntil, timeout
         )
@@ -14,6 +14,7 @@
 
 import asyncio
 import fnmatch
+import functools
 import math
 import re
 import sys
@@ -102,25 +103,29 @@ class FrameNavigatedEvent(TypedDict):
 Env = Dict[str, Union[str, float, bool]]
 
 
+@functools.lru_cache(maxsize=256)
+def glob_to_regex(glob: str) -> Pattern:
+    return re.compile(fnmatch.translate(glob))
+
+
 class URLMatcher:
     def __init__(self, match: URLMatch) -> None:
-        self._callback: Optional[Callable[[str], bool]] = None
-        self._regex_obj: Optional[Pattern] = None
+        # Bind the pattern's own search method so matching a URL is a direct
+        # call into the regex engine rather than a Python-level dispatch.
+        self._search: Callable[[str], Any]
         if isinstance(match, str):
-            regex = fnmatch.translate(match)
-            self._regex_obj = re.compile(regex)
+            self._search = glob_to_regex(match).search
         elif isinstance(match, Pattern):
-            self._regex_obj = match
+            self._search = match.search
         else:
-            self._callback = match
+            self._search = match
         self.match = match
 
     def matches(self, url: str) -> bool:
-        if self._callback:
-            return self._callback(url)
-        if self._regex_obj:
-            return cast(bool, self._regex_obj.search(url))
-        return False
+        return bool(self._search(url))
+
+    def matches_url_of(self, item: Union["Request", "Response"]) -> bool:
+        return bool(self._search(item.url))
 
 
 class TimeoutSettings:
@@ -176,6 +181,7 @@ def patch_error_message(message: Optional[str]) -> Optional[str]:
     return message
 
 
+@functools.lru_cache(maxsize=1024)
 def is_function_body(expression: str) -> bool:
     expression = expression.strip()
     return (
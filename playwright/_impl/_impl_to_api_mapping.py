@@ -20,6 +20,8 @@ from playwright._impl._api_types import ApiType, Error
 
 
 class ImplWrapper:
+    __slots__ = ("_impl_obj", "__weakref__")
+
     def __init__(self, impl_obj: Any) -> None:
         self._impl_obj = impl_obj
 
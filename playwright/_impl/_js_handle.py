@@ -138,6 +138,8 @@ def serialize_value(value: Any, handles: List[JSHandle], depth: int) -> Any:
 
 
 def serialize_argument(arg: Serializable = None) -> Any:
+    if arg is None:
+        return dict(value=dict(v="undefined"), handles=[])
     handles: List[JSHandle] = []
     value = serialize_value(arg, handles, 0)
     return dict(value=value, handles=handles)
@@ -14,6 +14,7 @@
 
 import os
 import sys
+from typing import Any, Callable
 
 debug_enabled = os.environ.get("PWDEBUG") or (
     "DEBUG" in os.environ and "pw:api" in os.environ["DEBUG"]
@@ -30,3 +31,14 @@ def init_logger() -> None:
 def log_api(text: str) -> None:
     if debug_enabled:
         print(f"  \033[1m\033[96mpw:api\033[0m {text}", file=sys.stderr)
+
+
+def log_api_call(api_name: str, func: Callable[[], Any]) -> Any:
+    log_api(f"=> {api_name} started")
+    try:
+        result = func()
+    except Exception:
+        log_api(f"<= {api_name} failed")
+        raise
+    log_api(f"<= {api_name} succeded")
+    return result
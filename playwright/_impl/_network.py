@@ -16,7 +16,6 @@ import base64
 import json
 import mimetypes
 from pathlib import Path
-from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
 from urllib import parse
 
@@ -264,13 +263,11 @@ class Response(ChannelOwner):
 
 
 class WebSocket(ChannelOwner):
-
-    Events = SimpleNamespace(
-        Close="close",
-        FrameReceived="framereceived",
-        FrameSent="framesent",
-        Error="socketerror",
-    )
+    class Events:
+        Close = "close"
+        FrameReceived = "framereceived"
+        FrameSent = "framesent"
+        Error = "socketerror"
 
     def __init__(
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
@@ -320,7 +317,7 @@ class WebSocket(ChannelOwner):
         predicate: Callable[[Any], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl:
-        return EventContextManagerImpl(self.wait_for_event(event, predicate, timeout))
+        return EventContextManagerImpl(self.wait_for_event, event, predicate, timeout)
 
     def _on_frame_sent(self, opcode: int, data: str) -> None:
         if opcode == 2:
@@ -14,10 +14,9 @@
 
 import asyncio
 import base64
-import inspect
 import sys
+import types
 from pathlib import Path
-from types import SimpleNamespace
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -25,6 +24,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -82,29 +82,52 @@ else:  # pragma: no cover
 if TYPE_CHECKING:  # pragma: no cover
     from playwright._impl._browser_context import BrowserContext
 
+_awaitable_types = (asyncio.Future, types.CoroutineType)
 
-class Page(ChannelOwner):
 
-    Events = SimpleNamespace(
-        Close="close",
-        Crash="crash",
-        Console="console",
-        Dialog="dialog",
-        Download="download",
-        FileChooser="filechooser",
-        DOMContentLoaded="domcontentloaded",
-        PageError="pageerror",
-        Request="request",
-        Response="response",
-        RequestFailed="requestfailed",
-        RequestFinished="requestfinished",
-        FrameAttached="frameattached",
-        FrameDetached="framedetached",
-        FrameNavigated="framenavigated",
-        Load="load",
-        Popup="popup",
-        WebSocket="websocket",
-        Worker="worker",
+class Page(ChannelOwner):
+    class Events:
+        Close = "close"
+        Crash = "crash"
+        Console = "console"
+        Dialog = "dialog"
+        Download = "download"
+        FileChooser = "filechooser"
+        DOMContentLoaded = "domcontentloaded"
+        PageError = "pageerror"
+        Request = "request"
+        Response = "response"
+        RequestFailed = "requestfailed"
+        RequestFinished = "requestfinished"
+        FrameAttached = "frameattached"
+        FrameDetached = "framedetached"
+        FrameNavigated = "framenavigated"
+        Load = "load"
+        Popup = "popup"
+        WebSocket = "websocket"
+        Worker = "worker"
+
+    # The emitter base classes still provide a __dict__, but keeping Page's own
+    # state in slots shrinks it and makes these lookups descriptor reads.
+    __slots__ = (
+        "accessibility",
+        "keyboard",
+        "mouse",
+        "touchscreen",
+        "_main_frame",
+        "_frames",
+        "_frames_by_name",
+        "_viewport_size",
+        "_is_closed",
+        "_workers",
+        "_bindings",
+        "_pending_wait_for_events",
+        "_routes",
+        "_owned_context",
+        "_timeout_settings",
+        "_video",
+        "_file_chooser_release",
+        "_browser_context",
     )
     accessibility: Accessibility
     keyboard: Keyboard
@@ -122,56 +145,36 @@ class Page(ChannelOwner):
 
         self._main_frame: Frame = from_channel(initializer["mainFrame"])
         self._main_frame._page = self
-        self._frames = [self._main_frame]
+        # Frames are kept in an insertion-ordered dict so that detaching is O(1).
+        self._frames: Dict[Frame, None] = {self._main_frame: None}
+        self._frames_by_name: Dict[str, Frame] = {
+            self._main_frame.name: self._main_frame
+        }
         vs = initializer.get("viewportSize")
         self._viewport_size: Optional[Tuple[int, int]] = (
             (vs["width"], vs["height"]) if vs else None
         )
         self._is_closed = False
-        self._workers: List["Worker"] = []
+        self._workers: Dict["Worker", None] = {}
         self._bindings: Dict[str, Any] = {}
-        self._pending_wait_for_events: List[PendingWaitEvent] = []
+        self._pending_wait_for_events: Set[PendingWaitEvent] = set()
         self._routes: List[RouteHandlerEntry] = []
         self._owned_context: Optional["BrowserContext"] = None
         self._timeout_settings: TimeoutSettings = TimeoutSettings(None)
         self._video: Optional[Video] = None
+        self._file_chooser_release: Optional[asyncio.Handle] = None
 
         self._channel.on(
             "bindingCall",
             lambda params: self._on_binding(from_channel(params["binding"])),
         )
-        self._channel.on("close", lambda _: self._on_close())
-        self._channel.on(
-            "console",
-            lambda params: self.emit(
-                Page.Events.Console, from_channel(params["message"])
-            ),
-        )
-        self._channel.on("crash", lambda _: self._on_crash())
-        self._channel.on(
-            "dialog",
-            lambda params: self.emit(
-                Page.Events.Dialog, from_channel(params["dialog"])
-            ),
-        )
-        self._channel.on(
-            "domcontentloaded", lambda _: self.emit(Page.Events.DOMContentLoaded)
-        )
-        self._channel.on(
-            "download",
-            lambda params: self.emit(
-                Page.Events.Download, from_channel(params["download"])
-            ),
-        )
-        self._channel.on(
-            "fileChooser",
-            lambda params: self.emit(
-                Page.Events.FileChooser,
-                FileChooser(
-                    self, from_channel(params["element"]), params["isMultiple"]
-                ),
-            ),
-        )
+        self._channel.on("close", self._on_close)
+        self._channel.on("console", self._emit_console)
+        self._channel.on("crash", self._on_crash)
+        self._channel.on("dialog", self._emit_dialog)
+        self._channel.on("domcontentloaded", self._emit_dom_content_loaded)
+        self._channel.on("download", self._emit_download)
+        self._channel.on("fileChooser", self._emit_file_chooser)
         self._channel.on(
             "frameAttached",
             lambda params: self._on_frame_attached(from_channel(params["frame"])),
@@ -180,23 +183,10 @@ class Page(ChannelOwner):
             "frameDetached",
             lambda params: self._on_frame_detached(from_channel(params["frame"])),
         )
-        self._channel.on("load", lambda _: self.emit(Page.Events.Load))
-        self._channel.on(
-            "pageError",
-            lambda params: self.emit(
-                Page.Events.PageError, parse_error(params["error"]["error"])
-            ),
-        )
-        self._channel.on(
-            "popup",
-            lambda params: self.emit(Page.Events.Popup, from_channel(params["page"])),
-        )
-        self._channel.on(
-            "request",
-            lambda params: self.emit(
-                Page.Events.Request, from_channel(params["request"])
-            ),
-        )
+        self._channel.on("load", self._emit_load)
+        self._channel.on("pageError", self._emit_page_error)
+        self._channel.on("popup", self._emit_popup)
+        self._channel.on("request", self._emit_request)
         self._channel.on(
             "requestFailed",
             lambda params: self._on_request_failed(
@@ -211,12 +201,7 @@ class Page(ChannelOwner):
                 from_channel(params["request"]), params["responseEndTiming"]
             ),
         )
-        self._channel.on(
-            "response",
-            lambda params: self.emit(
-                Page.Events.Response, from_channel(params["response"])
-            ),
-        )
+        self._channel.on("response", self._emit_response)
         self._channel.on(
             "route",
             lambda params: self._on_route(
@@ -229,16 +214,49 @@ class Page(ChannelOwner):
                 params["relativePath"]
             ),
         )
-        self._channel.on(
-            "webSocket",
-            lambda params: self.emit(
-                Page.Events.WebSocket, from_channel(params["webSocket"])
-            ),
-        )
+        self._channel.on("webSocket", self._emit_websocket)
         self._channel.on(
             "worker", lambda params: self._on_worker(from_channel(params["worker"]))
         )
 
+    def _emit_console(self, params: Dict) -> None:
+        self.emit(Page.Events.Console, from_channel(params["message"]))
+
+    def _emit_dialog(self, params: Dict) -> None:
+        self.emit(Page.Events.Dialog, from_channel(params["dialog"]))
+
+    def _emit_dom_content_loaded(self, _: Any) -> None:
+        self.emit(Page.Events.DOMContentLoaded)
+
+    def _emit_download(self, params: Dict) -> None:
+        self.emit(Page.Events.Download, from_channel(params["download"]))
+
+    def _emit_file_chooser(self, params: Dict) -> None:
+        self.emit(
+            Page.Events.FileChooser,
+            FileChooser(self, from_channel(params["element"]), params["isMultiple"]),
+        )
+
+    def _emit_load(self, _: Any) -> None:
+        self.emit(Page.Events.Load)
+
+    def _emit_page_error(self, params: Dict) -> None:
+        self.emit(Page.Events.PageError, parse_error(params["error"]["error"]))
+
+    def _emit_popup(self, params: Dict) -> None:
+        self.emit(Page.Events.Popup, from_channel(params["page"]))
+
+    def _emit_request(self, params: Dict) -> None:
+        if self._has_listeners(Page.Events.Request):
+            self.emit(Page.Events.Request, from_channel(params["request"]))
+
+    def _emit_response(self, params: Dict) -> None:
+        if self._has_listeners(Page.Events.Response):
+            self.emit(Page.Events.Response, from_channel(params["response"]))
+
+    def _emit_websocket(self, params: Dict) -> None:
+        self.emit(Page.Events.WebSocket, from_channel(params["webSocket"]))
+
     def _set_browser_context(self, context: "BrowserContext") -> None:
         self._browser_context = context
         self._timeout_settings = TimeoutSettings(context._timeout_settings)
@@ -250,54 +268,62 @@ class Page(ChannelOwner):
         failure_text: str = None,
     ) -> None:
         request._failure_text = failure_text
-        if request._timing:
-            request._timing["responseEnd"] = response_end_timing
-        self.emit(Page.Events.RequestFailed, request)
+        request._timing["responseEnd"] = response_end_timing
+        if self._has_listeners(Page.Events.RequestFailed):
+            self.emit(Page.Events.RequestFailed, request)
 
     def _on_request_finished(
         self, request: Request, response_end_timing: float
     ) -> None:
-        if request._timing:
-            request._timing["responseEnd"] = response_end_timing
-        self.emit(Page.Events.RequestFinished, request)
+        request._timing["responseEnd"] = response_end_timing
+        if self._has_listeners(Page.Events.RequestFinished):
+            self.emit(Page.Events.RequestFinished, request)
+
+    def _has_listeners(self, event: str) -> bool:
+        # Network events fire for every subresource; skip emitting (and pyee's
+        # locking and handler dispatch) when nobody is subscribed.
+        return bool(self.listeners(event))
 
     def _on_frame_attached(self, frame: Frame) -> None:
         frame._page = self
-        self._frames.append(frame)
+        self._frames[frame] = None
         self.emit(Page.Events.FrameAttached, frame)
 
     def _on_frame_detached(self, frame: Frame) -> None:
-        self._frames.remove(frame)
+        self._frames.pop(frame, None)
+        if self._frames_by_name.get(frame.name) is frame:
+            del self._frames_by_name[frame.name]
         frame._detached = True
         self.emit(Page.Events.FrameDetached, frame)
 
     def _on_route(self, route: Route, request: Request) -> None:
+        url = request.url
         for handler_entry in self._routes:
-            if handler_entry.matcher.matches(request.url):
+            if handler_entry.matcher.matches(url):
                 result = cast(Any, handler_entry.handler)(route, request)
-                if inspect.iscoroutine(result):
-                    asyncio.create_task(result)
+                if asyncio.iscoroutine(result):
+                    self._loop.create_task(result)
                 return
         self._browser_context._on_route(route, request)
 
     def _on_binding(self, binding_call: "BindingCall") -> None:
         func = self._bindings.get(binding_call._initializer["name"])
         if func:
-            asyncio.create_task(binding_call.call(func))
+            self._loop.create_task(binding_call.call(func))
         self._browser_context._on_binding(binding_call)
 
     def _on_worker(self, worker: "Worker") -> None:
-        self._workers.append(worker)
+        self._workers[worker] = None
         worker._page = self
         self.emit(Page.Events.Worker, worker)
 
-    def _on_close(self) -> None:
+    def _on_close(self, _: Any = None) -> None:
         self._is_closed = True
         self._browser_context._pages.remove(self)
         self._reject_pending_operations(False)
         self.emit(Page.Events.Close)
 
-    def _on_crash(self) -> None:
+    def _on_crash(self, _: Any = None) -> None:
         self._reject_pending_operations(True)
         self.emit(Page.Events.Crash)
 
@@ -307,18 +333,33 @@ class Page(ChannelOwner):
 
     def _add_event_handler(self, event: str, k: Any, v: Any) -> None:
         if event == Page.Events.FileChooser and len(self.listeners(event)) == 0:
-            self._channel.send_no_reply(
-                "setFileChooserInterceptedNoReply", {"intercepted": True}
-            )
+            if self._file_chooser_release:
+                # Interception was never turned off, drop the pending release.
+                self._file_chooser_release.cancel()
+                self._file_chooser_release = None
+            else:
+                self._channel.send_no_reply(
+                    "setFileChooserInterceptedNoReply", {"intercepted": True}
+                )
         super()._add_event_handler(event, k, v)
 
     def remove_listener(self, event: str, f: Any) -> None:
         super().remove_listener(event, f)
-        if event == Page.Events.FileChooser and len(self.listeners(event)) == 0:
-            self._channel.send_no_reply(
-                "setFileChooserInterceptedNoReply", {"intercepted": False}
+        if (
+            event == Page.Events.FileChooser
+            and len(self.listeners(event)) == 0
+            and not self._file_chooser_release
+        ):
+            self._file_chooser_release = self._loop.call_soon(
+                self._release_file_chooser
             )
 
+    def _release_file_chooser(self) -> None:
+        self._file_chooser_release = None
+        self._channel.send_no_reply(
+            "setFileChooserInterceptedNoReply", {"intercepted": False}
+        )
+
     @property
     def context(self) -> "BrowserContext":
         return self._browser_context
@@ -331,9 +372,16 @@ class Page(ChannelOwner):
         return self._main_frame
 
     def frame(self, name: str = None, url: URLMatch = None) -> Optional[Frame]:
+        if name and not url:
+            # Only filled by the scan below, which finds the first frame in
+            # attach order; renames clear it (see Frame._on_frame_navigated).
+            cached = self._frames_by_name.get(name)
+            if cached:
+                return cached
         matcher = URLMatcher(url) if url else None
         for frame in self._frames:
             if name and frame.name == name:
+                self._frames_by_name[name] = frame
                 return frame
             if url and matcher and matcher.matches(frame.url):
                 return frame
@@ -341,17 +389,17 @@ class Page(ChannelOwner):
 
     @property
     def frames(self) -> List[Frame]:
-        return self._frames.copy()
+        return list(self._frames)
 
     def set_default_navigation_timeout(self, timeout: float) -> None:
         self._timeout_settings.set_navigation_timeout(timeout)
         self._channel.send_no_reply(
-            "setDefaultNavigationTimeoutNoReply", dict(timeout=timeout)
+            "setDefaultNavigationTimeoutNoReply", {"timeout": timeout}
         )
 
     def set_default_timeout(self, timeout: float) -> None:
         self._timeout_settings.set_timeout(timeout)
-        self._channel.send_no_reply("setDefaultTimeoutNoReply", dict(timeout=timeout))
+        self._channel.send_no_reply("setDefaultTimeoutNoReply", {"timeout": timeout})
 
     async def query_selector(self, selector: str) -> Optional[ElementHandle]:
         return await self._main_frame.query_selector(selector)
@@ -365,12 +413,16 @@ class Page(ChannelOwner):
         timeout: float = None,
         state: Literal["attached", "detached", "hidden", "visible"] = None,
     ) -> Optional[ElementHandle]:
-        return await self._main_frame.wait_for_selector(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_selector(
+            selector, timeout=timeout, state=state
+        )
 
     async def dispatch_event(
         self, selector: str, type: str, eventInit: Dict = None, timeout: float = None
     ) -> None:
-        return await self._main_frame.dispatch_event(**locals_to_params(locals()))
+        return await self._main_frame.dispatch_event(
+            selector, type, eventInit=eventInit, timeout=timeout
+        )
 
     async def evaluate(
         self, expression: str, arg: Serializable = None, force_expr: bool = None
@@ -413,12 +465,14 @@ class Page(ChannelOwner):
         content: str = None,
         type: str = None,
     ) -> ElementHandle:
-        return await self._main_frame.add_script_tag(**locals_to_params(locals()))
+        return await self._main_frame.add_script_tag(
+            url=url, path=path, content=content, type=type
+        )
 
     async def add_style_tag(
         self, url: str = None, path: Union[str, Path] = None, content: str = None
     ) -> ElementHandle:
-        return await self._main_frame.add_style_tag(**locals_to_params(locals()))
+        return await self._main_frame.add_style_tag(url=url, path=path, content=content)
 
     async def expose_function(self, name: str, callback: Callable) -> None:
         await self.expose_binding(name, lambda source, *args: callback(*args))
@@ -434,12 +488,12 @@ class Page(ChannelOwner):
             )
         self._bindings[name] = callback
         await self._channel.send(
-            "exposeBinding", dict(name=name, needsHandle=handle or False)
+            "exposeBinding", {"name": name, "needsHandle": handle or False}
         )
 
     async def set_extra_http_headers(self, headers: Dict[str, str]) -> None:
         await self._channel.send(
-            "setExtraHTTPHeaders", dict(headers=serialize_headers(headers))
+            "setExtraHTTPHeaders", {"headers": serialize_headers(headers)}
         )
 
     @property
@@ -455,7 +509,9 @@ class Page(ChannelOwner):
         timeout: float = None,
         waitUntil: DocumentLoadState = None,
     ) -> None:
-        return await self._main_frame.set_content(**locals_to_params(locals()))
+        return await self._main_frame.set_content(
+            html, timeout=timeout, waitUntil=waitUntil
+        )
 
     async def goto(
         self,
@@ -464,7 +520,9 @@ class Page(ChannelOwner):
         waitUntil: DocumentLoadState = None,
         referer: str = None,
     ) -> Optional[Response]:
-        return await self._main_frame.goto(**locals_to_params(locals()))
+        return await self._main_frame.goto(
+            url, timeout=timeout, waitUntil=waitUntil, referer=referer
+        )
 
     async def reload(
         self,
@@ -478,7 +536,7 @@ class Page(ChannelOwner):
     async def wait_for_load_state(
         self, state: DocumentLoadState = None, timeout: float = None
     ) -> None:
-        return await self._main_frame.wait_for_load_state(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_load_state(state=state, timeout=timeout)
 
     async def wait_for_navigation(
         self,
@@ -486,27 +544,24 @@ class Page(ChannelOwner):
         waitUntil: DocumentLoadState = None,
         timeout: float = None,
     ) -> Optional[Response]:
-        return await self._main_frame.wait_for_navigation(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_navigation(
+            url=url, waitUntil=waitUntil, timeout=timeout
+        )
 
     async def wait_for_request(
         self,
         urlOrPredicate: URLMatchRequest,
         timeout: float = None,
     ) -> Request:
-        matcher = None if callable(urlOrPredicate) else URLMatcher(urlOrPredicate)
-        predicate = urlOrPredicate if callable(urlOrPredicate) else None
-
-        def my_predicate(request: Request) -> bool:
-            if matcher:
-                return matcher.matches(request.url)
-            if predicate:
-                return urlOrPredicate(request)
-            return True
-
+        predicate = (
+            urlOrPredicate
+            if callable(urlOrPredicate)
+            else URLMatcher(urlOrPredicate).matches_url_of
+        )
         return cast(
             Request,
             await self.wait_for_event(
-                Page.Events.Request, predicate=my_predicate, timeout=timeout
+                Page.Events.Request, predicate=predicate, timeout=timeout
             ),
         )
 
@@ -515,20 +570,15 @@ class Page(ChannelOwner):
         urlOrPredicate: URLMatchResponse,
         timeout: float = None,
     ) -> Response:
-        matcher = None if callable(urlOrPredicate) else URLMatcher(urlOrPredicate)
-        predicate = urlOrPredicate if callable(urlOrPredicate) else None
-
-        def my_predicate(response: Response) -> bool:
-            if matcher:
-                return matcher.matches(response.url)
-            if predicate:
-                return predicate(response)
-            return True
-
+        predicate = (
+            urlOrPredicate
+            if callable(urlOrPredicate)
+            else URLMatcher(urlOrPredicate).matches_url_of
+        )
         return cast(
             Response,
             await self.wait_for_event(
-                Page.Events.Response, predicate=my_predicate, timeout=timeout
+                Page.Events.Response, predicate=predicate, timeout=timeout
             ),
         )
 
@@ -575,7 +625,7 @@ class Page(ChannelOwner):
     async def set_viewport_size(self, width: int, height: int) -> None:
         self._viewport_size = (width, height)
         await self._channel.send(
-            "setViewportSize", dict(viewportSize=locals_to_params(locals()))
+            "setViewportSize", {"viewportSize": {"width": width, "height": height}}
         )
 
     def viewport_size(self) -> Optional[Tuple[int, int]]:
@@ -588,31 +638,29 @@ class Page(ChannelOwner):
         self, script: str = None, path: Union[str, Path] = None
     ) -> None:
         if path:
-            with open(path, "r") as file:
-                script = file.read()
+            script = await self._loop.run_in_executor(None, Path(path).read_text)
         if not isinstance(script, str):
             raise Error("Either path or source parameter must be specified")
-        await self._channel.send("addInitScript", dict(source=script))
+        await self._channel.send("addInitScript", {"source": script})
 
     async def route(self, url: URLMatch, handler: RouteHandler) -> None:
         self._routes.append(RouteHandlerEntry(URLMatcher(url), handler))
         if len(self._routes) == 1:
-            await self._channel.send(
-                "setNetworkInterceptionEnabled", dict(enabled=True)
-            )
+            await self._channel.send("setNetworkInterceptionEnabled", {"enabled": True})
 
     async def unroute(
         self, url: URLMatch, handler: Optional[RouteHandler] = None
     ) -> None:
-        self._routes = list(
-            filter(
-                lambda r: r.matcher.match != url or (handler and r.handler != handler),
-                self._routes,
-            )
-        )
+        if not self._routes:
+            return
+        self._routes = [
+            r
+            for r in self._routes
+            if r.matcher.match != url or (handler and r.handler != handler)
+        ]
         if len(self._routes) == 0:
             await self._channel.send(
-                "setNetworkInterceptionEnabled", dict(enabled=False)
+                "setNetworkInterceptionEnabled", {"enabled": False}
             )
 
     async def screenshot(
@@ -629,10 +677,14 @@ class Page(ChannelOwner):
         if "path" in params:
             del params["path"]
         encoded_binary = await self._channel.send("screenshot", params)
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = await self._loop.run_in_executor(
+            None, base64.b64decode, encoded_binary
+        )
+        del encoded_binary
         if path:
-            with open(path, "wb") as fd:
-                fd.write(decoded_binary)
+            await self._loop.run_in_executor(
+                None, Path(path).write_bytes, decoded_binary
+            )
         return decoded_binary
 
     async def title(self) -> str:
@@ -662,7 +714,17 @@ class Page(ChannelOwner):
         force: bool = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.click(**locals_to_params(locals()))
+        return await self._main_frame.click(
+            selector,
+            modifiers=modifiers,
+            position=position,
+            delay=delay,
+            button=button,
+            clickCount=clickCount,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+        )
 
     async def dblclick(
         self,
@@ -675,7 +737,16 @@ class Page(ChannelOwner):
         force: bool = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.dblclick(**locals_to_params(locals()))
+        return await self._main_frame.dblclick(
+            selector,
+            modifiers=modifiers,
+            position=position,
+            delay=delay,
+            button=button,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+        )
 
     async def tap(
         self,
@@ -686,29 +757,38 @@ class Page(ChannelOwner):
         force: bool = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.tap(**locals_to_params(locals()))
+        return await self._main_frame.tap(
+            selector,
+            modifiers=modifiers,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+        )
 
     async def fill(
         self, selector: str, value: str, timeout: float = None, noWaitAfter: bool = None
     ) -> None:
-        return await self._main_frame.fill(**locals_to_params(locals()))
+        return await self._main_frame.fill(
+            selector, value, timeout=timeout, noWaitAfter=noWaitAfter
+        )
 
     async def focus(self, selector: str, timeout: float = None) -> None:
-        return await self._main_frame.focus(**locals_to_params(locals()))
+        return await self._main_frame.focus(selector, timeout=timeout)
 
     async def text_content(self, selector: str, timeout: float = None) -> Optional[str]:
-        return await self._main_frame.text_content(**locals_to_params(locals()))
+        return await self._main_frame.text_content(selector, timeout=timeout)
 
     async def inner_text(self, selector: str, timeout: float = None) -> str:
-        return await self._main_frame.inner_text(**locals_to_params(locals()))
+        return await self._main_frame.inner_text(selector, timeout=timeout)
 
     async def inner_html(self, selector: str, timeout: float = None) -> str:
-        return await self._main_frame.inner_html(**locals_to_params(locals()))
+        return await self._main_frame.inner_html(selector, timeout=timeout)
 
     async def get_attribute(
         self, selector: str, name: str, timeout: float = None
     ) -> Optional[str]:
-        return await self._main_frame.get_attribute(**locals_to_params(locals()))
+        return await self._main_frame.get_attribute(selector, name, timeout=timeout)
 
     async def hover(
         self,
@@ -718,7 +798,13 @@ class Page(ChannelOwner):
         timeout: float = None,
         force: bool = None,
     ) -> None:
-        return await self._main_frame.hover(**locals_to_params(locals()))
+        return await self._main_frame.hover(
+            selector,
+            modifiers=modifiers,
+            position=position,
+            timeout=timeout,
+            force=force,
+        )
 
     async def select_option(
         self,
@@ -730,8 +816,15 @@ class Page(ChannelOwner):
         timeout: float = None,
         noWaitAfter: bool = None,
     ) -> List[str]:
-        params = locals_to_params(locals())
-        return await self._main_frame.select_option(**params)
+        return await self._main_frame.select_option(
+            selector,
+            value=value,
+            index=index,
+            label=label,
+            element=element,
+            timeout=timeout,
+            noWaitAfter=noWaitAfter,
+        )
 
     async def set_input_files(
         self,
@@ -740,7 +833,9 @@ class Page(ChannelOwner):
         timeout: float = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.set_input_files(**locals_to_params(locals()))
+        return await self._main_frame.set_input_files(
+            selector, files, timeout=timeout, noWaitAfter=noWaitAfter
+        )
 
     async def type(
         self,
@@ -750,7 +845,9 @@ class Page(ChannelOwner):
         timeout: float = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.type(**locals_to_params(locals()))
+        return await self._main_frame.type(
+            selector, text, delay=delay, timeout=timeout, noWaitAfter=noWaitAfter
+        )
 
     async def press(
         self,
@@ -760,7 +857,9 @@ class Page(ChannelOwner):
         timeout: float = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.press(**locals_to_params(locals()))
+        return await self._main_frame.press(
+            selector, key, delay=delay, timeout=timeout, noWaitAfter=noWaitAfter
+        )
 
     async def check(
         self,
@@ -769,7 +868,9 @@ class Page(ChannelOwner):
         force: bool = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.check(**locals_to_params(locals()))
+        return await self._main_frame.check(
+            selector, timeout=timeout, force=force, noWaitAfter=noWaitAfter
+        )
 
     async def uncheck(
         self,
@@ -778,7 +879,9 @@ class Page(ChannelOwner):
         force: bool = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.uncheck(**locals_to_params(locals()))
+        return await self._main_frame.uncheck(
+            selector, timeout=timeout, force=force, noWaitAfter=noWaitAfter
+        )
 
     async def wait_for_timeout(self, timeout: float) -> None:
         await self._main_frame.wait_for_timeout(timeout)
@@ -791,13 +894,13 @@ class Page(ChannelOwner):
         timeout: float = None,
         polling: Union[float, Literal["raf"]] = None,
     ) -> JSHandle:
-        if not is_function_body(expression):
-            force_expr = True
-        return await self._main_frame.wait_for_function(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_function(
+            expression, arg=arg, force_expr=force_expr, timeout=timeout, polling=polling
+        )
 
     @property
     def workers(self) -> List["Worker"]:
-        return self._workers.copy()
+        return list(self._workers)
 
     async def pdf(
         self,
@@ -819,10 +922,14 @@ class Page(ChannelOwner):
         if "path" in params:
             del params["path"]
         encoded_binary = await self._channel.send("pdf", params)
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = await self._loop.run_in_executor(
+            None, base64.b64decode, encoded_binary
+        )
+        del encoded_binary
         if path:
-            with open(path, "wb") as fd:
-                fd.write(decoded_binary)
+            await self._loop.run_in_executor(
+                None, Path(path).write_bytes, decoded_binary
+            )
         return decoded_binary
 
     @property
@@ -844,50 +951,42 @@ class Page(ChannelOwner):
         predicate: Callable[[Any], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl:
-        return EventContextManagerImpl(self.wait_for_event(event, predicate, timeout))
+        return EventContextManagerImpl(self.wait_for_event, event, predicate, timeout)
 
     def expect_console_message(
         self,
         predicate: Callable[[ConsoleMessage], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl[ConsoleMessage]:
-        return EventContextManagerImpl(
-            self.wait_for_event("console", predicate, timeout)
-        )
+        return self.expect_event(Page.Events.Console, predicate, timeout)
 
     def expect_dialog(
         self,
         predicate: Callable[[Dialog], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl[Dialog]:
-        return EventContextManagerImpl(
-            self.wait_for_event("dialog", predicate, timeout)
-        )
+        return self.expect_event(Page.Events.Dialog, predicate, timeout)
 
     def expect_download(
         self,
         predicate: Callable[[Download], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl[Download]:
-        return EventContextManagerImpl(
-            self.wait_for_event("download", predicate, timeout)
-        )
+        return self.expect_event(Page.Events.Download, predicate, timeout)
 
     def expect_file_chooser(
         self,
         predicate: Callable[[FileChooser], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl[FileChooser]:
-        return EventContextManagerImpl(
-            self.wait_for_event("filechooser", predicate, timeout)
-        )
+        return self.expect_event(Page.Events.FileChooser, predicate, timeout)
 
     def expect_load_state(
         self,
         state: DocumentLoadState = None,
         timeout: float = None,
     ) -> EventContextManagerImpl[Optional[Response]]:
-        return EventContextManagerImpl(self.wait_for_load_state(state, timeout))
+        return EventContextManagerImpl(self.wait_for_load_state, state, timeout)
 
     def expect_navigation(
         self,
@@ -896,7 +995,7 @@ class Page(ChannelOwner):
         timeout: float = None,
     ) -> EventContextManagerImpl[Optional[Response]]:
         return EventContextManagerImpl(
-            self.wait_for_navigation(url, waitUntil, timeout)
+            self.wait_for_navigation, url, waitUntil, timeout
         )
 
     def expect_popup(
@@ -904,34 +1003,33 @@ class Page(ChannelOwner):
         predicate: Callable[["Page"], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl["Page"]:
-        return EventContextManagerImpl(self.wait_for_event("popup", predicate, timeout))
+        return self.expect_event(Page.Events.Popup, predicate, timeout)
 
     def expect_request(
         self,
         urlOrPredicate: URLMatchRequest,
         timeout: float = None,
     ) -> EventContextManagerImpl[Request]:
-        return EventContextManagerImpl(self.wait_for_request(urlOrPredicate, timeout))
+        return EventContextManagerImpl(self.wait_for_request, urlOrPredicate, timeout)
 
     def expect_response(
         self,
         urlOrPredicate: URLMatchResponse,
         timeout: float = None,
     ) -> EventContextManagerImpl[Response]:
-        return EventContextManagerImpl(self.wait_for_response(urlOrPredicate, timeout))
+        return EventContextManagerImpl(self.wait_for_response, urlOrPredicate, timeout)
 
     def expect_worker(
         self,
         predicate: Callable[["Worker"], bool] = None,
         timeout: float = None,
     ) -> EventContextManagerImpl["Worker"]:
-        return EventContextManagerImpl(
-            self.wait_for_event("worker", predicate, timeout)
-        )
+        return self.expect_event(Page.Events.Worker, predicate, timeout)
 
 
 class Worker(ChannelOwner):
-    Events = SimpleNamespace(Close="close")
+    class Events:
+        Close = "close"
 
     def __init__(
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
@@ -943,7 +1041,7 @@ class Worker(ChannelOwner):
 
     def _on_close(self) -> None:
         if self._page:
-            self._page._workers.remove(self)
+            self._page._workers.pop(self, None)
         if self._context:
             self._context._service_workers.remove(self)
         self.emit(Worker.Events.Close, self)
@@ -952,33 +1050,37 @@ class Worker(ChannelOwner):
     def url(self) -> str:
         return self._initializer["url"]
 
-    async def evaluate(
-        self, expression: str, arg: Serializable = None, force_expr: bool = None
+    async def _evaluate(
+        self,
+        method: str,
+        expression: str,
+        arg: Serializable = None,
+        force_expr: bool = None,
     ) -> Any:
         if not is_function_body(expression):
             force_expr = True
+        return await self._channel.send(
+            method,
+            {
+                "expression": expression,
+                "isFunction": not (force_expr),
+                "arg": serialize_argument(arg),
+            },
+        )
+
+    async def evaluate(
+        self, expression: str, arg: Serializable = None, force_expr: bool = None
+    ) -> Any:
         return parse_result(
-            await self._channel.send(
-                "evaluateExpression",
-                dict(
-                    expression=expression,
-                    isFunction=not (force_expr),
-                    arg=serialize_argument(arg),
-                ),
-            )
+            await self._evaluate("evaluateExpression", expression, arg, force_expr)
         )
 
     async def evaluate_handle(
         self, expression: str, arg: Serializable = None, force_expr: bool = None
     ) -> JSHandle:
         return from_channel(
-            await self._channel.send(
-                "evaluateExpressionHandle",
-                dict(
-                    expression=expression,
-                    isFunction=not (force_expr),
-                    arg=serialize_argument(arg),
-                ),
+            await self._evaluate(
+                "evaluateExpressionHandle", expression, arg, force_expr
             )
         )
 
@@ -992,17 +1094,19 @@ class BindingCall(ChannelOwner):
     async def call(self, func: Callable) -> None:
         try:
             frame = from_channel(self._initializer["frame"])
-            source = dict(context=frame._page.context, page=frame._page, frame=frame)
+            source = {
+                "context": frame._page.context,
+                "page": frame._page,
+                "frame": frame,
+            }
             if self._initializer.get("handle"):
                 result = func(source, from_channel(self._initializer["handle"]))
             else:
-                func_args = list(map(parse_result, self._initializer["args"]))
+                func_args = [parse_result(arg) for arg in self._initializer["args"]]
                 result = func(source, *func_args)
-            if asyncio.isfuture(result):
+            if isinstance(result, _awaitable_types):
                 result = await result
-            await self._channel.send("resolve", dict(result=serialize_argument(result)))
+            await self._channel.send("resolve", {"result": serialize_argument(result)})
         except Exception as e:
-            tb = sys.exc_info()[2]
-            asyncio.create_task(
-                self._channel.send("reject", dict(error=serialize_error(e, tb)))
-            )
+            tb = e.__traceback__
+            self._channel.send_no_reply("reject", {"error": serialize_error(e, tb)})
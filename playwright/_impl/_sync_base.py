@@ -28,6 +28,7 @@ from typing import (
 import greenlet
 
 from playwright._impl._impl_to_api_mapping import ImplToApiMapping, ImplWrapper
+from playwright._impl._logger import debug_enabled, log_api_call
 
 mapping = ImplToApiMapping()
 
@@ -75,6 +76,8 @@ class EventContextManager(Generic[T]):
 
 
 class SyncBase(ImplWrapper):
+    __slots__ = ("_loop", "_dispatcher_fiber")
+
     def __init__(self, impl_obj: Any) -> None:
         super().__init__(impl_obj)
         self._loop = impl_obj._loop
@@ -96,6 +99,16 @@ class SyncBase(ImplWrapper):
         asyncio._set_running_loop(self._loop)
         return future.result()
 
+    def _call(self, api_name: str, impl_method: Callable, **kwargs: Any) -> Any:
+        if not debug_enabled:
+            return impl_method(**kwargs)
+        return log_api_call(api_name, lambda: impl_method(**kwargs))
+
+    def _call_sync(self, api_name: str, impl_method: Callable, **kwargs: Any) -> Any:
+        if not debug_enabled:
+            return self._sync(impl_method(**kwargs))
+        return log_api_call(api_name, lambda: self._sync(impl_method(**kwargs)))
+
     def _wrap_handler(self, handler: Any) -> Callable[..., None]:
         if callable(handler):
             return mapping.wrap_handler(handler)
@@ -18,7 +18,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 
 # Sourced from: https://github.com/pytest-dev/pytest/blob/da01ee0a4bb0af780167ecd228ab3ad249511302/src/_pytest/faulthandler.py#L69-L77
@@ -38,12 +38,17 @@ class Transport:
     def __init__(self, driver_executable: Path) -> None:
         super().__init__()
         self.on_message = lambda _: None
+        self.on_send_error: Callable[[List[int], Exception], None] = lambda *_: None
         self._stopped = False
         self._driver_executable = driver_executable
         self._loop: asyncio.AbstractEventLoop
+        # None when nothing was written in the current loop iteration.
+        self._pending_frames: Optional[List[bytes]] = None
+        self._pending_ids: List[int] = []
 
     def stop(self) -> None:
         self._stopped = True
+        self._flush()
         self._output.close()
 
     async def run(self) -> None:
@@ -93,6 +98,25 @@ class Transport:
         if "DEBUGP" in os.environ:  # pragma: no cover
             print("\x1b[32mSEND>\x1b[0m", json.dumps(message, indent=2))
         data = msg.encode()
-        self._output.write(
-            len(data).to_bytes(4, byteorder="little", signed=False) + data
-        )
+        frame = len(data).to_bytes(4, byteorder="little", signed=False) + data
+        if self._pending_frames is None:
+            # The first message of a loop iteration is written right away, the
+            # rest of the burst is coalesced into one write on the next one.
+            self._output.write(frame)
+            self._pending_frames = []
+            self._loop.call_soon(self._flush)
+            return
+        self._pending_frames.append(frame)
+        self._pending_ids.append(message["id"])
+
+    def _flush(self) -> None:
+        frames = self._pending_frames
+        ids = self._pending_ids
+        self._pending_frames = None
+        self._pending_ids = []
+        if not frames:
+            return
+        try:
+            self._output.write(b"".join(frames))
+        except Exception as e:
+            self.on_send_error(ids, e)
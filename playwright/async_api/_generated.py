@@ -51,7 +51,6 @@ from playwright._impl._input import Keyboard as KeyboardImpl
 from playwright._impl._input import Mouse as MouseImpl
 from playwright._impl._input import Touchscreen as TouchscreenImpl
 from playwright._impl._js_handle import JSHandle as JSHandleImpl
-from playwright._impl._logger import log_api
 from playwright._impl._network import Request as RequestImpl
 from playwright._impl._network import Response as ResponseImpl
 from playwright._impl._network import Route as RouteImpl
@@ -65,8 +64,16 @@ from playwright._impl._video import Video as VideoImpl
 
 NoneType = type(None)
 
+_from_maybe_impl = mapping.from_maybe_impl
+_from_impl = mapping.from_impl
+_from_impl_nullable = mapping.from_impl_nullable
+_from_impl_list = mapping.from_impl_list
+_from_impl_dict = mapping.from_impl_dict
+
 
 class Request(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: RequestImpl):
         super().__init__(obj)
 
@@ -80,7 +87,7 @@ class Request(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def resource_type(self) -> str:
@@ -94,7 +101,7 @@ class Request(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.resource_type)
+        return _from_maybe_impl(self._impl_obj.resource_type)
 
     @property
     def method(self) -> str:
@@ -106,7 +113,7 @@ class Request(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.method)
+        return _from_maybe_impl(self._impl_obj.method)
 
     @property
     def post_data(self) -> typing.Union[str, NoneType]:
@@ -118,7 +125,7 @@ class Request(AsyncBase):
         -------
         Union[str, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data)
+        return _from_maybe_impl(self._impl_obj.post_data)
 
     @property
     def post_data_json(self) -> typing.Union[typing.Dict, NoneType]:
@@ -133,7 +140,7 @@ class Request(AsyncBase):
         -------
         Union[Dict, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data_json)
+        return _from_maybe_impl(self._impl_obj.post_data_json)
 
     @property
     def post_data_buffer(self) -> typing.Union[bytes, NoneType]:
@@ -145,7 +152,7 @@ class Request(AsyncBase):
         -------
         Union[bytes, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data_buffer)
+        return _from_maybe_impl(self._impl_obj.post_data_buffer)
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -157,7 +164,7 @@ class Request(AsyncBase):
         -------
         Dict[str, str]
         """
-        return mapping.from_maybe_impl(self._impl_obj.headers)
+        return _from_maybe_impl(self._impl_obj.headers)
 
     @property
     def frame(self) -> "Frame":
@@ -169,7 +176,7 @@ class Request(AsyncBase):
         -------
         Frame
         """
-        return mapping.from_impl(self._impl_obj.frame)
+        return _from_impl(self._impl_obj.frame)
 
     @property
     def is_navigation_request(self) -> bool:
@@ -181,7 +188,7 @@ class Request(AsyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.is_navigation_request)
+        return _from_maybe_impl(self._impl_obj.is_navigation_request)
 
     @property
     def redirected_from(self) -> typing.Union["Request", NoneType]:
@@ -201,7 +208,7 @@ class Request(AsyncBase):
         -------
         Union[Request, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.redirected_from)
+        return _from_impl_nullable(self._impl_obj.redirected_from)
 
     @property
     def redirected_to(self) -> typing.Union["Request", NoneType]:
@@ -215,7 +222,7 @@ class Request(AsyncBase):
         -------
         Union[Request, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.redirected_to)
+        return _from_impl_nullable(self._impl_obj.redirected_to)
 
     @property
     def failure(self) -> typing.Union[str, NoneType]:
@@ -229,7 +236,7 @@ class Request(AsyncBase):
         -------
         Union[str, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.failure)
+        return _from_maybe_impl(self._impl_obj.failure)
 
     @property
     def timing(self) -> "ResourceTiming":
@@ -243,7 +250,7 @@ class Request(AsyncBase):
         -------
         {startTime: float, domainLookupStart: float, domainLookupEnd: float, connectStart: float, secureConnectionStart: float, connectEnd: float, requestStart: float, responseStart: float, responseEnd: float}
         """
-        return mapping.from_impl(self._impl_obj.timing)
+        return _from_impl(self._impl_obj.timing)
 
     async def response(self) -> typing.Union["Response", NoneType]:
         """Request.response
@@ -254,21 +261,17 @@ class Request(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> request.response started")
-            result = mapping.from_impl_nullable(await self._impl_obj.response())
-            log_api("<= request.response succeded")
-            return result
-        except Exception as e:
-            log_api("<= request.response failed")
-            raise e
+        return _from_impl_nullable(
+            await self._call_async("request.response", self._impl_obj.response)
+        )
 
 
 mapping.register(RequestImpl, Request)
 
 
 class Response(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: ResponseImpl):
         super().__init__(obj)
 
@@ -282,7 +285,7 @@ class Response(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def ok(self) -> bool:
@@ -294,7 +297,7 @@ class Response(AsyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.ok)
+        return _from_maybe_impl(self._impl_obj.ok)
 
     @property
     def status(self) -> int:
@@ -306,7 +309,7 @@ class Response(AsyncBase):
         -------
         int
         """
-        return mapping.from_maybe_impl(self._impl_obj.status)
+        return _from_maybe_impl(self._impl_obj.status)
 
     @property
     def status_text(self) -> str:
@@ -318,7 +321,7 @@ class Response(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.status_text)
+        return _from_maybe_impl(self._impl_obj.status_text)
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -330,7 +333,7 @@ class Response(AsyncBase):
         -------
         Dict[str, str]
         """
-        return mapping.from_maybe_impl(self._impl_obj.headers)
+        return _from_maybe_impl(self._impl_obj.headers)
 
     @property
     def request(self) -> "Request":
@@ -342,7 +345,7 @@ class Response(AsyncBase):
         -------
         Request
         """
-        return mapping.from_impl(self._impl_obj.request)
+        return _from_impl(self._impl_obj.request)
 
     @property
     def frame(self) -> "Frame":
@@ -354,7 +357,7 @@ class Response(AsyncBase):
         -------
         Frame
         """
-        return mapping.from_impl(self._impl_obj.frame)
+        return _from_impl(self._impl_obj.frame)
 
     async def finished(self) -> typing.Union[str, NoneType]:
         """Response.finished
@@ -365,15 +368,9 @@ class Response(AsyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> response.finished started")
-            result = mapping.from_maybe_impl(await self._impl_obj.finished())
-            log_api("<= response.finished succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.finished failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("response.finished", self._impl_obj.finished)
+        )
 
     async def body(self) -> bytes:
         """Response.body
@@ -384,15 +381,9 @@ class Response(AsyncBase):
         -------
         bytes
         """
-
-        try:
-            log_api("=> response.body started")
-            result = mapping.from_maybe_impl(await self._impl_obj.body())
-            log_api("<= response.body succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.body failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("response.body", self._impl_obj.body)
+        )
 
     async def text(self) -> str:
         """Response.text
@@ -403,15 +394,9 @@ class Response(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> response.text started")
-            result = mapping.from_maybe_impl(await self._impl_obj.text())
-            log_api("<= response.text succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.text failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("response.text", self._impl_obj.text)
+        )
 
     async def json(self) -> typing.Union[typing.Dict, typing.List]:
         """Response.json
@@ -424,21 +409,17 @@ class Response(AsyncBase):
         -------
         Union[Dict, List]
         """
-
-        try:
-            log_api("=> response.json started")
-            result = mapping.from_maybe_impl(await self._impl_obj.json())
-            log_api("<= response.json succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.json failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("response.json", self._impl_obj.json)
+        )
 
 
 mapping.register(ResponseImpl, Response)
 
 
 class Route(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: RouteImpl):
         super().__init__(obj)
 
@@ -452,7 +433,7 @@ class Route(AsyncBase):
         -------
         Request
         """
-        return mapping.from_impl(self._impl_obj.request)
+        return _from_impl(self._impl_obj.request)
 
     async def abort(self, error_code: str = None) -> NoneType:
         """Route.abort
@@ -480,17 +461,11 @@ class Route(AsyncBase):
             - `'timedout'` - An operation timed out.
             - `'failed'` - A generic failure occurred.
         """
-
-        try:
-            log_api("=> route.abort started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.abort(errorCode=error_code)
+        return _from_maybe_impl(
+            await self._call_async(
+                "route.abort", self._impl_obj.abort, errorCode=error_code
             )
-            log_api("<= route.abort succeded")
-            return result
-        except Exception as e:
-            log_api("<= route.abort failed")
-            raise e
+        )
 
     async def fulfill(
         self,
@@ -522,23 +497,17 @@ class Route(AsyncBase):
         content_type : Union[str, NoneType]
             If set, equals to setting `Content-Type` response header.
         """
-
-        try:
-            log_api("=> route.fulfill started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.fulfill(
-                    status=status,
-                    headers=mapping.to_impl(headers),
-                    body=body,
-                    path=path,
-                    contentType=content_type,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "route.fulfill",
+                self._impl_obj.fulfill,
+                status=status,
+                headers=mapping.to_impl(headers),
+                body=body,
+                path=path,
+                contentType=content_type,
             )
-            log_api("<= route.fulfill succeded")
-            return result
-        except Exception as e:
-            log_api("<= route.fulfill failed")
-            raise e
+        )
 
     async def continue_(
         self,
@@ -562,28 +531,24 @@ class Route(AsyncBase):
         post_data : Union[bytes, str, NoneType]
             If set changes the post data of request
         """
-
-        try:
-            log_api("=> route.continue_ started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.continue_(
-                    url=url,
-                    method=method,
-                    headers=mapping.to_impl(headers),
-                    postData=post_data,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "route.continue_",
+                self._impl_obj.continue_,
+                url=url,
+                method=method,
+                headers=mapping.to_impl(headers),
+                postData=post_data,
             )
-            log_api("<= route.continue_ succeded")
-            return result
-        except Exception as e:
-            log_api("<= route.continue_ failed")
-            raise e
+        )
 
 
 mapping.register(RouteImpl, Route)
 
 
 class WebSocket(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: WebSocketImpl):
         super().__init__(obj)
 
@@ -597,7 +562,7 @@ class WebSocket(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     async def wait_for_event(
         self,
@@ -626,21 +591,15 @@ class WebSocket(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> web_socket.wait_for_event started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_event(
-                    event=event,
-                    predicate=self._wrap_handler(predicate),
-                    timeout=timeout,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "web_socket.wait_for_event",
+                self._impl_obj.wait_for_event,
+                event=event,
+                predicate=self._wrap_handler(predicate),
+                timeout=timeout,
             )
-            log_api("<= web_socket.wait_for_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= web_socket.wait_for_event failed")
-            raise e
+        )
 
     def expect_event(
         self,
@@ -680,21 +639,17 @@ class WebSocket(AsyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> web_socket.is_closed started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_closed())
-            log_api("<= web_socket.is_closed succeded")
-            return result
-        except Exception as e:
-            log_api("<= web_socket.is_closed failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("web_socket.is_closed", self._impl_obj.is_closed)
+        )
 
 
 mapping.register(WebSocketImpl, WebSocket)
 
 
 class Keyboard(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: KeyboardImpl):
         super().__init__(obj)
 
@@ -731,15 +686,9 @@ class Keyboard(AsyncBase):
         key : str
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
-
-        try:
-            log_api("=> keyboard.down started")
-            result = mapping.from_maybe_impl(await self._impl_obj.down(key=key))
-            log_api("<= keyboard.down succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.down failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("keyboard.down", self._impl_obj.down, key=key)
+        )
 
     async def up(self, key: str) -> NoneType:
         """Keyboard.up
@@ -751,15 +700,9 @@ class Keyboard(AsyncBase):
         key : str
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
-
-        try:
-            log_api("=> keyboard.up started")
-            result = mapping.from_maybe_impl(await self._impl_obj.up(key=key))
-            log_api("<= keyboard.up succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.up failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("keyboard.up", self._impl_obj.up, key=key)
+        )
 
     async def insert_text(self, text: str) -> NoneType:
         """Keyboard.insert_text
@@ -773,17 +716,11 @@ class Keyboard(AsyncBase):
         text : str
             Sets input to the specified text value.
         """
-
-        try:
-            log_api("=> keyboard.insert_text started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.insert_text(text=text)
+        return _from_maybe_impl(
+            await self._call_async(
+                "keyboard.insert_text", self._impl_obj.insert_text, text=text
             )
-            log_api("<= keyboard.insert_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.insert_text failed")
-            raise e
+        )
 
     async def type(self, text: str, delay: float = None) -> NoneType:
         """Keyboard.type
@@ -801,17 +738,11 @@ class Keyboard(AsyncBase):
         delay : Union[float, NoneType]
             Time to wait between key presses in milliseconds. Defaults to 0.
         """
-
-        try:
-            log_api("=> keyboard.type started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.type(text=text, delay=delay)
+        return _from_maybe_impl(
+            await self._call_async(
+                "keyboard.type", self._impl_obj.type, text=text, delay=delay
             )
-            log_api("<= keyboard.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.type failed")
-            raise e
+        )
 
     async def press(self, key: str, delay: float = None) -> NoneType:
         """Keyboard.press
@@ -842,23 +773,19 @@ class Keyboard(AsyncBase):
         delay : Union[float, NoneType]
             Time to wait between `keydown` and `keyup` in milliseconds. Defaults to 0.
         """
-
-        try:
-            log_api("=> keyboard.press started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.press(key=key, delay=delay)
+        return _from_maybe_impl(
+            await self._call_async(
+                "keyboard.press", self._impl_obj.press, key=key, delay=delay
             )
-            log_api("<= keyboard.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.press failed")
-            raise e
+        )
 
 
 mapping.register(KeyboardImpl, Keyboard)
 
 
 class Mouse(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: MouseImpl):
         super().__init__(obj)
 
@@ -874,17 +801,11 @@ class Mouse(AsyncBase):
         steps : Union[int, NoneType]
             defaults to 1. Sends intermediate `mousemove` events.
         """
-
-        try:
-            log_api("=> mouse.move started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.move(x=x, y=y, steps=steps)
+        return _from_maybe_impl(
+            await self._call_async(
+                "mouse.move", self._impl_obj.move, x=x, y=y, steps=steps
             )
-            log_api("<= mouse.move succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.move failed")
-            raise e
+        )
 
     async def down(
         self, button: Literal["left", "middle", "right"] = None, click_count: int = None
@@ -900,17 +821,11 @@ class Mouse(AsyncBase):
         click_count : Union[int, NoneType]
             defaults to 1. See [UIEvent.detail].
         """
-
-        try:
-            log_api("=> mouse.down started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.down(button=button, clickCount=click_count)
+        return _from_maybe_impl(
+            await self._call_async(
+                "mouse.down", self._impl_obj.down, button=button, clickCount=click_count
             )
-            log_api("<= mouse.down succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.down failed")
-            raise e
+        )
 
     async def up(
         self, button: Literal["left", "middle", "right"] = None, click_count: int = None
@@ -926,17 +841,11 @@ class Mouse(AsyncBase):
         click_count : Union[int, NoneType]
             defaults to 1. See [UIEvent.detail].
         """
-
-        try:
-            log_api("=> mouse.up started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.up(button=button, clickCount=click_count)
+        return _from_maybe_impl(
+            await self._call_async(
+                "mouse.up", self._impl_obj.up, button=button, clickCount=click_count
             )
-            log_api("<= mouse.up succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.up failed")
-            raise e
+        )
 
     async def click(
         self,
@@ -961,19 +870,17 @@ class Mouse(AsyncBase):
         click_count : Union[int, NoneType]
             defaults to 1. See [UIEvent.detail].
         """
-
-        try:
-            log_api("=> mouse.click started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.click(
-                    x=x, y=y, delay=delay, button=button, clickCount=click_count
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "mouse.click",
+                self._impl_obj.click,
+                x=x,
+                y=y,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
             )
-            log_api("<= mouse.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.click failed")
-            raise e
+        )
 
     async def dblclick(
         self,
@@ -996,23 +903,24 @@ class Mouse(AsyncBase):
         button : Union["left", "middle", "right", NoneType]
             Defaults to `left`.
         """
-
-        try:
-            log_api("=> mouse.dblclick started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.dblclick(x=x, y=y, delay=delay, button=button)
+        return _from_maybe_impl(
+            await self._call_async(
+                "mouse.dblclick",
+                self._impl_obj.dblclick,
+                x=x,
+                y=y,
+                delay=delay,
+                button=button,
             )
-            log_api("<= mouse.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.dblclick failed")
-            raise e
+        )
 
 
 mapping.register(MouseImpl, Mouse)
 
 
 class Touchscreen(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: TouchscreenImpl):
         super().__init__(obj)
 
@@ -1026,21 +934,17 @@ class Touchscreen(AsyncBase):
         x : float
         y : float
         """
-
-        try:
-            log_api("=> touchscreen.tap started")
-            result = mapping.from_maybe_impl(await self._impl_obj.tap(x=x, y=y))
-            log_api("<= touchscreen.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= touchscreen.tap failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("touchscreen.tap", self._impl_obj.tap, x=x, y=y)
+        )
 
 
 mapping.register(TouchscreenImpl, Touchscreen)
 
 
 class JSHandle(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: JSHandleImpl):
         super().__init__(obj)
 
@@ -1071,21 +975,15 @@ class JSHandle(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> js_handle.evaluate started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.evaluate(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "js_handle.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= js_handle.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.evaluate failed")
-            raise e
+        )
 
     async def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -1117,21 +1015,15 @@ class JSHandle(AsyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> js_handle.evaluate_handle started")
-            result = mapping.from_impl(
-                await self._impl_obj.evaluate_handle(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_impl(
+            await self._call_async(
+                "js_handle.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= js_handle.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.evaluate_handle failed")
-            raise e
+        )
 
     async def get_property(self, property_name: str) -> "JSHandle":
         """JSHandle.get_property
@@ -1147,17 +1039,13 @@ class JSHandle(AsyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> js_handle.get_property started")
-            result = mapping.from_impl(
-                await self._impl_obj.get_property(propertyName=property_name)
+        return _from_impl(
+            await self._call_async(
+                "js_handle.get_property",
+                self._impl_obj.get_property,
+                propertyName=property_name,
             )
-            log_api("<= js_handle.get_property succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.get_property failed")
-            raise e
+        )
 
     async def get_properties(self) -> typing.Dict[str, "JSHandle"]:
         """JSHandle.get_properties
@@ -1168,15 +1056,11 @@ class JSHandle(AsyncBase):
         -------
         Dict[str, JSHandle]
         """
-
-        try:
-            log_api("=> js_handle.get_properties started")
-            result = mapping.from_impl_dict(await self._impl_obj.get_properties())
-            log_api("<= js_handle.get_properties succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.get_properties failed")
-            raise e
+        return _from_impl_dict(
+            await self._call_async(
+                "js_handle.get_properties", self._impl_obj.get_properties
+            )
+        )
 
     def as_element(self) -> typing.Union["ElementHandle", NoneType]:
         """JSHandle.as_element
@@ -1187,30 +1071,18 @@ class JSHandle(AsyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> js_handle.as_element started")
-            result = mapping.from_impl_nullable(self._impl_obj.as_element())
-            log_api("<= js_handle.as_element succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.as_element failed")
-            raise e
+        return _from_impl_nullable(
+            self._call("js_handle.as_element", self._impl_obj.as_element)
+        )
 
     async def dispose(self) -> NoneType:
         """JSHandle.dispose
 
         The `jsHandle.dispose` method stops referencing the element handle.
         """
-
-        try:
-            log_api("=> js_handle.dispose started")
-            result = mapping.from_maybe_impl(await self._impl_obj.dispose())
-            log_api("<= js_handle.dispose succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.dispose failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("js_handle.dispose", self._impl_obj.dispose)
+        )
 
     async def json_value(self) -> typing.Any:
         """JSHandle.json_value
@@ -1224,21 +1096,17 @@ class JSHandle(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> js_handle.json_value started")
-            result = mapping.from_maybe_impl(await self._impl_obj.json_value())
-            log_api("<= js_handle.json_value succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.json_value failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("js_handle.json_value", self._impl_obj.json_value)
+        )
 
 
 mapping.register(JSHandleImpl, JSHandle)
 
 
 class ElementHandle(JSHandle):
+    __slots__ = ()
+
     def __init__(self, obj: ElementHandleImpl):
         super().__init__(obj)
 
@@ -1251,15 +1119,9 @@ class ElementHandle(JSHandle):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.as_element started")
-            result = mapping.from_impl_nullable(self._impl_obj.as_element())
-            log_api("<= element_handle.as_element succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.as_element failed")
-            raise e
+        return _from_impl_nullable(
+            self._call("element_handle.as_element", self._impl_obj.as_element)
+        )
 
     async def owner_frame(self) -> typing.Union["Frame", NoneType]:
         """ElementHandle.owner_frame
@@ -1270,15 +1132,11 @@ class ElementHandle(JSHandle):
         -------
         Union[Frame, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.owner_frame started")
-            result = mapping.from_impl_nullable(await self._impl_obj.owner_frame())
-            log_api("<= element_handle.owner_frame succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.owner_frame failed")
-            raise e
+        return _from_impl_nullable(
+            await self._call_async(
+                "element_handle.owner_frame", self._impl_obj.owner_frame
+            )
+        )
 
     async def content_frame(self) -> typing.Union["Frame", NoneType]:
         """ElementHandle.content_frame
@@ -1289,15 +1147,11 @@ class ElementHandle(JSHandle):
         -------
         Union[Frame, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.content_frame started")
-            result = mapping.from_impl_nullable(await self._impl_obj.content_frame())
-            log_api("<= element_handle.content_frame succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.content_frame failed")
-            raise e
+        return _from_impl_nullable(
+            await self._call_async(
+                "element_handle.content_frame", self._impl_obj.content_frame
+            )
+        )
 
     async def get_attribute(self, name: str) -> typing.Union[str, NoneType]:
         """ElementHandle.get_attribute
@@ -1313,17 +1167,11 @@ class ElementHandle(JSHandle):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.get_attribute started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.get_attribute(name=name)
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.get_attribute", self._impl_obj.get_attribute, name=name
             )
-            log_api("<= element_handle.get_attribute succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.get_attribute failed")
-            raise e
+        )
 
     async def text_content(self) -> typing.Union[str, NoneType]:
         """ElementHandle.text_content
@@ -1334,15 +1182,11 @@ class ElementHandle(JSHandle):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.text_content started")
-            result = mapping.from_maybe_impl(await self._impl_obj.text_content())
-            log_api("<= element_handle.text_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.text_content failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.text_content", self._impl_obj.text_content
+            )
+        )
 
     async def inner_text(self) -> str:
         """ElementHandle.inner_text
@@ -1353,15 +1197,11 @@ class ElementHandle(JSHandle):
         -------
         str
         """
-
-        try:
-            log_api("=> element_handle.inner_text started")
-            result = mapping.from_maybe_impl(await self._impl_obj.inner_text())
-            log_api("<= element_handle.inner_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.inner_text failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.inner_text", self._impl_obj.inner_text
+            )
+        )
 
     async def inner_html(self) -> str:
         """ElementHandle.inner_html
@@ -1372,15 +1212,11 @@ class ElementHandle(JSHandle):
         -------
         str
         """
-
-        try:
-            log_api("=> element_handle.inner_html started")
-            result = mapping.from_maybe_impl(await self._impl_obj.inner_html())
-            log_api("<= element_handle.inner_html succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.inner_html failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.inner_html", self._impl_obj.inner_html
+            )
+        )
 
     async def dispatch_event(
         self, type: str, event_init: typing.Dict = None
@@ -1412,19 +1248,14 @@ class ElementHandle(JSHandle):
         event_init : Union[Dict, NoneType]
             Optional event-specific initialization properties.
         """
-
-        try:
-            log_api("=> element_handle.dispatch_event started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.dispatch_event(
-                    type=type, eventInit=mapping.to_impl(event_init)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.dispatch_event",
+                self._impl_obj.dispatch_event,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
             )
-            log_api("<= element_handle.dispatch_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.dispatch_event failed")
-            raise e
+        )
 
     async def scroll_into_view_if_needed(self, timeout: float = None) -> NoneType:
         """ElementHandle.scroll_into_view_if_needed
@@ -1442,17 +1273,13 @@ class ElementHandle(JSHandle):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> element_handle.scroll_into_view_if_needed started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.scroll_into_view_if_needed(timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.scroll_into_view_if_needed",
+                self._impl_obj.scroll_into_view_if_needed,
+                timeout=timeout,
             )
-            log_api("<= element_handle.scroll_into_view_if_needed succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.scroll_into_view_if_needed failed")
-            raise e
+        )
 
     async def hover(
         self,
@@ -1490,19 +1317,16 @@ class ElementHandle(JSHandle):
         force : Union[bool, NoneType]
             Whether to bypass the [actionability](./actionability.md) checks. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.hover started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.hover(
-                    modifiers=modifiers, position=position, timeout=timeout, force=force
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.hover",
+                self._impl_obj.hover,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
             )
-            log_api("<= element_handle.hover succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.hover failed")
-            raise e
+        )
 
     async def click(
         self,
@@ -1554,26 +1378,20 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.click started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.click(
-                    modifiers=modifiers,
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    clickCount=click_count,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= element_handle.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.click failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.click",
+                self._impl_obj.click,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def dblclick(
         self,
@@ -1625,25 +1443,19 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.dblclick started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.dblclick(
-                    modifiers=modifiers,
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= element_handle.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.dblclick failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.dblclick",
+                self._impl_obj.dblclick,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def select_option(
         self,
@@ -1675,24 +1487,18 @@ class ElementHandle(JSHandle):
         -------
         List[str]
         """
-
-        try:
-            log_api("=> element_handle.select_option started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.select_option(
-                    value=value,
-                    index=index,
-                    label=label,
-                    element=mapping.to_impl(element),
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= element_handle.select_option succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.select_option failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.select_option",
+                self._impl_obj.select_option,
+                value=value,
+                index=index,
+                label=label,
+                element=mapping.to_impl(element),
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def tap(
         self,
@@ -1737,23 +1543,17 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.tap started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.tap(
-                    modifiers=modifiers,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.tap",
+                self._impl_obj.tap,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.tap failed")
-            raise e
+        )
 
     async def fill(
         self, value: str, timeout: float = None, no_wait_after: bool = None
@@ -1776,19 +1576,15 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.fill started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.fill(
-                    value=value, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.fill",
+                self._impl_obj.fill,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.fill succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.fill failed")
-            raise e
+        )
 
     async def select_text(self, timeout: float = None) -> NoneType:
         """ElementHandle.select_text
@@ -1802,17 +1598,13 @@ class ElementHandle(JSHandle):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> element_handle.select_text started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.select_text(timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.select_text",
+                self._impl_obj.select_text,
+                timeout=timeout,
             )
-            log_api("<= element_handle.select_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.select_text failed")
-            raise e
+        )
 
     async def set_input_files(
         self,
@@ -1846,34 +1638,24 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.set_input_files started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_input_files(
-                    files=files, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.set_input_files",
+                self._impl_obj.set_input_files,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.set_input_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.set_input_files failed")
-            raise e
+        )
 
     async def focus(self) -> NoneType:
         """ElementHandle.focus
 
         Calls [focus](https://developer.mozilla.org/en-US/docs/Web/API/HTMLElement/focus) on the element.
         """
-
-        try:
-            log_api("=> element_handle.focus started")
-            result = mapping.from_maybe_impl(await self._impl_obj.focus())
-            log_api("<= element_handle.focus succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.focus failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("element_handle.focus", self._impl_obj.focus)
+        )
 
     async def type(
         self,
@@ -1904,19 +1686,16 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.type started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.type(
-                    text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.type",
+                self._impl_obj.type,
+                text=text,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.type failed")
-            raise e
+        )
 
     async def press(
         self,
@@ -1960,19 +1739,16 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.press started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.press(
-                    key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.press",
+                self._impl_obj.press,
+                key=key,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.press failed")
-            raise e
+        )
 
     async def check(
         self, timeout: float = None, force: bool = None, no_wait_after: bool = None
@@ -2005,19 +1781,15 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.check started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.check(
-                    timeout=timeout, force=force, noWaitAfter=no_wait_after
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.check",
+                self._impl_obj.check,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.check succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.check failed")
-            raise e
+        )
 
     async def uncheck(
         self, timeout: float = None, force: bool = None, no_wait_after: bool = None
@@ -2050,19 +1822,15 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.uncheck started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.uncheck(
-                    timeout=timeout, force=force, noWaitAfter=no_wait_after
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.uncheck",
+                self._impl_obj.uncheck,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.uncheck succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.uncheck failed")
-            raise e
+        )
 
     async def bounding_box(self) -> typing.Union["FloatRect", NoneType]:
         """ElementHandle.bounding_box
@@ -2084,15 +1852,11 @@ class ElementHandle(JSHandle):
         -------
         Union[{x: float, y: float, width: float, height: float}, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.bounding_box started")
-            result = mapping.from_impl_nullable(await self._impl_obj.bounding_box())
-            log_api("<= element_handle.bounding_box succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.bounding_box failed")
-            raise e
+        return _from_impl_nullable(
+            await self._call_async(
+                "element_handle.bounding_box", self._impl_obj.bounding_box
+            )
+        )
 
     async def screenshot(
         self,
@@ -2130,23 +1894,17 @@ class ElementHandle(JSHandle):
         -------
         bytes
         """
-
-        try:
-            log_api("=> element_handle.screenshot started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.screenshot(
-                    timeout=timeout,
-                    type=type,
-                    path=path,
-                    quality=quality,
-                    omitBackground=omit_background,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.screenshot",
+                self._impl_obj.screenshot,
+                timeout=timeout,
+                type=type,
+                path=path,
+                quality=quality,
+                omitBackground=omit_background,
             )
-            log_api("<= element_handle.screenshot succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.screenshot failed")
-            raise e
+        )
 
     async def query_selector(
         self, selector: str
@@ -2166,17 +1924,13 @@ class ElementHandle(JSHandle):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.query_selector started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.query_selector(selector=selector)
+        return _from_impl_nullable(
+            await self._call_async(
+                "element_handle.query_selector",
+                self._impl_obj.query_selector,
+                selector=selector,
             )
-            log_api("<= element_handle.query_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.query_selector failed")
-            raise e
+        )
 
     async def query_selector_all(self, selector: str) -> typing.List["ElementHandle"]:
         """ElementHandle.query_selector_all
@@ -2194,17 +1948,13 @@ class ElementHandle(JSHandle):
         -------
         List[ElementHandle]
         """
-
-        try:
-            log_api("=> element_handle.query_selector_all started")
-            result = mapping.from_impl_list(
-                await self._impl_obj.query_selector_all(selector=selector)
+        return _from_impl_list(
+            await self._call_async(
+                "element_handle.query_selector_all",
+                self._impl_obj.query_selector_all,
+                selector=selector,
             )
-            log_api("<= element_handle.query_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.query_selector_all failed")
-            raise e
+        )
 
     async def eval_on_selector(
         self,
@@ -2240,22 +1990,16 @@ class ElementHandle(JSHandle):
         -------
         Any
         """
-
-        try:
-            log_api("=> element_handle.eval_on_selector started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.eval_on_selector(
-                    selector=selector,
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.eval_on_selector",
+                self._impl_obj.eval_on_selector,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= element_handle.eval_on_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.eval_on_selector failed")
-            raise e
+        )
 
     async def eval_on_selector_all(
         self,
@@ -2298,22 +2042,16 @@ class ElementHandle(JSHandle):
         -------
         Any
         """
-
-        try:
-            log_api("=> element_handle.eval_on_selector_all started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.eval_on_selector_all(
-                    selector=selector,
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.eval_on_selector_all",
+                self._impl_obj.eval_on_selector_all,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= element_handle.eval_on_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.eval_on_selector_all failed")
-            raise e
+        )
 
     async def wait_for_element_state(
         self,
@@ -2344,19 +2082,14 @@ class ElementHandle(JSHandle):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> element_handle.wait_for_element_state started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_element_state(
-                    state=state, timeout=timeout
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "element_handle.wait_for_element_state",
+                self._impl_obj.wait_for_element_state,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= element_handle.wait_for_element_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.wait_for_element_state failed")
-            raise e
+        )
 
     async def wait_for_selector(
         self,
@@ -2396,25 +2129,23 @@ class ElementHandle(JSHandle):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.wait_for_selector started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.wait_for_selector(
-                    selector=selector, state=state, timeout=timeout
-                )
+        return _from_impl_nullable(
+            await self._call_async(
+                "element_handle.wait_for_selector",
+                self._impl_obj.wait_for_selector,
+                selector=selector,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= element_handle.wait_for_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.wait_for_selector failed")
-            raise e
+        )
 
 
 mapping.register(ElementHandleImpl, ElementHandle)
 
 
 class Accessibility(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: AccessibilityImpl):
         super().__init__(obj)
 
@@ -2444,25 +2175,22 @@ class Accessibility(AsyncBase):
         -------
         Union[Dict, NoneType]
         """
-
-        try:
-            log_api("=> accessibility.snapshot started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.snapshot(
-                    interestingOnly=interesting_only, root=mapping.to_impl(root)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "accessibility.snapshot",
+                self._impl_obj.snapshot,
+                interestingOnly=interesting_only,
+                root=mapping.to_impl(root),
             )
-            log_api("<= accessibility.snapshot succeded")
-            return result
-        except Exception as e:
-            log_api("<= accessibility.snapshot failed")
-            raise e
+        )
 
 
 mapping.register(AccessibilityImpl, Accessibility)
 
 
 class FileChooser(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: FileChooserImpl):
         super().__init__(obj)
 
@@ -2476,7 +2204,7 @@ class FileChooser(AsyncBase):
         -------
         Page
         """
-        return mapping.from_impl(self._impl_obj.page)
+        return _from_impl(self._impl_obj.page)
 
     @property
     def element(self) -> "ElementHandle":
@@ -2488,7 +2216,7 @@ class FileChooser(AsyncBase):
         -------
         ElementHandle
         """
-        return mapping.from_impl(self._impl_obj.element)
+        return _from_impl(self._impl_obj.element)
 
     @property
     def is_multiple(self) -> bool:
@@ -2500,7 +2228,7 @@ class FileChooser(AsyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.is_multiple)
+        return _from_maybe_impl(self._impl_obj.is_multiple)
 
     async def set_files(
         self,
@@ -2526,25 +2254,23 @@ class FileChooser(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> file_chooser.set_files started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_files(
-                    files=files, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "file_chooser.set_files",
+                self._impl_obj.set_files,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= file_chooser.set_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= file_chooser.set_files failed")
-            raise e
+        )
 
 
 mapping.register(FileChooserImpl, FileChooser)
 
 
 class Frame(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: FrameImpl):
         super().__init__(obj)
 
@@ -2558,7 +2284,7 @@ class Frame(AsyncBase):
         -------
         Page
         """
-        return mapping.from_impl(self._impl_obj.page)
+        return _from_impl(self._impl_obj.page)
 
     @property
     def name(self) -> str:
@@ -2575,7 +2301,7 @@ class Frame(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return _from_maybe_impl(self._impl_obj.name)
 
     @property
     def url(self) -> str:
@@ -2587,7 +2313,7 @@ class Frame(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def parent_frame(self) -> typing.Union["Frame", NoneType]:
@@ -2599,7 +2325,7 @@ class Frame(AsyncBase):
         -------
         Union[Frame, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.parent_frame)
+        return _from_impl_nullable(self._impl_obj.parent_frame)
 
     @property
     def child_frames(self) -> typing.List["Frame"]:
@@ -2609,7 +2335,7 @@ class Frame(AsyncBase):
         -------
         List[Frame]
         """
-        return mapping.from_impl_list(self._impl_obj.child_frames)
+        return _from_impl_list(self._impl_obj.child_frames)
 
     async def goto(
         self,
@@ -2661,19 +2387,16 @@ class Frame(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> frame.goto started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.goto(
-                    url=url, timeout=timeout, waitUntil=wait_until, referer=referer
-                )
+        return _from_impl_nullable(
+            await self._call_async(
+                "frame.goto",
+                self._impl_obj.goto,
+                url=url,
+                timeout=timeout,
+                waitUntil=wait_until,
+                referer=referer,
             )
-            log_api("<= frame.goto succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.goto failed")
-            raise e
+        )
 
     async def wait_for_navigation(
         self,
@@ -2712,19 +2435,15 @@ class Frame(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> frame.wait_for_navigation started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.wait_for_navigation(
-                    url=self._wrap_handler(url), waitUntil=wait_until, timeout=timeout
-                )
+        return _from_impl_nullable(
+            await self._call_async(
+                "frame.wait_for_navigation",
+                self._impl_obj.wait_for_navigation,
+                url=self._wrap_handler(url),
+                waitUntil=wait_until,
+                timeout=timeout,
             )
-            log_api("<= frame.wait_for_navigation succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_navigation failed")
-            raise e
+        )
 
     async def wait_for_load_state(
         self,
@@ -2752,17 +2471,14 @@ class Frame(AsyncBase):
             `browser_context.set_default_timeout()`, `page.set_default_navigation_timeout()` or
             `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> frame.wait_for_load_state started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.wait_for_load_state",
+                self._impl_obj.wait_for_load_state,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= frame.wait_for_load_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_load_state failed")
-            raise e
+        )
 
     async def frame_element(self) -> "ElementHandle":
         """Frame.frame_element
@@ -2778,15 +2494,9 @@ class Frame(AsyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> frame.frame_element started")
-            result = mapping.from_impl(await self._impl_obj.frame_element())
-            log_api("<= frame.frame_element succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.frame_element failed")
-            raise e
+        return _from_impl(
+            await self._call_async("frame.frame_element", self._impl_obj.frame_element)
+        )
 
     async def evaluate(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -2819,21 +2529,15 @@ class Frame(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> frame.evaluate started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.evaluate(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= frame.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.evaluate failed")
-            raise e
+        )
 
     async def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -2865,21 +2569,15 @@ class Frame(AsyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> frame.evaluate_handle started")
-            result = mapping.from_impl(
-                await self._impl_obj.evaluate_handle(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_impl(
+            await self._call_async(
+                "frame.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= frame.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.evaluate_handle failed")
-            raise e
+        )
 
     async def query_selector(
         self, selector: str
@@ -2901,17 +2599,11 @@ class Frame(AsyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> frame.query_selector started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.query_selector(selector=selector)
+        return _from_impl_nullable(
+            await self._call_async(
+                "frame.query_selector", self._impl_obj.query_selector, selector=selector
             )
-            log_api("<= frame.query_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.query_selector failed")
-            raise e
+        )
 
     async def query_selector_all(self, selector: str) -> typing.List["ElementHandle"]:
         """Frame.query_selector_all
@@ -2931,17 +2623,13 @@ class Frame(AsyncBase):
         -------
         List[ElementHandle]
         """
-
-        try:
-            log_api("=> frame.query_selector_all started")
-            result = mapping.from_impl_list(
-                await self._impl_obj.query_selector_all(selector=selector)
+        return _from_impl_list(
+            await self._call_async(
+                "frame.query_selector_all",
+                self._impl_obj.query_selector_all,
+                selector=selector,
             )
-            log_api("<= frame.query_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.query_selector_all failed")
-            raise e
+        )
 
     async def wait_for_selector(
         self,
@@ -2980,19 +2668,15 @@ class Frame(AsyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> frame.wait_for_selector started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.wait_for_selector(
-                    selector=selector, timeout=timeout, state=state
-                )
+        return _from_impl_nullable(
+            await self._call_async(
+                "frame.wait_for_selector",
+                self._impl_obj.wait_for_selector,
+                selector=selector,
+                timeout=timeout,
+                state=state,
             )
-            log_api("<= frame.wait_for_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_selector failed")
-            raise e
+        )
 
     async def dispatch_event(
         self,
@@ -3034,22 +2718,16 @@ class Frame(AsyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> frame.dispatch_event started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.dispatch_event(
-                    selector=selector,
-                    type=type,
-                    eventInit=mapping.to_impl(event_init),
-                    timeout=timeout,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.dispatch_event",
+                self._impl_obj.dispatch_event,
+                selector=selector,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
+                timeout=timeout,
             )
-            log_api("<= frame.dispatch_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.dispatch_event failed")
-            raise e
+        )
 
     async def eval_on_selector(
         self,
@@ -3085,22 +2763,16 @@ class Frame(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> frame.eval_on_selector started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.eval_on_selector(
-                    selector=selector,
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.eval_on_selector",
+                self._impl_obj.eval_on_selector,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= frame.eval_on_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.eval_on_selector failed")
-            raise e
+        )
 
     async def eval_on_selector_all(
         self,
@@ -3136,22 +2808,16 @@ class Frame(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> frame.eval_on_selector_all started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.eval_on_selector_all(
-                    selector=selector,
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.eval_on_selector_all",
+                self._impl_obj.eval_on_selector_all,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= frame.eval_on_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.eval_on_selector_all failed")
-            raise e
+        )
 
     async def content(self) -> str:
         """Frame.content
@@ -3162,15 +2828,9 @@ class Frame(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.content started")
-            result = mapping.from_maybe_impl(await self._impl_obj.content())
-            log_api("<= frame.content succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.content failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("frame.content", self._impl_obj.content)
+        )
 
     async def set_content(
         self,
@@ -3195,19 +2855,15 @@ class Frame(AsyncBase):
             - `'load'` - consider operation to be finished when the `load` event is fired.
             - `'networkidle'` - consider operation to be finished when there are no network connections for at least `500` ms.
         """
-
-        try:
-            log_api("=> frame.set_content started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_content(
-                    html=html, timeout=timeout, waitUntil=wait_until
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.set_content",
+                self._impl_obj.set_content,
+                html=html,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= frame.set_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.set_content failed")
-            raise e
+        )
 
     def is_detached(self) -> bool:
         """Frame.is_detached
@@ -3218,15 +2874,9 @@ class Frame(AsyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> frame.is_detached started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_detached())
-            log_api("<= frame.is_detached succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.is_detached failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("frame.is_detached", self._impl_obj.is_detached)
+        )
 
     async def add_script_tag(
         self,
@@ -3258,19 +2908,16 @@ class Frame(AsyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> frame.add_script_tag started")
-            result = mapping.from_impl(
-                await self._impl_obj.add_script_tag(
-                    url=url, path=path, content=content, type=type
-                )
+        return _from_impl(
+            await self._call_async(
+                "frame.add_script_tag",
+                self._impl_obj.add_script_tag,
+                url=url,
+                path=path,
+                content=content,
+                type=type,
             )
-            log_api("<= frame.add_script_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.add_script_tag failed")
-            raise e
+        )
 
     async def add_style_tag(
         self,
@@ -3299,17 +2946,15 @@ class Frame(AsyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> frame.add_style_tag started")
-            result = mapping.from_impl(
-                await self._impl_obj.add_style_tag(url=url, path=path, content=content)
+        return _from_impl(
+            await self._call_async(
+                "frame.add_style_tag",
+                self._impl_obj.add_style_tag,
+                url=url,
+                path=path,
+                content=content,
             )
-            log_api("<= frame.add_style_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.add_style_tag failed")
-            raise e
+        )
 
     async def click(
         self,
@@ -3365,27 +3010,21 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.click started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.click(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    clickCount=click_count,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= frame.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.click failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.click",
+                self._impl_obj.click,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def dblclick(
         self,
@@ -3441,26 +3080,20 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.dblclick started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.dblclick(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= frame.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.dblclick failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.dblclick",
+                self._impl_obj.dblclick,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def tap(
         self,
@@ -3509,24 +3142,18 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.tap started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.tap(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= frame.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.tap failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.tap",
+                self._impl_obj.tap,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def fill(
         self,
@@ -3559,22 +3186,16 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.fill started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.fill(
-                    selector=selector,
-                    value=value,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.fill",
+                self._impl_obj.fill,
+                selector=selector,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= frame.fill succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.fill failed")
-            raise e
+        )
 
     async def focus(self, selector: str, timeout: float = None) -> NoneType:
         """Frame.focus
@@ -3591,17 +3212,11 @@ class Frame(AsyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> frame.focus started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.focus(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.focus", self._impl_obj.focus, selector=selector, timeout=timeout
             )
-            log_api("<= frame.focus succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.focus failed")
-            raise e
+        )
 
     async def text_content(
         self, selector: str, timeout: float = None
@@ -3623,17 +3238,14 @@ class Frame(AsyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> frame.text_content started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.text_content(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.text_content",
+                self._impl_obj.text_content,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= frame.text_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.text_content failed")
-            raise e
+        )
 
     async def inner_text(self, selector: str, timeout: float = None) -> str:
         """Frame.inner_text
@@ -3653,17 +3265,14 @@ class Frame(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.inner_text started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.inner_text(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.inner_text",
+                self._impl_obj.inner_text,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= frame.inner_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.inner_text failed")
-            raise e
+        )
 
     async def inner_html(self, selector: str, timeout: float = None) -> str:
         """Frame.inner_html
@@ -3683,17 +3292,14 @@ class Frame(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.inner_html started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.inner_html(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.inner_html",
+                self._impl_obj.inner_html,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= frame.inner_html succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.inner_html failed")
-            raise e
+        )
 
     async def get_attribute(
         self, selector: str, name: str, timeout: float = None
@@ -3717,19 +3323,15 @@ class Frame(AsyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> frame.get_attribute started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.get_attribute(
-                    selector=selector, name=name, timeout=timeout
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.get_attribute",
+                self._impl_obj.get_attribute,
+                selector=selector,
+                name=name,
+                timeout=timeout,
             )
-            log_api("<= frame.get_attribute succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.get_attribute failed")
-            raise e
+        )
 
     async def hover(
         self,
@@ -3771,23 +3373,17 @@ class Frame(AsyncBase):
         force : Union[bool, NoneType]
             Whether to bypass the [actionability](./actionability.md) checks. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.hover started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.hover(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.hover",
+                self._impl_obj.hover,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
             )
-            log_api("<= frame.hover succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.hover failed")
-            raise e
+        )
 
     async def select_option(
         self,
@@ -3822,25 +3418,19 @@ class Frame(AsyncBase):
         -------
         List[str]
         """
-
-        try:
-            log_api("=> frame.select_option started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.select_option(
-                    selector=selector,
-                    value=value,
-                    index=index,
-                    label=label,
-                    element=mapping.to_impl(element),
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= frame.select_option succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.select_option failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.select_option",
+                self._impl_obj.select_option,
+                selector=selector,
+                value=value,
+                index=index,
+                label=label,
+                element=mapping.to_impl(element),
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def set_input_files(
         self,
@@ -3878,22 +3468,16 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.set_input_files started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_input_files(
-                    selector=selector,
-                    files=files,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.set_input_files",
+                self._impl_obj.set_input_files,
+                selector=selector,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= frame.set_input_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.set_input_files failed")
-            raise e
+        )
 
     async def type(
         self,
@@ -3927,23 +3511,17 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.type started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.type(
-                    selector=selector,
-                    text=text,
-                    delay=delay,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.type",
+                self._impl_obj.type,
+                selector=selector,
+                text=text,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= frame.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.type failed")
-            raise e
+        )
 
     async def press(
         self,
@@ -3989,23 +3567,17 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.press started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.press(
-                    selector=selector,
-                    key=key,
-                    delay=delay,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.press",
+                self._impl_obj.press,
+                selector=selector,
+                key=key,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= frame.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.press failed")
-            raise e
+        )
 
     async def check(
         self,
@@ -4045,22 +3617,16 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.check started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.check(
-                    selector=selector,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.check",
+                self._impl_obj.check,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= frame.check succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.check failed")
-            raise e
+        )
 
     async def uncheck(
         self,
@@ -4100,22 +3666,16 @@ class Frame(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.uncheck started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.uncheck(
-                    selector=selector,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.uncheck",
+                self._impl_obj.uncheck,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= frame.uncheck succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.uncheck failed")
-            raise e
+        )
 
     async def wait_for_timeout(self, timeout: float) -> NoneType:
         """Frame.wait_for_timeout
@@ -4130,17 +3690,13 @@ class Frame(AsyncBase):
         timeout : float
             A timeout to wait for
         """
-
-        try:
-            log_api("=> frame.wait_for_timeout started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "frame.wait_for_timeout",
+                self._impl_obj.wait_for_timeout,
+                timeout=timeout,
             )
-            log_api("<= frame.wait_for_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_timeout failed")
-            raise e
+        )
 
     async def wait_for_function(
         self,
@@ -4177,23 +3733,17 @@ class Frame(AsyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> frame.wait_for_function started")
-            result = mapping.from_impl(
-                await self._impl_obj.wait_for_function(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                    timeout=timeout,
-                    polling=polling,
-                )
+        return _from_impl(
+            await self._call_async(
+                "frame.wait_for_function",
+                self._impl_obj.wait_for_function,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+                timeout=timeout,
+                polling=polling,
             )
-            log_api("<= frame.wait_for_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_function failed")
-            raise e
+        )
 
     async def title(self) -> str:
         """Frame.title
@@ -4204,15 +3754,9 @@ class Frame(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.title started")
-            result = mapping.from_maybe_impl(await self._impl_obj.title())
-            log_api("<= frame.title succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.title failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("frame.title", self._impl_obj.title)
+        )
 
     def expect_load_state(
         self,
@@ -4276,6 +3820,8 @@ mapping.register(FrameImpl, Frame)
 
 
 class Worker(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: WorkerImpl):
         super().__init__(obj)
 
@@ -4287,7 +3833,7 @@ class Worker(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     async def evaluate(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -4316,21 +3862,15 @@ class Worker(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> worker.evaluate started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.evaluate(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "worker.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= worker.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= worker.evaluate failed")
-            raise e
+        )
 
     async def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -4358,27 +3898,23 @@ class Worker(AsyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> worker.evaluate_handle started")
-            result = mapping.from_impl(
-                await self._impl_obj.evaluate_handle(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_impl(
+            await self._call_async(
+                "worker.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= worker.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= worker.evaluate_handle failed")
-            raise e
+        )
 
 
 mapping.register(WorkerImpl, Worker)
 
 
 class Selectors(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: SelectorsImpl):
         super().__init__(obj)
 
@@ -4405,25 +3941,24 @@ class Selectors(AsyncBase):
             not any JavaScript objects from the frame's scripts. Defaults to `false`. Note that running as a content script is not
             guaranteed when this engine is used together with other registered engines.
         """
-
-        try:
-            log_api("=> selectors.register started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.register(
-                    name=name, script=script, path=path, contentScript=content_script
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "selectors.register",
+                self._impl_obj.register,
+                name=name,
+                script=script,
+                path=path,
+                contentScript=content_script,
             )
-            log_api("<= selectors.register succeded")
-            return result
-        except Exception as e:
-            log_api("<= selectors.register failed")
-            raise e
+        )
 
 
 mapping.register(SelectorsImpl, Selectors)
 
 
 class ConsoleMessage(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: ConsoleMessageImpl):
         super().__init__(obj)
 
@@ -4439,7 +3974,7 @@ class ConsoleMessage(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return _from_maybe_impl(self._impl_obj.type)
 
     @property
     def text(self) -> str:
@@ -4449,7 +3984,7 @@ class ConsoleMessage(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.text)
+        return _from_maybe_impl(self._impl_obj.text)
 
     @property
     def args(self) -> typing.List["JSHandle"]:
@@ -4459,7 +3994,7 @@ class ConsoleMessage(AsyncBase):
         -------
         List[JSHandle]
         """
-        return mapping.from_impl_list(self._impl_obj.args)
+        return _from_impl_list(self._impl_obj.args)
 
     @property
     def location(self) -> "SourceLocation":
@@ -4469,13 +4004,15 @@ class ConsoleMessage(AsyncBase):
         -------
         {url: str, line_number: int, column_number: int}
         """
-        return mapping.from_impl(self._impl_obj.location)
+        return _from_impl(self._impl_obj.location)
 
 
 mapping.register(ConsoleMessageImpl, ConsoleMessage)
 
 
 class Dialog(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: DialogImpl):
         super().__init__(obj)
 
@@ -4489,7 +4026,7 @@ class Dialog(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return _from_maybe_impl(self._impl_obj.type)
 
     @property
     def message(self) -> str:
@@ -4501,7 +4038,7 @@ class Dialog(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.message)
+        return _from_maybe_impl(self._impl_obj.message)
 
     @property
     def default_value(self) -> str:
@@ -4513,7 +4050,7 @@ class Dialog(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.default_value)
+        return _from_maybe_impl(self._impl_obj.default_value)
 
     async def accept(self, prompt_text: str = None) -> NoneType:
         """Dialog.accept
@@ -4525,38 +4062,28 @@ class Dialog(AsyncBase):
         prompt_text : Union[str, NoneType]
             A text to enter in prompt. Does not cause any effects if the dialog's `type` is not prompt. Optional.
         """
-
-        try:
-            log_api("=> dialog.accept started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.accept(promptText=prompt_text)
+        return _from_maybe_impl(
+            await self._call_async(
+                "dialog.accept", self._impl_obj.accept, promptText=prompt_text
             )
-            log_api("<= dialog.accept succeded")
-            return result
-        except Exception as e:
-            log_api("<= dialog.accept failed")
-            raise e
+        )
 
     async def dismiss(self) -> NoneType:
         """Dialog.dismiss
 
         Returns when the dialog has been dismissed.
         """
-
-        try:
-            log_api("=> dialog.dismiss started")
-            result = mapping.from_maybe_impl(await self._impl_obj.dismiss())
-            log_api("<= dialog.dismiss succeded")
-            return result
-        except Exception as e:
-            log_api("<= dialog.dismiss failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("dialog.dismiss", self._impl_obj.dismiss)
+        )
 
 
 mapping.register(DialogImpl, Dialog)
 
 
 class Download(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: DownloadImpl):
         super().__init__(obj)
 
@@ -4570,7 +4097,7 @@ class Download(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def suggested_filename(self) -> str:
@@ -4585,22 +4112,16 @@ class Download(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.suggested_filename)
+        return _from_maybe_impl(self._impl_obj.suggested_filename)
 
     async def delete(self) -> NoneType:
         """Download.delete
 
         Deletes the downloaded file.
         """
-
-        try:
-            log_api("=> download.delete started")
-            result = mapping.from_maybe_impl(await self._impl_obj.delete())
-            log_api("<= download.delete succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.delete failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("download.delete", self._impl_obj.delete)
+        )
 
     async def failure(self) -> typing.Union[str, NoneType]:
         """Download.failure
@@ -4611,15 +4132,9 @@ class Download(AsyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> download.failure started")
-            result = mapping.from_maybe_impl(await self._impl_obj.failure())
-            log_api("<= download.failure succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.failure failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("download.failure", self._impl_obj.failure)
+        )
 
     async def path(self) -> typing.Union[str, NoneType]:
         """Download.path
@@ -4630,15 +4145,9 @@ class Download(AsyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> download.path started")
-            result = mapping.from_maybe_impl(await self._impl_obj.path())
-            log_api("<= download.path succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.path failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("download.path", self._impl_obj.path)
+        )
 
     async def save_as(self, path: typing.Union[str, pathlib.Path]) -> NoneType:
         """Download.save_as
@@ -4650,21 +4159,19 @@ class Download(AsyncBase):
         path : Union[pathlib.Path, str]
             Path where the download should be saved.
         """
-
-        try:
-            log_api("=> download.save_as started")
-            result = mapping.from_maybe_impl(await self._impl_obj.save_as(path=path))
-            log_api("<= download.save_as succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.save_as failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "download.save_as", self._impl_obj.save_as, path=path
+            )
+        )
 
 
 mapping.register(DownloadImpl, Download)
 
 
 class Video(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: VideoImpl):
         super().__init__(obj)
 
@@ -4678,42 +4185,34 @@ class Video(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> video.path started")
-            result = mapping.from_maybe_impl(await self._impl_obj.path())
-            log_api("<= video.path succeded")
-            return result
-        except Exception as e:
-            log_api("<= video.path failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("video.path", self._impl_obj.path)
+        )
 
 
 mapping.register(VideoImpl, Video)
 
 
 class BindingCall(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BindingCallImpl):
         super().__init__(obj)
 
     async def call(self, func: typing.Callable) -> NoneType:
-
-        try:
-            log_api("=> binding_call.call started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.call(func=self._wrap_handler(func))
+        return _from_maybe_impl(
+            await self._call_async(
+                "binding_call.call", self._impl_obj.call, func=self._wrap_handler(func)
             )
-            log_api("<= binding_call.call succeded")
-            return result
-        except Exception as e:
-            log_api("<= binding_call.call failed")
-            raise e
+        )
 
 
 mapping.register(BindingCallImpl, BindingCall)
 
 
 class Page(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: PageImpl):
         super().__init__(obj)
 
@@ -4725,7 +4224,7 @@ class Page(AsyncBase):
         -------
         Accessibility
         """
-        return mapping.from_impl(self._impl_obj.accessibility)
+        return _from_impl(self._impl_obj.accessibility)
 
     @property
     def keyboard(self) -> "Keyboard":
@@ -4735,7 +4234,7 @@ class Page(AsyncBase):
         -------
         Keyboard
         """
-        return mapping.from_impl(self._impl_obj.keyboard)
+        return _from_impl(self._impl_obj.keyboard)
 
     @property
     def mouse(self) -> "Mouse":
@@ -4745,7 +4244,7 @@ class Page(AsyncBase):
         -------
         Mouse
         """
-        return mapping.from_impl(self._impl_obj.mouse)
+        return _from_impl(self._impl_obj.mouse)
 
     @property
     def touchscreen(self) -> "Touchscreen":
@@ -4755,7 +4254,7 @@ class Page(AsyncBase):
         -------
         Touchscreen
         """
-        return mapping.from_impl(self._impl_obj.touchscreen)
+        return _from_impl(self._impl_obj.touchscreen)
 
     @property
     def context(self) -> "BrowserContext":
@@ -4767,7 +4266,7 @@ class Page(AsyncBase):
         -------
         BrowserContext
         """
-        return mapping.from_impl(self._impl_obj.context)
+        return _from_impl(self._impl_obj.context)
 
     @property
     def main_frame(self) -> "Frame":
@@ -4779,7 +4278,7 @@ class Page(AsyncBase):
         -------
         Frame
         """
-        return mapping.from_impl(self._impl_obj.main_frame)
+        return _from_impl(self._impl_obj.main_frame)
 
     @property
     def frames(self) -> typing.List["Frame"]:
@@ -4791,7 +4290,7 @@ class Page(AsyncBase):
         -------
         List[Frame]
         """
-        return mapping.from_impl_list(self._impl_obj.frames)
+        return _from_impl_list(self._impl_obj.frames)
 
     @property
     def url(self) -> str:
@@ -4803,7 +4302,7 @@ class Page(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def workers(self) -> typing.List["Worker"]:
@@ -4818,7 +4317,7 @@ class Page(AsyncBase):
         -------
         List[Worker]
         """
-        return mapping.from_impl_list(self._impl_obj.workers)
+        return _from_impl_list(self._impl_obj.workers)
 
     @property
     def video(self) -> typing.Union["Video", NoneType]:
@@ -4830,7 +4329,7 @@ class Page(AsyncBase):
         -------
         Union[Video, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.video)
+        return _from_impl_nullable(self._impl_obj.video)
 
     async def opener(self) -> typing.Union["Page", NoneType]:
         """Page.opener
@@ -4841,15 +4340,9 @@ class Page(AsyncBase):
         -------
         Union[Page, NoneType]
         """
-
-        try:
-            log_api("=> page.opener started")
-            result = mapping.from_impl_nullable(await self._impl_obj.opener())
-            log_api("<= page.opener succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.opener failed")
-            raise e
+        return _from_impl_nullable(
+            await self._call_async("page.opener", self._impl_obj.opener)
+        )
 
     def frame(
         self,
@@ -4871,17 +4364,14 @@ class Page(AsyncBase):
         -------
         Union[Frame, NoneType]
         """
-
-        try:
-            log_api("=> page.frame started")
-            result = mapping.from_impl_nullable(
-                self._impl_obj.frame(name=name, url=self._wrap_handler(url))
+        return _from_impl_nullable(
+            self._call(
+                "page.frame",
+                self._impl_obj.frame,
+                name=name,
+                url=self._wrap_handler(url),
             )
-            log_api("<= page.frame succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.frame failed")
-            raise e
+        )
 
     def set_default_navigation_timeout(self, timeout: float) -> NoneType:
         """Page.set_default_navigation_timeout
@@ -4902,17 +4392,13 @@ class Page(AsyncBase):
         timeout : float
             Maximum navigation time in milliseconds
         """
-
-        try:
-            log_api("=> page.set_default_navigation_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_navigation_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "page.set_default_navigation_timeout",
+                self._impl_obj.set_default_navigation_timeout,
+                timeout=timeout,
             )
-            log_api("<= page.set_default_navigation_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_default_navigation_timeout failed")
-            raise e
+        )
 
     def set_default_timeout(self, timeout: float) -> NoneType:
         """Page.set_default_timeout
@@ -4926,17 +4412,13 @@ class Page(AsyncBase):
         timeout : float
             Maximum time in milliseconds
         """
-
-        try:
-            log_api("=> page.set_default_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "page.set_default_timeout",
+                self._impl_obj.set_default_timeout,
+                timeout=timeout,
             )
-            log_api("<= page.set_default_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_default_timeout failed")
-            raise e
+        )
 
     async def query_selector(
         self, selector: str
@@ -4957,17 +4439,11 @@ class Page(AsyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> page.query_selector started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.query_selector(selector=selector)
+        return _from_impl_nullable(
+            await self._call_async(
+                "page.query_selector", self._impl_obj.query_selector, selector=selector
             )
-            log_api("<= page.query_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.query_selector failed")
-            raise e
+        )
 
     async def query_selector_all(self, selector: str) -> typing.List["ElementHandle"]:
         """Page.query_selector_all
@@ -4986,17 +4462,13 @@ class Page(AsyncBase):
         -------
         List[ElementHandle]
         """
-
-        try:
-            log_api("=> page.query_selector_all started")
-            result = mapping.from_impl_list(
-                await self._impl_obj.query_selector_all(selector=selector)
+        return _from_impl_list(
+            await self._call_async(
+                "page.query_selector_all",
+                self._impl_obj.query_selector_all,
+                selector=selector,
             )
-            log_api("<= page.query_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.query_selector_all failed")
-            raise e
+        )
 
     async def wait_for_selector(
         self,
@@ -5035,19 +4507,15 @@ class Page(AsyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> page.wait_for_selector started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.wait_for_selector(
-                    selector=selector, timeout=timeout, state=state
-                )
+        return _from_impl_nullable(
+            await self._call_async(
+                "page.wait_for_selector",
+                self._impl_obj.wait_for_selector,
+                selector=selector,
+                timeout=timeout,
+                state=state,
             )
-            log_api("<= page.wait_for_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_selector failed")
-            raise e
+        )
 
     async def dispatch_event(
         self,
@@ -5089,22 +4557,16 @@ class Page(AsyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> page.dispatch_event started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.dispatch_event(
-                    selector=selector,
-                    type=type,
-                    eventInit=mapping.to_impl(event_init),
-                    timeout=timeout,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.dispatch_event",
+                self._impl_obj.dispatch_event,
+                selector=selector,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
+                timeout=timeout,
             )
-            log_api("<= page.dispatch_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.dispatch_event failed")
-            raise e
+        )
 
     async def evaluate(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -5141,21 +4603,15 @@ class Page(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.evaluate started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.evaluate(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= page.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.evaluate failed")
-            raise e
+        )
 
     async def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -5187,21 +4643,15 @@ class Page(AsyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> page.evaluate_handle started")
-            result = mapping.from_impl(
-                await self._impl_obj.evaluate_handle(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_impl(
+            await self._call_async(
+                "page.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= page.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.evaluate_handle failed")
-            raise e
+        )
 
     async def eval_on_selector(
         self,
@@ -5237,22 +4687,16 @@ class Page(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.eval_on_selector started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.eval_on_selector(
-                    selector=selector,
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.eval_on_selector",
+                self._impl_obj.eval_on_selector,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= page.eval_on_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.eval_on_selector failed")
-            raise e
+        )
 
     async def eval_on_selector_all(
         self,
@@ -5286,22 +4730,16 @@ class Page(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.eval_on_selector_all started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.eval_on_selector_all(
-                    selector=selector,
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.eval_on_selector_all",
+                self._impl_obj.eval_on_selector_all,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= page.eval_on_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.eval_on_selector_all failed")
-            raise e
+        )
 
     async def add_script_tag(
         self,
@@ -5334,19 +4772,16 @@ class Page(AsyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> page.add_script_tag started")
-            result = mapping.from_impl(
-                await self._impl_obj.add_script_tag(
-                    url=url, path=path, content=content, type=type
-                )
+        return _from_impl(
+            await self._call_async(
+                "page.add_script_tag",
+                self._impl_obj.add_script_tag,
+                url=url,
+                path=path,
+                content=content,
+                type=type,
             )
-            log_api("<= page.add_script_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.add_script_tag failed")
-            raise e
+        )
 
     async def add_style_tag(
         self,
@@ -5375,17 +4810,15 @@ class Page(AsyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> page.add_style_tag started")
-            result = mapping.from_impl(
-                await self._impl_obj.add_style_tag(url=url, path=path, content=content)
+        return _from_impl(
+            await self._call_async(
+                "page.add_style_tag",
+                self._impl_obj.add_style_tag,
+                url=url,
+                path=path,
+                content=content,
             )
-            log_api("<= page.add_style_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.add_style_tag failed")
-            raise e
+        )
 
     async def expose_function(self, name: str, callback: typing.Callable) -> NoneType:
         """Page.expose_function
@@ -5410,19 +4843,14 @@ class Page(AsyncBase):
         callback : Callable
             Callback function which will be called in Playwright's context.
         """
-
-        try:
-            log_api("=> page.expose_function started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.expose_function(
-                    name=name, callback=self._wrap_handler(callback)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.expose_function",
+                self._impl_obj.expose_function,
+                name=name,
+                callback=self._wrap_handler(callback),
             )
-            log_api("<= page.expose_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.expose_function failed")
-            raise e
+        )
 
     async def expose_binding(
         self, name: str, callback: typing.Callable, handle: bool = None
@@ -5454,19 +4882,15 @@ class Page(AsyncBase):
             Whether to pass the argument as a handle, instead of passing by value. When passing a handle, only one argument is
             supported. When passing by value, multiple arguments are supported.
         """
-
-        try:
-            log_api("=> page.expose_binding started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.expose_binding(
-                    name=name, callback=self._wrap_handler(callback), handle=handle
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.expose_binding",
+                self._impl_obj.expose_binding,
+                name=name,
+                callback=self._wrap_handler(callback),
+                handle=handle,
             )
-            log_api("<= page.expose_binding succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.expose_binding failed")
-            raise e
+        )
 
     async def set_extra_http_headers(self, headers: typing.Dict[str, str]) -> NoneType:
         """Page.set_extra_http_headers
@@ -5480,19 +4904,13 @@ class Page(AsyncBase):
         headers : Dict[str, str]
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
-
-        try:
-            log_api("=> page.set_extra_http_headers started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_extra_http_headers(
-                    headers=mapping.to_impl(headers)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.set_extra_http_headers",
+                self._impl_obj.set_extra_http_headers,
+                headers=mapping.to_impl(headers),
             )
-            log_api("<= page.set_extra_http_headers succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_extra_http_headers failed")
-            raise e
+        )
 
     async def content(self) -> str:
         """Page.content
@@ -5503,15 +4921,9 @@ class Page(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.content started")
-            result = mapping.from_maybe_impl(await self._impl_obj.content())
-            log_api("<= page.content succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.content failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("page.content", self._impl_obj.content)
+        )
 
     async def set_content(
         self,
@@ -5536,19 +4948,15 @@ class Page(AsyncBase):
             - `'load'` - consider operation to be finished when the `load` event is fired.
             - `'networkidle'` - consider operation to be finished when there are no network connections for at least `500` ms.
         """
-
-        try:
-            log_api("=> page.set_content started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_content(
-                    html=html, timeout=timeout, waitUntil=wait_until
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.set_content",
+                self._impl_obj.set_content,
+                html=html,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.set_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_content failed")
-            raise e
+        )
 
     async def goto(
         self,
@@ -5602,19 +5010,16 @@ class Page(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.goto started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.goto(
-                    url=url, timeout=timeout, waitUntil=wait_until, referer=referer
-                )
+        return _from_impl_nullable(
+            await self._call_async(
+                "page.goto",
+                self._impl_obj.goto,
+                url=url,
+                timeout=timeout,
+                waitUntil=wait_until,
+                referer=referer,
             )
-            log_api("<= page.goto succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.goto failed")
-            raise e
+        )
 
     async def reload(
         self,
@@ -5643,17 +5048,14 @@ class Page(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.reload started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.reload(timeout=timeout, waitUntil=wait_until)
+        return _from_impl_nullable(
+            await self._call_async(
+                "page.reload",
+                self._impl_obj.reload,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.reload succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.reload failed")
-            raise e
+        )
 
     async def wait_for_load_state(
         self,
@@ -5683,17 +5085,14 @@ class Page(AsyncBase):
             `browser_context.set_default_timeout()`, `page.set_default_navigation_timeout()` or
             `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> page.wait_for_load_state started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.wait_for_load_state",
+                self._impl_obj.wait_for_load_state,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_load_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_load_state failed")
-            raise e
+        )
 
     async def wait_for_navigation(
         self,
@@ -5735,19 +5134,15 @@ class Page(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.wait_for_navigation started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.wait_for_navigation(
-                    url=self._wrap_handler(url), waitUntil=wait_until, timeout=timeout
-                )
+        return _from_impl_nullable(
+            await self._call_async(
+                "page.wait_for_navigation",
+                self._impl_obj.wait_for_navigation,
+                url=self._wrap_handler(url),
+                waitUntil=wait_until,
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_navigation succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_navigation failed")
-            raise e
+        )
 
     async def wait_for_request(
         self,
@@ -5772,19 +5167,14 @@ class Page(AsyncBase):
         -------
         Request
         """
-
-        try:
-            log_api("=> page.wait_for_request started")
-            result = mapping.from_impl(
-                await self._impl_obj.wait_for_request(
-                    urlOrPredicate=self._wrap_handler(url_or_predicate), timeout=timeout
-                )
+        return _from_impl(
+            await self._call_async(
+                "page.wait_for_request",
+                self._impl_obj.wait_for_request,
+                urlOrPredicate=self._wrap_handler(url_or_predicate),
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_request succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_request failed")
-            raise e
+        )
 
     async def wait_for_response(
         self,
@@ -5809,19 +5199,14 @@ class Page(AsyncBase):
         -------
         Response
         """
-
-        try:
-            log_api("=> page.wait_for_response started")
-            result = mapping.from_impl(
-                await self._impl_obj.wait_for_response(
-                    urlOrPredicate=self._wrap_handler(url_or_predicate), timeout=timeout
-                )
+        return _from_impl(
+            await self._call_async(
+                "page.wait_for_response",
+                self._impl_obj.wait_for_response,
+                urlOrPredicate=self._wrap_handler(url_or_predicate),
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_response succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_response failed")
-            raise e
+        )
 
     async def wait_for_event(
         self,
@@ -5850,21 +5235,15 @@ class Page(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.wait_for_event started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_event(
-                    event=event,
-                    predicate=self._wrap_handler(predicate),
-                    timeout=timeout,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.wait_for_event",
+                self._impl_obj.wait_for_event,
+                event=event,
+                predicate=self._wrap_handler(predicate),
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_event failed")
-            raise e
+        )
 
     async def go_back(
         self,
@@ -5895,17 +5274,14 @@ class Page(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.go_back started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.go_back(timeout=timeout, waitUntil=wait_until)
+        return _from_impl_nullable(
+            await self._call_async(
+                "page.go_back",
+                self._impl_obj.go_back,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.go_back succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.go_back failed")
-            raise e
+        )
 
     async def go_forward(
         self,
@@ -5936,17 +5312,14 @@ class Page(AsyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.go_forward started")
-            result = mapping.from_impl_nullable(
-                await self._impl_obj.go_forward(timeout=timeout, waitUntil=wait_until)
+        return _from_impl_nullable(
+            await self._call_async(
+                "page.go_forward",
+                self._impl_obj.go_forward,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.go_forward succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.go_forward failed")
-            raise e
+        )
 
     async def emulate_media(
         self,
@@ -5966,19 +5339,14 @@ class Page(AsyncBase):
             `null` disables color scheme emulation. Omitting `colorScheme` or passing `undefined` does not change the emulated
             value. Optional.
         """
-
-        try:
-            log_api("=> page.emulate_media started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.emulate_media(
-                    media=media, colorScheme=color_scheme
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.emulate_media",
+                self._impl_obj.emulate_media,
+                media=media,
+                colorScheme=color_scheme,
             )
-            log_api("<= page.emulate_media succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.emulate_media failed")
-            raise e
+        )
 
     async def set_viewport_size(self, width: int, height: int) -> NoneType:
         """Page.set_viewport_size
@@ -5996,17 +5364,14 @@ class Page(AsyncBase):
         height : int
             page height in pixels. **required**
         """
-
-        try:
-            log_api("=> page.set_viewport_size started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_viewport_size(width=width, height=height)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.set_viewport_size",
+                self._impl_obj.set_viewport_size,
+                width=width,
+                height=height,
             )
-            log_api("<= page.set_viewport_size succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_viewport_size failed")
-            raise e
+        )
 
     def viewport_size(self) -> typing.Union[typing.Tuple[int, int], NoneType]:
         """Page.viewport_size
@@ -6015,30 +5380,18 @@ class Page(AsyncBase):
         -------
         Union[typing.Tuple[int, int], NoneType]
         """
-
-        try:
-            log_api("=> page.viewport_size started")
-            result = mapping.from_maybe_impl(self._impl_obj.viewport_size())
-            log_api("<= page.viewport_size succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.viewport_size failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("page.viewport_size", self._impl_obj.viewport_size)
+        )
 
     async def bring_to_front(self) -> NoneType:
         """Page.bring_to_front
 
         Brings page to front (activates tab).
         """
-
-        try:
-            log_api("=> page.bring_to_front started")
-            result = mapping.from_maybe_impl(await self._impl_obj.bring_to_front())
-            log_api("<= page.bring_to_front succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.bring_to_front failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("page.bring_to_front", self._impl_obj.bring_to_front)
+        )
 
     async def add_init_script(
         self, script: str = None, path: typing.Union[str, pathlib.Path] = None
@@ -6063,17 +5416,14 @@ class Page(AsyncBase):
         script : Union[str, NoneType]
             Script to be evaluated in the page.
         """
-
-        try:
-            log_api("=> page.add_init_script started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.add_init_script(script=script, path=path)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.add_init_script",
+                self._impl_obj.add_init_script,
+                script=script,
+                path=path,
             )
-            log_api("<= page.add_init_script succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.add_init_script failed")
-            raise e
+        )
 
     async def route(
         self,
@@ -6107,19 +5457,14 @@ class Page(AsyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any]]
             handler function to route the request.
         """
-
-        try:
-            log_api("=> page.route started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.route(
-                    url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.route",
+                self._impl_obj.route,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= page.route succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.route failed")
-            raise e
+        )
 
     async def unroute(
         self,
@@ -6140,19 +5485,14 @@ class Page(AsyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any], NoneType]
             Optional handler function to route the request.
         """
-
-        try:
-            log_api("=> page.unroute started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.unroute(
-                    url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.unroute",
+                self._impl_obj.unroute,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= page.unroute succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.unroute failed")
-            raise e
+        )
 
     async def screenshot(
         self,
@@ -6197,25 +5537,19 @@ class Page(AsyncBase):
         -------
         bytes
         """
-
-        try:
-            log_api("=> page.screenshot started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.screenshot(
-                    timeout=timeout,
-                    type=type,
-                    path=path,
-                    quality=quality,
-                    omitBackground=omit_background,
-                    fullPage=full_page,
-                    clip=clip,
-                )
-            )
-            log_api("<= page.screenshot succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.screenshot failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.screenshot",
+                self._impl_obj.screenshot,
+                timeout=timeout,
+                type=type,
+                path=path,
+                quality=quality,
+                omitBackground=omit_background,
+                fullPage=full_page,
+                clip=clip,
+            )
+        )
 
     async def title(self) -> str:
         """Page.title
@@ -6226,15 +5560,9 @@ class Page(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.title started")
-            result = mapping.from_maybe_impl(await self._impl_obj.title())
-            log_api("<= page.title succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.title failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("page.title", self._impl_obj.title)
+        )
 
     async def close(self, run_before_unload: bool = None) -> NoneType:
         """Page.close
@@ -6253,17 +5581,11 @@ class Page(AsyncBase):
             Defaults to `false`. Whether to run the
             [before unload](https://developer.mozilla.org/en-US/docs/Web/Events/beforeunload) page handlers.
         """
-
-        try:
-            log_api("=> page.close started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.close(runBeforeUnload=run_before_unload)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.close", self._impl_obj.close, runBeforeUnload=run_before_unload
             )
-            log_api("<= page.close succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.close failed")
-            raise e
+        )
 
     def is_closed(self) -> bool:
         """Page.is_closed
@@ -6274,15 +5596,7 @@ class Page(AsyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> page.is_closed started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_closed())
-            log_api("<= page.is_closed succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.is_closed failed")
-            raise e
+        return _from_maybe_impl(self._call("page.is_closed", self._impl_obj.is_closed))
 
     async def click(
         self,
@@ -6340,27 +5654,21 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.click started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.click(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    clickCount=click_count,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= page.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.click failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.click",
+                self._impl_obj.click,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def dblclick(
         self,
@@ -6418,26 +5726,20 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.dblclick started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.dblclick(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= page.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.dblclick failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.dblclick",
+                self._impl_obj.dblclick,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def tap(
         self,
@@ -6488,24 +5790,18 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.tap started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.tap(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= page.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.tap failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.tap",
+                self._impl_obj.tap,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def fill(
         self,
@@ -6540,22 +5836,16 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.fill started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.fill(
-                    selector=selector,
-                    value=value,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.fill",
+                self._impl_obj.fill,
+                selector=selector,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= page.fill succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.fill failed")
-            raise e
+        )
 
     async def focus(self, selector: str, timeout: float = None) -> NoneType:
         """Page.focus
@@ -6574,17 +5864,11 @@ class Page(AsyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> page.focus started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.focus(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.focus", self._impl_obj.focus, selector=selector, timeout=timeout
             )
-            log_api("<= page.focus succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.focus failed")
-            raise e
+        )
 
     async def text_content(
         self, selector: str, timeout: float = None
@@ -6606,17 +5890,14 @@ class Page(AsyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> page.text_content started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.text_content(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.text_content",
+                self._impl_obj.text_content,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= page.text_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.text_content failed")
-            raise e
+        )
 
     async def inner_text(self, selector: str, timeout: float = None) -> str:
         """Page.inner_text
@@ -6636,17 +5917,14 @@ class Page(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.inner_text started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.inner_text(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.inner_text",
+                self._impl_obj.inner_text,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= page.inner_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.inner_text failed")
-            raise e
+        )
 
     async def inner_html(self, selector: str, timeout: float = None) -> str:
         """Page.inner_html
@@ -6666,17 +5944,14 @@ class Page(AsyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.inner_html started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.inner_html(selector=selector, timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.inner_html",
+                self._impl_obj.inner_html,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= page.inner_html succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.inner_html failed")
-            raise e
+        )
 
     async def get_attribute(
         self, selector: str, name: str, timeout: float = None
@@ -6700,19 +5975,15 @@ class Page(AsyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> page.get_attribute started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.get_attribute(
-                    selector=selector, name=name, timeout=timeout
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.get_attribute",
+                self._impl_obj.get_attribute,
+                selector=selector,
+                name=name,
+                timeout=timeout,
             )
-            log_api("<= page.get_attribute succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.get_attribute failed")
-            raise e
+        )
 
     async def hover(
         self,
@@ -6756,23 +6027,17 @@ class Page(AsyncBase):
         force : Union[bool, NoneType]
             Whether to bypass the [actionability](./actionability.md) checks. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.hover started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.hover(
-                    selector=selector,
-                    modifiers=modifiers,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.hover",
+                self._impl_obj.hover,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
             )
-            log_api("<= page.hover succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.hover failed")
-            raise e
+        )
 
     async def select_option(
         self,
@@ -6810,25 +6075,19 @@ class Page(AsyncBase):
         -------
         List[str]
         """
-
-        try:
-            log_api("=> page.select_option started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.select_option(
-                    selector=selector,
-                    value=value,
-                    index=index,
-                    label=label,
-                    element=mapping.to_impl(element),
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
-            )
-            log_api("<= page.select_option succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.select_option failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.select_option",
+                self._impl_obj.select_option,
+                selector=selector,
+                value=value,
+                index=index,
+                label=label,
+                element=mapping.to_impl(element),
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     async def set_input_files(
         self,
@@ -6861,22 +6120,16 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.set_input_files started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_input_files(
-                    selector=selector,
-                    files=files,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.set_input_files",
+                self._impl_obj.set_input_files,
+                selector=selector,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= page.set_input_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_input_files failed")
-            raise e
+        )
 
     async def type(
         self,
@@ -6912,23 +6165,17 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.type started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.type(
-                    selector=selector,
-                    text=text,
-                    delay=delay,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.type",
+                self._impl_obj.type,
+                selector=selector,
+                text=text,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= page.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.type failed")
-            raise e
+        )
 
     async def press(
         self,
@@ -6976,23 +6223,17 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.press started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.press(
-                    selector=selector,
-                    key=key,
-                    delay=delay,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.press",
+                self._impl_obj.press,
+                selector=selector,
+                key=key,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= page.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.press failed")
-            raise e
+        )
 
     async def check(
         self,
@@ -7034,22 +6275,16 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.check started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.check(
-                    selector=selector,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.check",
+                self._impl_obj.check,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= page.check succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.check failed")
-            raise e
+        )
 
     async def uncheck(
         self,
@@ -7091,22 +6326,16 @@ class Page(AsyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.uncheck started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.uncheck(
-                    selector=selector,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.uncheck",
+                self._impl_obj.uncheck,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= page.uncheck succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.uncheck failed")
-            raise e
+        )
 
     async def wait_for_timeout(self, timeout: float) -> NoneType:
         """Page.wait_for_timeout
@@ -7123,17 +6352,13 @@ class Page(AsyncBase):
         timeout : float
             A timeout to wait for
         """
-
-        try:
-            log_api("=> page.wait_for_timeout started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.wait_for_timeout",
+                self._impl_obj.wait_for_timeout,
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_timeout failed")
-            raise e
+        )
 
     async def wait_for_function(
         self,
@@ -7172,23 +6397,17 @@ class Page(AsyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> page.wait_for_function started")
-            result = mapping.from_impl(
-                await self._impl_obj.wait_for_function(
-                    expression=expression,
-                    arg=mapping.to_impl(arg),
-                    force_expr=force_expr,
-                    timeout=timeout,
-                    polling=polling,
-                )
+        return _from_impl(
+            await self._call_async(
+                "page.wait_for_function",
+                self._impl_obj.wait_for_function,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+                timeout=timeout,
+                polling=polling,
             )
-            log_api("<= page.wait_for_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_function failed")
-            raise e
+        )
 
     async def pdf(
         self,
@@ -7290,31 +6509,25 @@ class Page(AsyncBase):
         -------
         bytes
         """
-
-        try:
-            log_api("=> page.pdf started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.pdf(
-                    scale=scale,
-                    displayHeaderFooter=display_header_footer,
-                    headerTemplate=header_template,
-                    footerTemplate=footer_template,
-                    printBackground=print_background,
-                    landscape=landscape,
-                    pageRanges=page_ranges,
-                    format=format,
-                    width=width,
-                    height=height,
-                    preferCSSPageSize=prefer_css_page_size,
-                    margin=margin,
-                    path=path,
-                )
-            )
-            log_api("<= page.pdf succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.pdf failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "page.pdf",
+                self._impl_obj.pdf,
+                scale=scale,
+                displayHeaderFooter=display_header_footer,
+                headerTemplate=header_template,
+                footerTemplate=footer_template,
+                printBackground=print_background,
+                landscape=landscape,
+                pageRanges=page_ranges,
+                format=format,
+                width=width,
+                height=height,
+                preferCSSPageSize=prefer_css_page_size,
+                margin=margin,
+                path=path,
+            )
+        )
 
     def expect_event(
         self,
@@ -7369,9 +6582,8 @@ class Page(AsyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "console"
         return AsyncEventContextManager(
-            self._impl_obj.wait_for_event(event, predicate, timeout)
+            self._impl_obj.wait_for_event("console", predicate, timeout)
         )
 
     def expect_dialog(
@@ -7398,9 +6610,8 @@ class Page(AsyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "dialog"
         return AsyncEventContextManager(
-            self._impl_obj.wait_for_event(event, predicate, timeout)
+            self._impl_obj.wait_for_event("dialog", predicate, timeout)
         )
 
     def expect_download(
@@ -7427,9 +6638,8 @@ class Page(AsyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "download"
         return AsyncEventContextManager(
-            self._impl_obj.wait_for_event(event, predicate, timeout)
+            self._impl_obj.wait_for_event("download", predicate, timeout)
         )
 
     def expect_file_chooser(
@@ -7456,9 +6666,8 @@ class Page(AsyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "filechooser"
         return AsyncEventContextManager(
-            self._impl_obj.wait_for_event(event, predicate, timeout)
+            self._impl_obj.wait_for_event("filechooser", predicate, timeout)
         )
 
     def expect_load_state(
@@ -7542,9 +6751,8 @@ class Page(AsyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "popup"
         return AsyncEventContextManager(
-            self._impl_obj.wait_for_event(event, predicate, timeout)
+            self._impl_obj.wait_for_event("popup", predicate, timeout)
         )
 
     def expect_request(
@@ -7631,9 +6839,8 @@ class Page(AsyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "worker"
         return AsyncEventContextManager(
-            self._impl_obj.wait_for_event(event, predicate, timeout)
+            self._impl_obj.wait_for_event("worker", predicate, timeout)
         )
 
 
@@ -7641,6 +6848,8 @@ mapping.register(PageImpl, Page)
 
 
 class BrowserContext(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BrowserContextImpl):
         super().__init__(obj)
 
@@ -7655,7 +6864,7 @@ class BrowserContext(AsyncBase):
         -------
         List[Page]
         """
-        return mapping.from_impl_list(self._impl_obj.pages)
+        return _from_impl_list(self._impl_obj.pages)
 
     @property
     def browser(self) -> typing.Union["Browser", NoneType]:
@@ -7667,7 +6876,7 @@ class BrowserContext(AsyncBase):
         -------
         Union[Browser, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.browser)
+        return _from_impl_nullable(self._impl_obj.browser)
 
     def set_default_navigation_timeout(self, timeout: float) -> NoneType:
         """BrowserContext.set_default_navigation_timeout
@@ -7688,17 +6897,13 @@ class BrowserContext(AsyncBase):
         timeout : float
             Maximum navigation time in milliseconds
         """
-
-        try:
-            log_api("=> browser_context.set_default_navigation_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_navigation_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "browser_context.set_default_navigation_timeout",
+                self._impl_obj.set_default_navigation_timeout,
+                timeout=timeout,
             )
-            log_api("<= browser_context.set_default_navigation_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_default_navigation_timeout failed")
-            raise e
+        )
 
     def set_default_timeout(self, timeout: float) -> NoneType:
         """BrowserContext.set_default_timeout
@@ -7713,17 +6918,13 @@ class BrowserContext(AsyncBase):
         timeout : float
             Maximum time in milliseconds
         """
-
-        try:
-            log_api("=> browser_context.set_default_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "browser_context.set_default_timeout",
+                self._impl_obj.set_default_timeout,
+                timeout=timeout,
             )
-            log_api("<= browser_context.set_default_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_default_timeout failed")
-            raise e
+        )
 
     async def new_page(self) -> "Page":
         """BrowserContext.new_page
@@ -7734,15 +6935,9 @@ class BrowserContext(AsyncBase):
         -------
         Page
         """
-
-        try:
-            log_api("=> browser_context.new_page started")
-            result = mapping.from_impl(await self._impl_obj.new_page())
-            log_api("<= browser_context.new_page succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.new_page failed")
-            raise e
+        return _from_impl(
+            await self._call_async("browser_context.new_page", self._impl_obj.new_page)
+        )
 
     async def cookies(
         self, urls: typing.Union[str, typing.List[str]] = None
@@ -7761,15 +6956,11 @@ class BrowserContext(AsyncBase):
         -------
         List[{name: str, value: str, url: Union[str, NoneType], domain: Union[str, NoneType], path: Union[str, NoneType], expires: Union[float, NoneType], httpOnly: Union[bool, NoneType], secure: Union[bool, NoneType], sameSite: Union["Strict", "Lax", "None", NoneType]}]
         """
-
-        try:
-            log_api("=> browser_context.cookies started")
-            result = mapping.from_impl_list(await self._impl_obj.cookies(urls=urls))
-            log_api("<= browser_context.cookies succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.cookies failed")
-            raise e
+        return _from_impl_list(
+            await self._call_async(
+                "browser_context.cookies", self._impl_obj.cookies, urls=urls
+            )
+        )
 
     async def add_cookies(self, cookies: typing.List["Cookie"]) -> NoneType:
         """BrowserContext.add_cookies
@@ -7781,32 +6972,24 @@ class BrowserContext(AsyncBase):
         ----------
         cookies : List[{name: str, value: str, url: Union[str, NoneType], domain: Union[str, NoneType], path: Union[str, NoneType], expires: Union[float, NoneType], httpOnly: Union[bool, NoneType], secure: Union[bool, NoneType], sameSite: Union["Strict", "Lax", "None", NoneType]}]
         """
-
-        try:
-            log_api("=> browser_context.add_cookies started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.add_cookies(cookies=cookies)
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.add_cookies",
+                self._impl_obj.add_cookies,
+                cookies=cookies,
             )
-            log_api("<= browser_context.add_cookies succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.add_cookies failed")
-            raise e
+        )
 
     async def clear_cookies(self) -> NoneType:
         """BrowserContext.clear_cookies
 
         Clears context cookies.
         """
-
-        try:
-            log_api("=> browser_context.clear_cookies started")
-            result = mapping.from_maybe_impl(await self._impl_obj.clear_cookies())
-            log_api("<= browser_context.clear_cookies succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.clear_cookies failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.clear_cookies", self._impl_obj.clear_cookies
+            )
+        )
 
     async def grant_permissions(
         self, permissions: typing.List[str], origin: str = None
@@ -7839,34 +7022,25 @@ class BrowserContext(AsyncBase):
         origin : Union[str, NoneType]
             The [origin] to grant permissions to, e.g. "https://example.com".
         """
-
-        try:
-            log_api("=> browser_context.grant_permissions started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.grant_permissions(
-                    permissions=permissions, origin=origin
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.grant_permissions",
+                self._impl_obj.grant_permissions,
+                permissions=permissions,
+                origin=origin,
             )
-            log_api("<= browser_context.grant_permissions succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.grant_permissions failed")
-            raise e
+        )
 
     async def clear_permissions(self) -> NoneType:
         """BrowserContext.clear_permissions
 
         Clears all permission overrides for the browser context.
         """
-
-        try:
-            log_api("=> browser_context.clear_permissions started")
-            result = mapping.from_maybe_impl(await self._impl_obj.clear_permissions())
-            log_api("<= browser_context.clear_permissions succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.clear_permissions failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.clear_permissions", self._impl_obj.clear_permissions
+            )
+        )
 
     async def set_geolocation(
         self, latitude: float, longitude: float, accuracy: float = None
@@ -7887,30 +7061,22 @@ class BrowserContext(AsyncBase):
         accuracy : Union[float, NoneType]
             Non-negative accuracy value. Defaults to `0`.
         """
-
-        try:
-            log_api("=> browser_context.set_geolocation started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_geolocation(
-                    latitude=latitude, longitude=longitude, accuracy=accuracy
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.set_geolocation",
+                self._impl_obj.set_geolocation,
+                latitude=latitude,
+                longitude=longitude,
+                accuracy=accuracy,
             )
-            log_api("<= browser_context.set_geolocation succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_geolocation failed")
-            raise e
+        )
 
     async def reset_geolocation(self) -> NoneType:
-
-        try:
-            log_api("=> browser_context.reset_geolocation started")
-            result = mapping.from_maybe_impl(await self._impl_obj.reset_geolocation())
-            log_api("<= browser_context.reset_geolocation succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.reset_geolocation failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.reset_geolocation", self._impl_obj.reset_geolocation
+            )
+        )
 
     async def set_extra_http_headers(self, headers: typing.Dict[str, str]) -> NoneType:
         """BrowserContext.set_extra_http_headers
@@ -7926,19 +7092,13 @@ class BrowserContext(AsyncBase):
         headers : Dict[str, str]
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
-
-        try:
-            log_api("=> browser_context.set_extra_http_headers started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_extra_http_headers(
-                    headers=mapping.to_impl(headers)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.set_extra_http_headers",
+                self._impl_obj.set_extra_http_headers,
+                headers=mapping.to_impl(headers),
             )
-            log_api("<= browser_context.set_extra_http_headers succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_extra_http_headers failed")
-            raise e
+        )
 
     async def set_offline(self, offline: bool) -> NoneType:
         """BrowserContext.set_offline
@@ -7948,17 +7108,13 @@ class BrowserContext(AsyncBase):
         offline : bool
             Whether to emulate network being offline for the browser context.
         """
-
-        try:
-            log_api("=> browser_context.set_offline started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.set_offline(offline=offline)
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.set_offline",
+                self._impl_obj.set_offline,
+                offline=offline,
             )
-            log_api("<= browser_context.set_offline succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_offline failed")
-            raise e
+        )
 
     async def add_init_script(
         self, script: str = None, path: typing.Union[str, pathlib.Path] = None
@@ -7983,17 +7139,14 @@ class BrowserContext(AsyncBase):
         script : Union[str, NoneType]
             Script to be evaluated in all pages in the browser context.
         """
-
-        try:
-            log_api("=> browser_context.add_init_script started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.add_init_script(script=script, path=path)
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.add_init_script",
+                self._impl_obj.add_init_script,
+                script=script,
+                path=path,
             )
-            log_api("<= browser_context.add_init_script succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.add_init_script failed")
-            raise e
+        )
 
     async def expose_binding(
         self, name: str, callback: typing.Callable, handle: bool = None
@@ -8023,19 +7176,15 @@ class BrowserContext(AsyncBase):
             Whether to pass the argument as a handle, instead of passing by value. When passing a handle, only one argument is
             supported. When passing by value, multiple arguments are supported.
         """
-
-        try:
-            log_api("=> browser_context.expose_binding started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.expose_binding(
-                    name=name, callback=self._wrap_handler(callback), handle=handle
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.expose_binding",
+                self._impl_obj.expose_binding,
+                name=name,
+                callback=self._wrap_handler(callback),
+                handle=handle,
             )
-            log_api("<= browser_context.expose_binding succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.expose_binding failed")
-            raise e
+        )
 
     async def expose_function(self, name: str, callback: typing.Callable) -> NoneType:
         """BrowserContext.expose_function
@@ -8056,19 +7205,14 @@ class BrowserContext(AsyncBase):
         callback : Callable
             Callback function that will be called in the Playwright's context.
         """
-
-        try:
-            log_api("=> browser_context.expose_function started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.expose_function(
-                    name=name, callback=self._wrap_handler(callback)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.expose_function",
+                self._impl_obj.expose_function,
+                name=name,
+                callback=self._wrap_handler(callback),
             )
-            log_api("<= browser_context.expose_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.expose_function failed")
-            raise e
+        )
 
     async def route(
         self,
@@ -8099,19 +7243,14 @@ class BrowserContext(AsyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any]]
             handler function to route the request.
         """
-
-        try:
-            log_api("=> browser_context.route started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.route(
-                    url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.route",
+                self._impl_obj.route,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= browser_context.route succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.route failed")
-            raise e
+        )
 
     async def unroute(
         self,
@@ -8134,19 +7273,14 @@ class BrowserContext(AsyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any], NoneType]
             Optional handler function used to register a routing with `browser_context.route()`.
         """
-
-        try:
-            log_api("=> browser_context.unroute started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.unroute(
-                    url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.unroute",
+                self._impl_obj.unroute,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= browser_context.unroute succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.unroute failed")
-            raise e
+        )
 
     async def wait_for_event(
         self,
@@ -8173,21 +7307,15 @@ class BrowserContext(AsyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> browser_context.wait_for_event started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.wait_for_event(
-                    event=event,
-                    predicate=self._wrap_handler(predicate),
-                    timeout=timeout,
-                )
+        return _from_maybe_impl(
+            await self._call_async(
+                "browser_context.wait_for_event",
+                self._impl_obj.wait_for_event,
+                event=event,
+                predicate=self._wrap_handler(predicate),
+                timeout=timeout,
             )
-            log_api("<= browser_context.wait_for_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.wait_for_event failed")
-            raise e
+        )
 
     async def close(self) -> NoneType:
         """BrowserContext.close
@@ -8196,15 +7324,9 @@ class BrowserContext(AsyncBase):
 
         > **NOTE** the default browser context cannot be closed.
         """
-
-        try:
-            log_api("=> browser_context.close started")
-            result = mapping.from_maybe_impl(await self._impl_obj.close())
-            log_api("<= browser_context.close succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.close failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("browser_context.close", self._impl_obj.close)
+        )
 
     async def storage_state(
         self, path: typing.Union[str, pathlib.Path] = None
@@ -8224,15 +7346,11 @@ class BrowserContext(AsyncBase):
         -------
         {cookies: Union[List[{name: str, value: str, url: Union[str, NoneType], domain: Union[str, NoneType], path: Union[str, NoneType], expires: Union[float, NoneType], httpOnly: Union[bool, NoneType], secure: Union[bool, NoneType], sameSite: Union["Strict", "Lax", "None", NoneType]}], NoneType], origins: Union[List[Dict], NoneType]}
         """
-
-        try:
-            log_api("=> browser_context.storage_state started")
-            result = mapping.from_impl(await self._impl_obj.storage_state(path=path))
-            log_api("<= browser_context.storage_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.storage_state failed")
-            raise e
+        return _from_impl(
+            await self._call_async(
+                "browser_context.storage_state", self._impl_obj.storage_state, path=path
+            )
+        )
 
     def expect_event(
         self,
@@ -8287,9 +7405,8 @@ class BrowserContext(AsyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "page"
         return AsyncEventContextManager(
-            self._impl_obj.wait_for_event(event, predicate, timeout)
+            self._impl_obj.wait_for_event("page", predicate, timeout)
         )
 
 
@@ -8297,6 +7414,8 @@ mapping.register(BrowserContextImpl, BrowserContext)
 
 
 class CDPSession(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: CDPSessionImpl):
         super().__init__(obj)
 
@@ -8314,17 +7433,14 @@ class CDPSession(AsyncBase):
         -------
         Dict
         """
-
-        try:
-            log_api("=> cdp_session.send started")
-            result = mapping.from_maybe_impl(
-                await self._impl_obj.send(method=method, params=mapping.to_impl(params))
+        return _from_maybe_impl(
+            await self._call_async(
+                "cdp_session.send",
+                self._impl_obj.send,
+                method=method,
+                params=mapping.to_impl(params),
             )
-            log_api("<= cdp_session.send succeded")
-            return result
-        except Exception as e:
-            log_api("<= cdp_session.send failed")
-            raise e
+        )
 
     async def detach(self) -> NoneType:
         """CDPSession.detach
@@ -8332,21 +7448,17 @@ class CDPSession(AsyncBase):
         Detaches the CDPSession from the target. Once detached, the CDPSession object won't emit any events and can't be used to
         send messages.
         """
-
-        try:
-            log_api("=> cdp_session.detach started")
-            result = mapping.from_maybe_impl(await self._impl_obj.detach())
-            log_api("<= cdp_session.detach succeded")
-            return result
-        except Exception as e:
-            log_api("<= cdp_session.detach failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("cdp_session.detach", self._impl_obj.detach)
+        )
 
 
 mapping.register(CDPSessionImpl, CDPSession)
 
 
 class ChromiumBrowserContext(BrowserContext):
+    __slots__ = ()
+
     def __init__(self, obj: ChromiumBrowserContextImpl):
         super().__init__(obj)
 
@@ -8359,15 +7471,12 @@ class ChromiumBrowserContext(BrowserContext):
         -------
         List[Page]
         """
-
-        try:
-            log_api("=> chromium_browser_context.background_pages started")
-            result = mapping.from_impl_list(self._impl_obj.background_pages())
-            log_api("<= chromium_browser_context.background_pages succeded")
-            return result
-        except Exception as e:
-            log_api("<= chromium_browser_context.background_pages failed")
-            raise e
+        return _from_impl_list(
+            self._call(
+                "chromium_browser_context.background_pages",
+                self._impl_obj.background_pages,
+            )
+        )
 
     def service_workers(self) -> typing.List["Worker"]:
         """ChromiumBrowserContext.service_workers
@@ -8378,15 +7487,12 @@ class ChromiumBrowserContext(BrowserContext):
         -------
         List[Worker]
         """
-
-        try:
-            log_api("=> chromium_browser_context.service_workers started")
-            result = mapping.from_impl_list(self._impl_obj.service_workers())
-            log_api("<= chromium_browser_context.service_workers succeded")
-            return result
-        except Exception as e:
-            log_api("<= chromium_browser_context.service_workers failed")
-            raise e
+        return _from_impl_list(
+            self._call(
+                "chromium_browser_context.service_workers",
+                self._impl_obj.service_workers,
+            )
+        )
 
     async def new_cdp_session(self, page: "Page") -> "CDPSession":
         """ChromiumBrowserContext.new_cdp_session
@@ -8402,23 +7508,21 @@ class ChromiumBrowserContext(BrowserContext):
         -------
         CDPSession
         """
-
-        try:
-            log_api("=> chromium_browser_context.new_cdp_session started")
-            result = mapping.from_impl(
-                await self._impl_obj.new_cdp_session(page=page._impl_obj)
+        return _from_impl(
+            await self._call_async(
+                "chromium_browser_context.new_cdp_session",
+                self._impl_obj.new_cdp_session,
+                page=page._impl_obj,
             )
-            log_api("<= chromium_browser_context.new_cdp_session succeded")
-            return result
-        except Exception as e:
-            log_api("<= chromium_browser_context.new_cdp_session failed")
-            raise e
+        )
 
 
 mapping.register(ChromiumBrowserContextImpl, ChromiumBrowserContext)
 
 
 class Browser(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BrowserImpl):
         super().__init__(obj)
 
@@ -8432,7 +7536,7 @@ class Browser(AsyncBase):
         -------
         List[BrowserContext]
         """
-        return mapping.from_impl_list(self._impl_obj.contexts)
+        return _from_impl_list(self._impl_obj.contexts)
 
     @property
     def version(self) -> str:
@@ -8444,7 +7548,7 @@ class Browser(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.version)
+        return _from_maybe_impl(self._impl_obj.version)
 
     def is_connected(self) -> bool:
         """Browser.is_connected
@@ -8455,15 +7559,9 @@ class Browser(AsyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> browser.is_connected started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_connected())
-            log_api("<= browser.is_connected succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.is_connected failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("browser.is_connected", self._impl_obj.is_connected)
+        )
 
     async def new_context(
         self,
@@ -8560,42 +7658,36 @@ class Browser(AsyncBase):
         -------
         BrowserContext
         """
-
-        try:
-            log_api("=> browser.new_context started")
-            result = mapping.from_impl(
-                await self._impl_obj.new_context(
-                    viewport=viewport,
-                    ignoreHTTPSErrors=ignore_https_errors,
-                    javaScriptEnabled=java_script_enabled,
-                    bypassCSP=bypass_csp,
-                    userAgent=user_agent,
-                    locale=locale,
-                    timezoneId=timezone_id,
-                    geolocation=geolocation,
-                    permissions=permissions,
-                    extraHTTPHeaders=mapping.to_impl(extra_http_headers),
-                    offline=offline,
-                    httpCredentials=http_credentials,
-                    deviceScaleFactor=device_scale_factor,
-                    isMobile=is_mobile,
-                    hasTouch=has_touch,
-                    colorScheme=color_scheme,
-                    acceptDownloads=accept_downloads,
-                    defaultBrowserType=default_browser_type,
-                    proxy=proxy,
-                    recordHarPath=record_har_path,
-                    recordHarOmitContent=record_har_omit_content,
-                    recordVideoDir=record_video_dir,
-                    recordVideoSize=record_video_size,
-                    storageState=storage_state,
-                )
-            )
-            log_api("<= browser.new_context succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.new_context failed")
-            raise e
+        return _from_impl(
+            await self._call_async(
+                "browser.new_context",
+                self._impl_obj.new_context,
+                viewport=viewport,
+                ignoreHTTPSErrors=ignore_https_errors,
+                javaScriptEnabled=java_script_enabled,
+                bypassCSP=bypass_csp,
+                userAgent=user_agent,
+                locale=locale,
+                timezoneId=timezone_id,
+                geolocation=geolocation,
+                permissions=permissions,
+                extraHTTPHeaders=mapping.to_impl(extra_http_headers),
+                offline=offline,
+                httpCredentials=http_credentials,
+                deviceScaleFactor=device_scale_factor,
+                isMobile=is_mobile,
+                hasTouch=has_touch,
+                colorScheme=color_scheme,
+                acceptDownloads=accept_downloads,
+                defaultBrowserType=default_browser_type,
+                proxy=proxy,
+                recordHarPath=record_har_path,
+                recordHarOmitContent=record_har_omit_content,
+                recordVideoDir=record_video_dir,
+                recordVideoSize=record_video_size,
+                storageState=storage_state,
+            )
+        )
 
     async def new_page(
         self,
@@ -8696,42 +7788,36 @@ class Browser(AsyncBase):
         -------
         Page
         """
-
-        try:
-            log_api("=> browser.new_page started")
-            result = mapping.from_impl(
-                await self._impl_obj.new_page(
-                    viewport=viewport,
-                    ignoreHTTPSErrors=ignore_https_errors,
-                    javaScriptEnabled=java_script_enabled,
-                    bypassCSP=bypass_csp,
-                    userAgent=user_agent,
-                    locale=locale,
-                    timezoneId=timezone_id,
-                    geolocation=geolocation,
-                    permissions=permissions,
-                    extraHTTPHeaders=mapping.to_impl(extra_http_headers),
-                    offline=offline,
-                    httpCredentials=http_credentials,
-                    deviceScaleFactor=device_scale_factor,
-                    isMobile=is_mobile,
-                    hasTouch=has_touch,
-                    colorScheme=color_scheme,
-                    acceptDownloads=accept_downloads,
-                    defaultBrowserType=default_browser_type,
-                    proxy=proxy,
-                    recordHarPath=record_har_path,
-                    recordHarOmitContent=record_har_omit_content,
-                    recordVideoDir=record_video_dir,
-                    recordVideoSize=record_video_size,
-                    storageState=storage_state,
-                )
-            )
-            log_api("<= browser.new_page succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.new_page failed")
-            raise e
+        return _from_impl(
+            await self._call_async(
+                "browser.new_page",
+                self._impl_obj.new_page,
+                viewport=viewport,
+                ignoreHTTPSErrors=ignore_https_errors,
+                javaScriptEnabled=java_script_enabled,
+                bypassCSP=bypass_csp,
+                userAgent=user_agent,
+                locale=locale,
+                timezoneId=timezone_id,
+                geolocation=geolocation,
+                permissions=permissions,
+                extraHTTPHeaders=mapping.to_impl(extra_http_headers),
+                offline=offline,
+                httpCredentials=http_credentials,
+                deviceScaleFactor=device_scale_factor,
+                isMobile=is_mobile,
+                hasTouch=has_touch,
+                colorScheme=color_scheme,
+                acceptDownloads=accept_downloads,
+                defaultBrowserType=default_browser_type,
+                proxy=proxy,
+                recordHarPath=record_har_path,
+                recordHarOmitContent=record_har_omit_content,
+                recordVideoDir=record_video_dir,
+                recordVideoSize=record_video_size,
+                storageState=storage_state,
+            )
+        )
 
     async def close(self) -> NoneType:
         """Browser.close
@@ -8744,21 +7830,17 @@ class Browser(AsyncBase):
 
         The `Browser` object itself is considered to be disposed and cannot be used anymore.
         """
-
-        try:
-            log_api("=> browser.close started")
-            result = mapping.from_maybe_impl(await self._impl_obj.close())
-            log_api("<= browser.close succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.close failed")
-            raise e
+        return _from_maybe_impl(
+            await self._call_async("browser.close", self._impl_obj.close)
+        )
 
 
 mapping.register(BrowserImpl, Browser)
 
 
 class BrowserType(AsyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BrowserTypeImpl):
         super().__init__(obj)
 
@@ -8772,7 +7854,7 @@ class BrowserType(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return _from_maybe_impl(self._impl_obj.name)
 
     @property
     def executable_path(self) -> str:
@@ -8784,7 +7866,7 @@ class BrowserType(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.executable_path)
+        return _from_maybe_impl(self._impl_obj.executable_path)
 
     async def launch(
         self,
@@ -8875,33 +7957,27 @@ class BrowserType(AsyncBase):
         -------
         Browser
         """
-
-        try:
-            log_api("=> browser_type.launch started")
-            result = mapping.from_impl(
-                await self._impl_obj.launch(
-                    executablePath=executable_path,
-                    args=args,
-                    ignoreDefaultArgs=ignore_default_args,
-                    handleSIGINT=handle_sigint,
-                    handleSIGTERM=handle_sigterm,
-                    handleSIGHUP=handle_sighup,
-                    timeout=timeout,
-                    env=mapping.to_impl(env),
-                    headless=headless,
-                    devtools=devtools,
-                    proxy=proxy,
-                    downloadsPath=downloads_path,
-                    slowMo=slow_mo,
-                    chromiumSandbox=chromium_sandbox,
-                    firefoxUserPrefs=mapping.to_impl(firefox_user_prefs),
-                )
-            )
-            log_api("<= browser_type.launch succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_type.launch failed")
-            raise e
+        return _from_impl(
+            await self._call_async(
+                "browser_type.launch",
+                self._impl_obj.launch,
+                executablePath=executable_path,
+                args=args,
+                ignoreDefaultArgs=ignore_default_args,
+                handleSIGINT=handle_sigint,
+                handleSIGTERM=handle_sigterm,
+                handleSIGHUP=handle_sighup,
+                timeout=timeout,
+                env=mapping.to_impl(env),
+                headless=headless,
+                devtools=devtools,
+                proxy=proxy,
+                downloadsPath=downloads_path,
+                slowMo=slow_mo,
+                chromiumSandbox=chromium_sandbox,
+                firefoxUserPrefs=mapping.to_impl(firefox_user_prefs),
+            )
+        )
 
     async def launch_persistent_context(
         self,
@@ -9048,54 +8124,48 @@ class BrowserType(AsyncBase):
         -------
         BrowserContext
         """
-
-        try:
-            log_api("=> browser_type.launch_persistent_context started")
-            result = mapping.from_impl(
-                await self._impl_obj.launch_persistent_context(
-                    userDataDir=user_data_dir,
-                    executablePath=executable_path,
-                    args=args,
-                    ignoreDefaultArgs=ignore_default_args,
-                    handleSIGINT=handle_sigint,
-                    handleSIGTERM=handle_sigterm,
-                    handleSIGHUP=handle_sighup,
-                    timeout=timeout,
-                    env=mapping.to_impl(env),
-                    headless=headless,
-                    devtools=devtools,
-                    proxy=proxy,
-                    downloadsPath=downloads_path,
-                    slowMo=slow_mo,
-                    viewport=viewport,
-                    ignoreHTTPSErrors=ignore_https_errors,
-                    javaScriptEnabled=java_script_enabled,
-                    bypassCSP=bypass_csp,
-                    userAgent=user_agent,
-                    locale=locale,
-                    timezoneId=timezone_id,
-                    geolocation=geolocation,
-                    permissions=permissions,
-                    extraHTTPHeaders=mapping.to_impl(extra_http_headers),
-                    offline=offline,
-                    httpCredentials=http_credentials,
-                    deviceScaleFactor=device_scale_factor,
-                    isMobile=is_mobile,
-                    hasTouch=has_touch,
-                    colorScheme=color_scheme,
-                    acceptDownloads=accept_downloads,
-                    chromiumSandbox=chromium_sandbox,
-                    recordHarPath=record_har_path,
-                    recordHarOmitContent=record_har_omit_content,
-                    recordVideoDir=record_video_dir,
-                    recordVideoSize=record_video_size,
-                )
-            )
-            log_api("<= browser_type.launch_persistent_context succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_type.launch_persistent_context failed")
-            raise e
+        return _from_impl(
+            await self._call_async(
+                "browser_type.launch_persistent_context",
+                self._impl_obj.launch_persistent_context,
+                userDataDir=user_data_dir,
+                executablePath=executable_path,
+                args=args,
+                ignoreDefaultArgs=ignore_default_args,
+                handleSIGINT=handle_sigint,
+                handleSIGTERM=handle_sigterm,
+                handleSIGHUP=handle_sighup,
+                timeout=timeout,
+                env=mapping.to_impl(env),
+                headless=headless,
+                devtools=devtools,
+                proxy=proxy,
+                downloadsPath=downloads_path,
+                slowMo=slow_mo,
+                viewport=viewport,
+                ignoreHTTPSErrors=ignore_https_errors,
+                javaScriptEnabled=java_script_enabled,
+                bypassCSP=bypass_csp,
+                userAgent=user_agent,
+                locale=locale,
+                timezoneId=timezone_id,
+                geolocation=geolocation,
+                permissions=permissions,
+                extraHTTPHeaders=mapping.to_impl(extra_http_headers),
+                offline=offline,
+                httpCredentials=http_credentials,
+                deviceScaleFactor=device_scale_factor,
+                isMobile=is_mobile,
+                hasTouch=has_touch,
+                colorScheme=color_scheme,
+                acceptDownloads=accept_downloads,
+                chromiumSandbox=chromium_sandbox,
+                recordHarPath=record_har_path,
+                recordHarOmitContent=record_har_omit_content,
+                recordVideoDir=record_video_dir,
+                recordVideoSize=record_video_size,
+            )
+        )
 
 
 mapping.register(BrowserTypeImpl, BrowserType)
@@ -9117,7 +8187,7 @@ class Playwright(AsyncBase):
         -------
         Dict[str, {user_agent: Union[str, NoneType], viewport: Union[typing.Tuple[int, int], NoneType], device_scale_factor: Union[int, NoneType], is_mobile: Union[bool, NoneType], has_touch: Union[bool, NoneType]}]
         """
-        return mapping.from_impl_dict(self._impl_obj.devices)
+        return _from_impl_dict(self._impl_obj.devices)
 
     @property
     def selectors(self) -> "Selectors":
@@ -9130,7 +8200,7 @@ class Playwright(AsyncBase):
         -------
         Selectors
         """
-        return mapping.from_impl(self._impl_obj.selectors)
+        return _from_impl(self._impl_obj.selectors)
 
     @property
     def chromium(self) -> "BrowserType":
@@ -9142,7 +8212,7 @@ class Playwright(AsyncBase):
         -------
         BrowserType
         """
-        return mapping.from_impl(self._impl_obj.chromium)
+        return _from_impl(self._impl_obj.chromium)
 
     @property
     def firefox(self) -> "BrowserType":
@@ -9154,7 +8224,7 @@ class Playwright(AsyncBase):
         -------
         BrowserType
         """
-        return mapping.from_impl(self._impl_obj.firefox)
+        return _from_impl(self._impl_obj.firefox)
 
     @property
     def webkit(self) -> "BrowserType":
@@ -9166,18 +8236,10 @@ class Playwright(AsyncBase):
         -------
         BrowserType
         """
-        return mapping.from_impl(self._impl_obj.webkit)
+        return _from_impl(self._impl_obj.webkit)
 
     def stop(self) -> NoneType:
-
-        try:
-            log_api("=> playwright.stop started")
-            result = mapping.from_maybe_impl(self._impl_obj.stop())
-            log_api("<= playwright.stop succeded")
-            return result
-        except Exception as e:
-            log_api("<= playwright.stop failed")
-            raise e
+        return _from_maybe_impl(self._call("playwright.stop", self._impl_obj.stop))
 
 
 mapping.register(PlaywrightImpl, Playwright)
@@ -50,7 +50,6 @@ from playwright._impl._input import Keyboard as KeyboardImpl
 from playwright._impl._input import Mouse as MouseImpl
 from playwright._impl._input import Touchscreen as TouchscreenImpl
 from playwright._impl._js_handle import JSHandle as JSHandleImpl
-from playwright._impl._logger import log_api
 from playwright._impl._network import Request as RequestImpl
 from playwright._impl._network import Response as ResponseImpl
 from playwright._impl._network import Route as RouteImpl
@@ -65,8 +64,16 @@ from playwright._impl._video import Video as VideoImpl
 
 NoneType = type(None)
 
+_from_maybe_impl = mapping.from_maybe_impl
+_from_impl = mapping.from_impl
+_from_impl_nullable = mapping.from_impl_nullable
+_from_impl_list = mapping.from_impl_list
+_from_impl_dict = mapping.from_impl_dict
+
 
 class Request(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: RequestImpl):
         super().__init__(obj)
 
@@ -80,7 +87,7 @@ class Request(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def resource_type(self) -> str:
@@ -94,7 +101,7 @@ class Request(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.resource_type)
+        return _from_maybe_impl(self._impl_obj.resource_type)
 
     @property
     def method(self) -> str:
@@ -106,7 +113,7 @@ class Request(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.method)
+        return _from_maybe_impl(self._impl_obj.method)
 
     @property
     def post_data(self) -> typing.Union[str, NoneType]:
@@ -118,7 +125,7 @@ class Request(SyncBase):
         -------
         Union[str, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data)
+        return _from_maybe_impl(self._impl_obj.post_data)
 
     @property
     def post_data_json(self) -> typing.Union[typing.Dict, NoneType]:
@@ -133,7 +140,7 @@ class Request(SyncBase):
         -------
         Union[Dict, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data_json)
+        return _from_maybe_impl(self._impl_obj.post_data_json)
 
     @property
     def post_data_buffer(self) -> typing.Union[bytes, NoneType]:
@@ -145,7 +152,7 @@ class Request(SyncBase):
         -------
         Union[bytes, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data_buffer)
+        return _from_maybe_impl(self._impl_obj.post_data_buffer)
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -157,7 +164,7 @@ class Request(SyncBase):
         -------
         Dict[str, str]
         """
-        return mapping.from_maybe_impl(self._impl_obj.headers)
+        return _from_maybe_impl(self._impl_obj.headers)
 
     @property
     def frame(self) -> "Frame":
@@ -169,7 +176,7 @@ class Request(SyncBase):
         -------
         Frame
         """
-        return mapping.from_impl(self._impl_obj.frame)
+        return _from_impl(self._impl_obj.frame)
 
     @property
     def is_navigation_request(self) -> bool:
@@ -181,7 +188,7 @@ class Request(SyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.is_navigation_request)
+        return _from_maybe_impl(self._impl_obj.is_navigation_request)
 
     @property
     def redirected_from(self) -> typing.Union["Request", NoneType]:
@@ -201,7 +208,7 @@ class Request(SyncBase):
         -------
         Union[Request, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.redirected_from)
+        return _from_impl_nullable(self._impl_obj.redirected_from)
 
     @property
     def redirected_to(self) -> typing.Union["Request", NoneType]:
@@ -215,7 +222,7 @@ class Request(SyncBase):
         -------
         Union[Request, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.redirected_to)
+        return _from_impl_nullable(self._impl_obj.redirected_to)
 
     @property
     def failure(self) -> typing.Union[str, NoneType]:
@@ -229,7 +236,7 @@ class Request(SyncBase):
         -------
         Union[str, NoneType]
         """
-        return mapping.from_maybe_impl(self._impl_obj.failure)
+        return _from_maybe_impl(self._impl_obj.failure)
 
     @property
     def timing(self) -> "ResourceTiming":
@@ -243,7 +250,7 @@ class Request(SyncBase):
         -------
         {startTime: float, domainLookupStart: float, domainLookupEnd: float, connectStart: float, secureConnectionStart: float, connectEnd: float, requestStart: float, responseStart: float, responseEnd: float}
         """
-        return mapping.from_impl(self._impl_obj.timing)
+        return _from_impl(self._impl_obj.timing)
 
     def response(self) -> typing.Union["Response", NoneType]:
         """Request.response
@@ -254,21 +261,17 @@ class Request(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> request.response started")
-            result = mapping.from_impl_nullable(self._sync(self._impl_obj.response()))
-            log_api("<= request.response succeded")
-            return result
-        except Exception as e:
-            log_api("<= request.response failed")
-            raise e
+        return _from_impl_nullable(
+            self._call_sync("request.response", self._impl_obj.response)
+        )
 
 
 mapping.register(RequestImpl, Request)
 
 
 class Response(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: ResponseImpl):
         super().__init__(obj)
 
@@ -282,7 +285,7 @@ class Response(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def ok(self) -> bool:
@@ -294,7 +297,7 @@ class Response(SyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.ok)
+        return _from_maybe_impl(self._impl_obj.ok)
 
     @property
     def status(self) -> int:
@@ -306,7 +309,7 @@ class Response(SyncBase):
         -------
         int
         """
-        return mapping.from_maybe_impl(self._impl_obj.status)
+        return _from_maybe_impl(self._impl_obj.status)
 
     @property
     def status_text(self) -> str:
@@ -318,7 +321,7 @@ class Response(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.status_text)
+        return _from_maybe_impl(self._impl_obj.status_text)
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -330,7 +333,7 @@ class Response(SyncBase):
         -------
         Dict[str, str]
         """
-        return mapping.from_maybe_impl(self._impl_obj.headers)
+        return _from_maybe_impl(self._impl_obj.headers)
 
     @property
     def request(self) -> "Request":
@@ -342,7 +345,7 @@ class Response(SyncBase):
         -------
         Request
         """
-        return mapping.from_impl(self._impl_obj.request)
+        return _from_impl(self._impl_obj.request)
 
     @property
     def frame(self) -> "Frame":
@@ -354,7 +357,7 @@ class Response(SyncBase):
         -------
         Frame
         """
-        return mapping.from_impl(self._impl_obj.frame)
+        return _from_impl(self._impl_obj.frame)
 
     def finished(self) -> typing.Union[str, NoneType]:
         """Response.finished
@@ -365,15 +368,9 @@ class Response(SyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> response.finished started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.finished()))
-            log_api("<= response.finished succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.finished failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("response.finished", self._impl_obj.finished)
+        )
 
     def body(self) -> bytes:
         """Response.body
@@ -384,15 +381,7 @@ class Response(SyncBase):
         -------
         bytes
         """
-
-        try:
-            log_api("=> response.body started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.body()))
-            log_api("<= response.body succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.body failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("response.body", self._impl_obj.body))
 
     def text(self) -> str:
         """Response.text
@@ -403,15 +392,7 @@ class Response(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> response.text started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.text()))
-            log_api("<= response.text succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.text failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("response.text", self._impl_obj.text))
 
     def json(self) -> typing.Union[typing.Dict, typing.List]:
         """Response.json
@@ -424,21 +405,15 @@ class Response(SyncBase):
         -------
         Union[Dict, List]
         """
-
-        try:
-            log_api("=> response.json started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.json()))
-            log_api("<= response.json succeded")
-            return result
-        except Exception as e:
-            log_api("<= response.json failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("response.json", self._impl_obj.json))
 
 
 mapping.register(ResponseImpl, Response)
 
 
 class Route(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: RouteImpl):
         super().__init__(obj)
 
@@ -452,7 +427,7 @@ class Route(SyncBase):
         -------
         Request
         """
-        return mapping.from_impl(self._impl_obj.request)
+        return _from_impl(self._impl_obj.request)
 
     def abort(self, error_code: str = None) -> NoneType:
         """Route.abort
@@ -480,17 +455,9 @@ class Route(SyncBase):
             - `'timedout'` - An operation timed out.
             - `'failed'` - A generic failure occurred.
         """
-
-        try:
-            log_api("=> route.abort started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.abort(errorCode=error_code))
-            )
-            log_api("<= route.abort succeded")
-            return result
-        except Exception as e:
-            log_api("<= route.abort failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("route.abort", self._impl_obj.abort, errorCode=error_code)
+        )
 
     def fulfill(
         self,
@@ -522,25 +489,17 @@ class Route(SyncBase):
         content_type : Union[str, NoneType]
             If set, equals to setting `Content-Type` response header.
         """
-
-        try:
-            log_api("=> route.fulfill started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.fulfill(
-                        status=status,
-                        headers=mapping.to_impl(headers),
-                        body=body,
-                        path=path,
-                        contentType=content_type,
-                    )
-                )
-            )
-            log_api("<= route.fulfill succeded")
-            return result
-        except Exception as e:
-            log_api("<= route.fulfill failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "route.fulfill",
+                self._impl_obj.fulfill,
+                status=status,
+                headers=mapping.to_impl(headers),
+                body=body,
+                path=path,
+                contentType=content_type,
+            )
+        )
 
     def continue_(
         self,
@@ -564,30 +523,24 @@ class Route(SyncBase):
         post_data : Union[bytes, str, NoneType]
             If set changes the post data of request
         """
-
-        try:
-            log_api("=> route.continue_ started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.continue_(
-                        url=url,
-                        method=method,
-                        headers=mapping.to_impl(headers),
-                        postData=post_data,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "route.continue_",
+                self._impl_obj.continue_,
+                url=url,
+                method=method,
+                headers=mapping.to_impl(headers),
+                postData=post_data,
             )
-            log_api("<= route.continue_ succeded")
-            return result
-        except Exception as e:
-            log_api("<= route.continue_ failed")
-            raise e
+        )
 
 
 mapping.register(RouteImpl, Route)
 
 
 class WebSocket(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: WebSocketImpl):
         super().__init__(obj)
 
@@ -601,7 +554,7 @@ class WebSocket(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     def wait_for_event(
         self,
@@ -630,23 +583,15 @@ class WebSocket(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> web_socket.wait_for_event started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.wait_for_event(
-                        event=event,
-                        predicate=self._wrap_handler(predicate),
-                        timeout=timeout,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "web_socket.wait_for_event",
+                self._impl_obj.wait_for_event,
+                event=event,
+                predicate=self._wrap_handler(predicate),
+                timeout=timeout,
             )
-            log_api("<= web_socket.wait_for_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= web_socket.wait_for_event failed")
-            raise e
+        )
 
     def expect_event(
         self,
@@ -686,21 +631,17 @@ class WebSocket(SyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> web_socket.is_closed started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_closed())
-            log_api("<= web_socket.is_closed succeded")
-            return result
-        except Exception as e:
-            log_api("<= web_socket.is_closed failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("web_socket.is_closed", self._impl_obj.is_closed)
+        )
 
 
 mapping.register(WebSocketImpl, WebSocket)
 
 
 class Keyboard(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: KeyboardImpl):
         super().__init__(obj)
 
@@ -737,15 +678,9 @@ class Keyboard(SyncBase):
         key : str
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
-
-        try:
-            log_api("=> keyboard.down started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.down(key=key)))
-            log_api("<= keyboard.down succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.down failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("keyboard.down", self._impl_obj.down, key=key)
+        )
 
     def up(self, key: str) -> NoneType:
         """Keyboard.up
@@ -757,15 +692,9 @@ class Keyboard(SyncBase):
         key : str
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
-
-        try:
-            log_api("=> keyboard.up started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.up(key=key)))
-            log_api("<= keyboard.up succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.up failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("keyboard.up", self._impl_obj.up, key=key)
+        )
 
     def insert_text(self, text: str) -> NoneType:
         """Keyboard.insert_text
@@ -779,17 +708,11 @@ class Keyboard(SyncBase):
         text : str
             Sets input to the specified text value.
         """
-
-        try:
-            log_api("=> keyboard.insert_text started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.insert_text(text=text))
+        return _from_maybe_impl(
+            self._call_sync(
+                "keyboard.insert_text", self._impl_obj.insert_text, text=text
             )
-            log_api("<= keyboard.insert_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.insert_text failed")
-            raise e
+        )
 
     def type(self, text: str, delay: float = None) -> NoneType:
         """Keyboard.type
@@ -807,17 +730,11 @@ class Keyboard(SyncBase):
         delay : Union[float, NoneType]
             Time to wait between key presses in milliseconds. Defaults to 0.
         """
-
-        try:
-            log_api("=> keyboard.type started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.type(text=text, delay=delay))
+        return _from_maybe_impl(
+            self._call_sync(
+                "keyboard.type", self._impl_obj.type, text=text, delay=delay
             )
-            log_api("<= keyboard.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.type failed")
-            raise e
+        )
 
     def press(self, key: str, delay: float = None) -> NoneType:
         """Keyboard.press
@@ -848,23 +765,19 @@ class Keyboard(SyncBase):
         delay : Union[float, NoneType]
             Time to wait between `keydown` and `keyup` in milliseconds. Defaults to 0.
         """
-
-        try:
-            log_api("=> keyboard.press started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.press(key=key, delay=delay))
+        return _from_maybe_impl(
+            self._call_sync(
+                "keyboard.press", self._impl_obj.press, key=key, delay=delay
             )
-            log_api("<= keyboard.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= keyboard.press failed")
-            raise e
+        )
 
 
 mapping.register(KeyboardImpl, Keyboard)
 
 
 class Mouse(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: MouseImpl):
         super().__init__(obj)
 
@@ -880,17 +793,9 @@ class Mouse(SyncBase):
         steps : Union[int, NoneType]
             defaults to 1. Sends intermediate `mousemove` events.
         """
-
-        try:
-            log_api("=> mouse.move started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.move(x=x, y=y, steps=steps))
-            )
-            log_api("<= mouse.move succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.move failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("mouse.move", self._impl_obj.move, x=x, y=y, steps=steps)
+        )
 
     def down(
         self, button: Literal["left", "middle", "right"] = None, click_count: int = None
@@ -906,17 +811,11 @@ class Mouse(SyncBase):
         click_count : Union[int, NoneType]
             defaults to 1. See [UIEvent.detail].
         """
-
-        try:
-            log_api("=> mouse.down started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.down(button=button, clickCount=click_count))
+        return _from_maybe_impl(
+            self._call_sync(
+                "mouse.down", self._impl_obj.down, button=button, clickCount=click_count
             )
-            log_api("<= mouse.down succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.down failed")
-            raise e
+        )
 
     def up(
         self, button: Literal["left", "middle", "right"] = None, click_count: int = None
@@ -932,17 +831,11 @@ class Mouse(SyncBase):
         click_count : Union[int, NoneType]
             defaults to 1. See [UIEvent.detail].
         """
-
-        try:
-            log_api("=> mouse.up started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.up(button=button, clickCount=click_count))
+        return _from_maybe_impl(
+            self._call_sync(
+                "mouse.up", self._impl_obj.up, button=button, clickCount=click_count
             )
-            log_api("<= mouse.up succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.up failed")
-            raise e
+        )
 
     def click(
         self,
@@ -967,21 +860,17 @@ class Mouse(SyncBase):
         click_count : Union[int, NoneType]
             defaults to 1. See [UIEvent.detail].
         """
-
-        try:
-            log_api("=> mouse.click started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.click(
-                        x=x, y=y, delay=delay, button=button, clickCount=click_count
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "mouse.click",
+                self._impl_obj.click,
+                x=x,
+                y=y,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
             )
-            log_api("<= mouse.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.click failed")
-            raise e
+        )
 
     def dblclick(
         self,
@@ -1004,25 +893,24 @@ class Mouse(SyncBase):
         button : Union["left", "middle", "right", NoneType]
             Defaults to `left`.
         """
-
-        try:
-            log_api("=> mouse.dblclick started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.dblclick(x=x, y=y, delay=delay, button=button)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "mouse.dblclick",
+                self._impl_obj.dblclick,
+                x=x,
+                y=y,
+                delay=delay,
+                button=button,
             )
-            log_api("<= mouse.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= mouse.dblclick failed")
-            raise e
+        )
 
 
 mapping.register(MouseImpl, Mouse)
 
 
 class Touchscreen(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: TouchscreenImpl):
         super().__init__(obj)
 
@@ -1036,21 +924,17 @@ class Touchscreen(SyncBase):
         x : float
         y : float
         """
-
-        try:
-            log_api("=> touchscreen.tap started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.tap(x=x, y=y)))
-            log_api("<= touchscreen.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= touchscreen.tap failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("touchscreen.tap", self._impl_obj.tap, x=x, y=y)
+        )
 
 
 mapping.register(TouchscreenImpl, Touchscreen)
 
 
 class JSHandle(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: JSHandleImpl):
         super().__init__(obj)
 
@@ -1081,23 +965,15 @@ class JSHandle(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> js_handle.evaluate started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.evaluate(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "js_handle.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= js_handle.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.evaluate failed")
-            raise e
+        )
 
     def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -1129,23 +1005,15 @@ class JSHandle(SyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> js_handle.evaluate_handle started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.evaluate_handle(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "js_handle.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= js_handle.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.evaluate_handle failed")
-            raise e
+        )
 
     def get_property(self, property_name: str) -> "JSHandle":
         """JSHandle.get_property
@@ -1161,17 +1029,13 @@ class JSHandle(SyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> js_handle.get_property started")
-            result = mapping.from_impl(
-                self._sync(self._impl_obj.get_property(propertyName=property_name))
+        return _from_impl(
+            self._call_sync(
+                "js_handle.get_property",
+                self._impl_obj.get_property,
+                propertyName=property_name,
             )
-            log_api("<= js_handle.get_property succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.get_property failed")
-            raise e
+        )
 
     def get_properties(self) -> typing.Dict[str, "JSHandle"]:
         """JSHandle.get_properties
@@ -1182,15 +1046,9 @@ class JSHandle(SyncBase):
         -------
         Dict[str, JSHandle]
         """
-
-        try:
-            log_api("=> js_handle.get_properties started")
-            result = mapping.from_impl_dict(self._sync(self._impl_obj.get_properties()))
-            log_api("<= js_handle.get_properties succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.get_properties failed")
-            raise e
+        return _from_impl_dict(
+            self._call_sync("js_handle.get_properties", self._impl_obj.get_properties)
+        )
 
     def as_element(self) -> typing.Union["ElementHandle", NoneType]:
         """JSHandle.as_element
@@ -1201,30 +1059,18 @@ class JSHandle(SyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> js_handle.as_element started")
-            result = mapping.from_impl_nullable(self._impl_obj.as_element())
-            log_api("<= js_handle.as_element succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.as_element failed")
-            raise e
+        return _from_impl_nullable(
+            self._call("js_handle.as_element", self._impl_obj.as_element)
+        )
 
     def dispose(self) -> NoneType:
         """JSHandle.dispose
 
         The `jsHandle.dispose` method stops referencing the element handle.
         """
-
-        try:
-            log_api("=> js_handle.dispose started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.dispose()))
-            log_api("<= js_handle.dispose succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.dispose failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("js_handle.dispose", self._impl_obj.dispose)
+        )
 
     def json_value(self) -> typing.Any:
         """JSHandle.json_value
@@ -1238,21 +1084,17 @@ class JSHandle(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> js_handle.json_value started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.json_value()))
-            log_api("<= js_handle.json_value succeded")
-            return result
-        except Exception as e:
-            log_api("<= js_handle.json_value failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("js_handle.json_value", self._impl_obj.json_value)
+        )
 
 
 mapping.register(JSHandleImpl, JSHandle)
 
 
 class ElementHandle(JSHandle):
+    __slots__ = ()
+
     def __init__(self, obj: ElementHandleImpl):
         super().__init__(obj)
 
@@ -1265,15 +1107,9 @@ class ElementHandle(JSHandle):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.as_element started")
-            result = mapping.from_impl_nullable(self._impl_obj.as_element())
-            log_api("<= element_handle.as_element succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.as_element failed")
-            raise e
+        return _from_impl_nullable(
+            self._call("element_handle.as_element", self._impl_obj.as_element)
+        )
 
     def owner_frame(self) -> typing.Union["Frame", NoneType]:
         """ElementHandle.owner_frame
@@ -1284,17 +1120,9 @@ class ElementHandle(JSHandle):
         -------
         Union[Frame, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.owner_frame started")
-            result = mapping.from_impl_nullable(
-                self._sync(self._impl_obj.owner_frame())
-            )
-            log_api("<= element_handle.owner_frame succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.owner_frame failed")
-            raise e
+        return _from_impl_nullable(
+            self._call_sync("element_handle.owner_frame", self._impl_obj.owner_frame)
+        )
 
     def content_frame(self) -> typing.Union["Frame", NoneType]:
         """ElementHandle.content_frame
@@ -1305,17 +1133,11 @@ class ElementHandle(JSHandle):
         -------
         Union[Frame, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.content_frame started")
-            result = mapping.from_impl_nullable(
-                self._sync(self._impl_obj.content_frame())
+        return _from_impl_nullable(
+            self._call_sync(
+                "element_handle.content_frame", self._impl_obj.content_frame
             )
-            log_api("<= element_handle.content_frame succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.content_frame failed")
-            raise e
+        )
 
     def get_attribute(self, name: str) -> typing.Union[str, NoneType]:
         """ElementHandle.get_attribute
@@ -1331,17 +1153,11 @@ class ElementHandle(JSHandle):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.get_attribute started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.get_attribute(name=name))
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.get_attribute", self._impl_obj.get_attribute, name=name
             )
-            log_api("<= element_handle.get_attribute succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.get_attribute failed")
-            raise e
+        )
 
     def text_content(self) -> typing.Union[str, NoneType]:
         """ElementHandle.text_content
@@ -1352,15 +1168,9 @@ class ElementHandle(JSHandle):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.text_content started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.text_content()))
-            log_api("<= element_handle.text_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.text_content failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("element_handle.text_content", self._impl_obj.text_content)
+        )
 
     def inner_text(self) -> str:
         """ElementHandle.inner_text
@@ -1371,15 +1181,9 @@ class ElementHandle(JSHandle):
         -------
         str
         """
-
-        try:
-            log_api("=> element_handle.inner_text started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.inner_text()))
-            log_api("<= element_handle.inner_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.inner_text failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("element_handle.inner_text", self._impl_obj.inner_text)
+        )
 
     def inner_html(self) -> str:
         """ElementHandle.inner_html
@@ -1390,15 +1194,9 @@ class ElementHandle(JSHandle):
         -------
         str
         """
-
-        try:
-            log_api("=> element_handle.inner_html started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.inner_html()))
-            log_api("<= element_handle.inner_html succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.inner_html failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("element_handle.inner_html", self._impl_obj.inner_html)
+        )
 
     def dispatch_event(self, type: str, event_init: typing.Dict = None) -> NoneType:
         """ElementHandle.dispatch_event
@@ -1428,21 +1226,14 @@ class ElementHandle(JSHandle):
         event_init : Union[Dict, NoneType]
             Optional event-specific initialization properties.
         """
-
-        try:
-            log_api("=> element_handle.dispatch_event started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.dispatch_event(
-                        type=type, eventInit=mapping.to_impl(event_init)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.dispatch_event",
+                self._impl_obj.dispatch_event,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
             )
-            log_api("<= element_handle.dispatch_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.dispatch_event failed")
-            raise e
+        )
 
     def scroll_into_view_if_needed(self, timeout: float = None) -> NoneType:
         """ElementHandle.scroll_into_view_if_needed
@@ -1460,17 +1251,13 @@ class ElementHandle(JSHandle):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> element_handle.scroll_into_view_if_needed started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.scroll_into_view_if_needed(timeout=timeout))
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.scroll_into_view_if_needed",
+                self._impl_obj.scroll_into_view_if_needed,
+                timeout=timeout,
             )
-            log_api("<= element_handle.scroll_into_view_if_needed succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.scroll_into_view_if_needed failed")
-            raise e
+        )
 
     def hover(
         self,
@@ -1508,24 +1295,16 @@ class ElementHandle(JSHandle):
         force : Union[bool, NoneType]
             Whether to bypass the [actionability](./actionability.md) checks. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.hover started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.hover(
-                        modifiers=modifiers,
-                        position=position,
-                        timeout=timeout,
-                        force=force,
-                    )
-                )
-            )
-            log_api("<= element_handle.hover succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.hover failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.hover",
+                self._impl_obj.hover,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+            )
+        )
 
     def click(
         self,
@@ -1577,28 +1356,20 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.click started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.click(
-                        modifiers=modifiers,
-                        position=position,
-                        delay=delay,
-                        button=button,
-                        clickCount=click_count,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= element_handle.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.click failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.click",
+                self._impl_obj.click,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def dblclick(
         self,
@@ -1650,27 +1421,19 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.dblclick started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.dblclick(
-                        modifiers=modifiers,
-                        position=position,
-                        delay=delay,
-                        button=button,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= element_handle.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.dblclick failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.dblclick",
+                self._impl_obj.dblclick,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def select_option(
         self,
@@ -1702,26 +1465,18 @@ class ElementHandle(JSHandle):
         -------
         List[str]
         """
-
-        try:
-            log_api("=> element_handle.select_option started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.select_option(
-                        value=value,
-                        index=index,
-                        label=label,
-                        element=mapping.to_impl(element),
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= element_handle.select_option succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.select_option failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.select_option",
+                self._impl_obj.select_option,
+                value=value,
+                index=index,
+                label=label,
+                element=mapping.to_impl(element),
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def tap(
         self,
@@ -1766,25 +1521,17 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.tap started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.tap(
-                        modifiers=modifiers,
-                        position=position,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= element_handle.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.tap failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.tap",
+                self._impl_obj.tap,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def fill(
         self, value: str, timeout: float = None, no_wait_after: bool = None
@@ -1807,21 +1554,15 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.fill started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.fill(
-                        value=value, timeout=timeout, noWaitAfter=no_wait_after
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.fill",
+                self._impl_obj.fill,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.fill succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.fill failed")
-            raise e
+        )
 
     def select_text(self, timeout: float = None) -> NoneType:
         """ElementHandle.select_text
@@ -1835,17 +1576,13 @@ class ElementHandle(JSHandle):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> element_handle.select_text started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.select_text(timeout=timeout))
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.select_text",
+                self._impl_obj.select_text,
+                timeout=timeout,
             )
-            log_api("<= element_handle.select_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.select_text failed")
-            raise e
+        )
 
     def set_input_files(
         self,
@@ -1879,36 +1616,24 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.set_input_files started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_input_files(
-                        files=files, timeout=timeout, noWaitAfter=no_wait_after
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.set_input_files",
+                self._impl_obj.set_input_files,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.set_input_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.set_input_files failed")
-            raise e
+        )
 
     def focus(self) -> NoneType:
         """ElementHandle.focus
 
         Calls [focus](https://developer.mozilla.org/en-US/docs/Web/API/HTMLElement/focus) on the element.
         """
-
-        try:
-            log_api("=> element_handle.focus started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.focus()))
-            log_api("<= element_handle.focus succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.focus failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("element_handle.focus", self._impl_obj.focus)
+        )
 
     def type(
         self,
@@ -1939,24 +1664,16 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.type started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.type(
-                        text=text,
-                        delay=delay,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= element_handle.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.type failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.type",
+                self._impl_obj.type,
+                text=text,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def press(
         self,
@@ -2000,21 +1717,16 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.press started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.press(
-                        key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.press",
+                self._impl_obj.press,
+                key=key,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.press failed")
-            raise e
+        )
 
     def check(
         self, timeout: float = None, force: bool = None, no_wait_after: bool = None
@@ -2047,21 +1759,15 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.check started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.check(
-                        timeout=timeout, force=force, noWaitAfter=no_wait_after
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.check",
+                self._impl_obj.check,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.check succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.check failed")
-            raise e
+        )
 
     def uncheck(
         self, timeout: float = None, force: bool = None, no_wait_after: bool = None
@@ -2094,21 +1800,15 @@ class ElementHandle(JSHandle):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> element_handle.uncheck started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.uncheck(
-                        timeout=timeout, force=force, noWaitAfter=no_wait_after
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.uncheck",
+                self._impl_obj.uncheck,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= element_handle.uncheck succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.uncheck failed")
-            raise e
+        )
 
     def bounding_box(self) -> typing.Union["FloatRect", NoneType]:
         """ElementHandle.bounding_box
@@ -2130,17 +1830,9 @@ class ElementHandle(JSHandle):
         -------
         Union[{x: float, y: float, width: float, height: float}, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.bounding_box started")
-            result = mapping.from_impl_nullable(
-                self._sync(self._impl_obj.bounding_box())
-            )
-            log_api("<= element_handle.bounding_box succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.bounding_box failed")
-            raise e
+        return _from_impl_nullable(
+            self._call_sync("element_handle.bounding_box", self._impl_obj.bounding_box)
+        )
 
     def screenshot(
         self,
@@ -2178,25 +1870,17 @@ class ElementHandle(JSHandle):
         -------
         bytes
         """
-
-        try:
-            log_api("=> element_handle.screenshot started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.screenshot(
-                        timeout=timeout,
-                        type=type,
-                        path=path,
-                        quality=quality,
-                        omitBackground=omit_background,
-                    )
-                )
-            )
-            log_api("<= element_handle.screenshot succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.screenshot failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.screenshot",
+                self._impl_obj.screenshot,
+                timeout=timeout,
+                type=type,
+                path=path,
+                quality=quality,
+                omitBackground=omit_background,
+            )
+        )
 
     def query_selector(self, selector: str) -> typing.Union["ElementHandle", NoneType]:
         """ElementHandle.query_selector
@@ -2214,17 +1898,13 @@ class ElementHandle(JSHandle):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.query_selector started")
-            result = mapping.from_impl_nullable(
-                self._sync(self._impl_obj.query_selector(selector=selector))
+        return _from_impl_nullable(
+            self._call_sync(
+                "element_handle.query_selector",
+                self._impl_obj.query_selector,
+                selector=selector,
             )
-            log_api("<= element_handle.query_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.query_selector failed")
-            raise e
+        )
 
     def query_selector_all(self, selector: str) -> typing.List["ElementHandle"]:
         """ElementHandle.query_selector_all
@@ -2242,17 +1922,13 @@ class ElementHandle(JSHandle):
         -------
         List[ElementHandle]
         """
-
-        try:
-            log_api("=> element_handle.query_selector_all started")
-            result = mapping.from_impl_list(
-                self._sync(self._impl_obj.query_selector_all(selector=selector))
+        return _from_impl_list(
+            self._call_sync(
+                "element_handle.query_selector_all",
+                self._impl_obj.query_selector_all,
+                selector=selector,
             )
-            log_api("<= element_handle.query_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.query_selector_all failed")
-            raise e
+        )
 
     def eval_on_selector(
         self,
@@ -2288,24 +1964,16 @@ class ElementHandle(JSHandle):
         -------
         Any
         """
-
-        try:
-            log_api("=> element_handle.eval_on_selector started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.eval_on_selector(
-                        selector=selector,
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
-            )
-            log_api("<= element_handle.eval_on_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.eval_on_selector failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.eval_on_selector",
+                self._impl_obj.eval_on_selector,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+            )
+        )
 
     def eval_on_selector_all(
         self,
@@ -2348,24 +2016,16 @@ class ElementHandle(JSHandle):
         -------
         Any
         """
-
-        try:
-            log_api("=> element_handle.eval_on_selector_all started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.eval_on_selector_all(
-                        selector=selector,
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
-            )
-            log_api("<= element_handle.eval_on_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.eval_on_selector_all failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.eval_on_selector_all",
+                self._impl_obj.eval_on_selector_all,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+            )
+        )
 
     def wait_for_element_state(
         self,
@@ -2396,19 +2056,14 @@ class ElementHandle(JSHandle):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> element_handle.wait_for_element_state started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.wait_for_element_state(state=state, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "element_handle.wait_for_element_state",
+                self._impl_obj.wait_for_element_state,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= element_handle.wait_for_element_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.wait_for_element_state failed")
-            raise e
+        )
 
     def wait_for_selector(
         self,
@@ -2448,27 +2103,23 @@ class ElementHandle(JSHandle):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> element_handle.wait_for_selector started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.wait_for_selector(
-                        selector=selector, state=state, timeout=timeout
-                    )
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "element_handle.wait_for_selector",
+                self._impl_obj.wait_for_selector,
+                selector=selector,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= element_handle.wait_for_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= element_handle.wait_for_selector failed")
-            raise e
+        )
 
 
 mapping.register(ElementHandleImpl, ElementHandle)
 
 
 class Accessibility(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: AccessibilityImpl):
         super().__init__(obj)
 
@@ -2498,27 +2149,22 @@ class Accessibility(SyncBase):
         -------
         Union[Dict, NoneType]
         """
-
-        try:
-            log_api("=> accessibility.snapshot started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.snapshot(
-                        interestingOnly=interesting_only, root=mapping.to_impl(root)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "accessibility.snapshot",
+                self._impl_obj.snapshot,
+                interestingOnly=interesting_only,
+                root=mapping.to_impl(root),
             )
-            log_api("<= accessibility.snapshot succeded")
-            return result
-        except Exception as e:
-            log_api("<= accessibility.snapshot failed")
-            raise e
+        )
 
 
 mapping.register(AccessibilityImpl, Accessibility)
 
 
 class FileChooser(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: FileChooserImpl):
         super().__init__(obj)
 
@@ -2532,7 +2178,7 @@ class FileChooser(SyncBase):
         -------
         Page
         """
-        return mapping.from_impl(self._impl_obj.page)
+        return _from_impl(self._impl_obj.page)
 
     @property
     def element(self) -> "ElementHandle":
@@ -2544,7 +2190,7 @@ class FileChooser(SyncBase):
         -------
         ElementHandle
         """
-        return mapping.from_impl(self._impl_obj.element)
+        return _from_impl(self._impl_obj.element)
 
     @property
     def is_multiple(self) -> bool:
@@ -2556,7 +2202,7 @@ class FileChooser(SyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.is_multiple)
+        return _from_maybe_impl(self._impl_obj.is_multiple)
 
     def set_files(
         self,
@@ -2582,27 +2228,23 @@ class FileChooser(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> file_chooser.set_files started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_files(
-                        files=files, timeout=timeout, noWaitAfter=no_wait_after
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "file_chooser.set_files",
+                self._impl_obj.set_files,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
-            log_api("<= file_chooser.set_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= file_chooser.set_files failed")
-            raise e
+        )
 
 
 mapping.register(FileChooserImpl, FileChooser)
 
 
 class Frame(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: FrameImpl):
         super().__init__(obj)
 
@@ -2616,7 +2258,7 @@ class Frame(SyncBase):
         -------
         Page
         """
-        return mapping.from_impl(self._impl_obj.page)
+        return _from_impl(self._impl_obj.page)
 
     @property
     def name(self) -> str:
@@ -2633,7 +2275,7 @@ class Frame(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return _from_maybe_impl(self._impl_obj.name)
 
     @property
     def url(self) -> str:
@@ -2645,7 +2287,7 @@ class Frame(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def parent_frame(self) -> typing.Union["Frame", NoneType]:
@@ -2657,7 +2299,7 @@ class Frame(SyncBase):
         -------
         Union[Frame, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.parent_frame)
+        return _from_impl_nullable(self._impl_obj.parent_frame)
 
     @property
     def child_frames(self) -> typing.List["Frame"]:
@@ -2667,7 +2309,7 @@ class Frame(SyncBase):
         -------
         List[Frame]
         """
-        return mapping.from_impl_list(self._impl_obj.child_frames)
+        return _from_impl_list(self._impl_obj.child_frames)
 
     def goto(
         self,
@@ -2719,21 +2361,16 @@ class Frame(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> frame.goto started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.goto(
-                        url=url, timeout=timeout, waitUntil=wait_until, referer=referer
-                    )
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "frame.goto",
+                self._impl_obj.goto,
+                url=url,
+                timeout=timeout,
+                waitUntil=wait_until,
+                referer=referer,
             )
-            log_api("<= frame.goto succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.goto failed")
-            raise e
+        )
 
     def wait_for_navigation(
         self,
@@ -2772,23 +2409,15 @@ class Frame(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> frame.wait_for_navigation started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.wait_for_navigation(
-                        url=self._wrap_handler(url),
-                        waitUntil=wait_until,
-                        timeout=timeout,
-                    )
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "frame.wait_for_navigation",
+                self._impl_obj.wait_for_navigation,
+                url=self._wrap_handler(url),
+                waitUntil=wait_until,
+                timeout=timeout,
             )
-            log_api("<= frame.wait_for_navigation succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_navigation failed")
-            raise e
+        )
 
     def wait_for_load_state(
         self,
@@ -2816,19 +2445,14 @@ class Frame(SyncBase):
             `browser_context.set_default_timeout()`, `page.set_default_navigation_timeout()` or
             `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> frame.wait_for_load_state started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.wait_for_load_state",
+                self._impl_obj.wait_for_load_state,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= frame.wait_for_load_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_load_state failed")
-            raise e
+        )
 
     def frame_element(self) -> "ElementHandle":
         """Frame.frame_element
@@ -2844,15 +2468,9 @@ class Frame(SyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> frame.frame_element started")
-            result = mapping.from_impl(self._sync(self._impl_obj.frame_element()))
-            log_api("<= frame.frame_element succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.frame_element failed")
-            raise e
+        return _from_impl(
+            self._call_sync("frame.frame_element", self._impl_obj.frame_element)
+        )
 
     def evaluate(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -2885,23 +2503,15 @@ class Frame(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> frame.evaluate started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.evaluate(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= frame.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.evaluate failed")
-            raise e
+        )
 
     def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -2933,23 +2543,15 @@ class Frame(SyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> frame.evaluate_handle started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.evaluate_handle(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "frame.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= frame.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.evaluate_handle failed")
-            raise e
+        )
 
     def query_selector(self, selector: str) -> typing.Union["ElementHandle", NoneType]:
         """Frame.query_selector
@@ -2969,17 +2571,11 @@ class Frame(SyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> frame.query_selector started")
-            result = mapping.from_impl_nullable(
-                self._sync(self._impl_obj.query_selector(selector=selector))
+        return _from_impl_nullable(
+            self._call_sync(
+                "frame.query_selector", self._impl_obj.query_selector, selector=selector
             )
-            log_api("<= frame.query_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.query_selector failed")
-            raise e
+        )
 
     def query_selector_all(self, selector: str) -> typing.List["ElementHandle"]:
         """Frame.query_selector_all
@@ -2999,17 +2595,13 @@ class Frame(SyncBase):
         -------
         List[ElementHandle]
         """
-
-        try:
-            log_api("=> frame.query_selector_all started")
-            result = mapping.from_impl_list(
-                self._sync(self._impl_obj.query_selector_all(selector=selector))
+        return _from_impl_list(
+            self._call_sync(
+                "frame.query_selector_all",
+                self._impl_obj.query_selector_all,
+                selector=selector,
             )
-            log_api("<= frame.query_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.query_selector_all failed")
-            raise e
+        )
 
     def wait_for_selector(
         self,
@@ -3048,21 +2640,15 @@ class Frame(SyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> frame.wait_for_selector started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.wait_for_selector(
-                        selector=selector, timeout=timeout, state=state
-                    )
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "frame.wait_for_selector",
+                self._impl_obj.wait_for_selector,
+                selector=selector,
+                timeout=timeout,
+                state=state,
             )
-            log_api("<= frame.wait_for_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_selector failed")
-            raise e
+        )
 
     def dispatch_event(
         self,
@@ -3104,24 +2690,16 @@ class Frame(SyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> frame.dispatch_event started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.dispatch_event(
-                        selector=selector,
-                        type=type,
-                        eventInit=mapping.to_impl(event_init),
-                        timeout=timeout,
-                    )
-                )
-            )
-            log_api("<= frame.dispatch_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.dispatch_event failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.dispatch_event",
+                self._impl_obj.dispatch_event,
+                selector=selector,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
+                timeout=timeout,
+            )
+        )
 
     def eval_on_selector(
         self,
@@ -3157,24 +2735,16 @@ class Frame(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> frame.eval_on_selector started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.eval_on_selector(
-                        selector=selector,
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
-            )
-            log_api("<= frame.eval_on_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.eval_on_selector failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.eval_on_selector",
+                self._impl_obj.eval_on_selector,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+            )
+        )
 
     def eval_on_selector_all(
         self,
@@ -3210,24 +2780,16 @@ class Frame(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> frame.eval_on_selector_all started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.eval_on_selector_all(
-                        selector=selector,
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
-            )
-            log_api("<= frame.eval_on_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.eval_on_selector_all failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.eval_on_selector_all",
+                self._impl_obj.eval_on_selector_all,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+            )
+        )
 
     def content(self) -> str:
         """Frame.content
@@ -3238,15 +2800,9 @@ class Frame(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.content started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.content()))
-            log_api("<= frame.content succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.content failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("frame.content", self._impl_obj.content)
+        )
 
     def set_content(
         self,
@@ -3271,21 +2827,15 @@ class Frame(SyncBase):
             - `'load'` - consider operation to be finished when the `load` event is fired.
             - `'networkidle'` - consider operation to be finished when there are no network connections for at least `500` ms.
         """
-
-        try:
-            log_api("=> frame.set_content started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_content(
-                        html=html, timeout=timeout, waitUntil=wait_until
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.set_content",
+                self._impl_obj.set_content,
+                html=html,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= frame.set_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.set_content failed")
-            raise e
+        )
 
     def is_detached(self) -> bool:
         """Frame.is_detached
@@ -3296,15 +2846,9 @@ class Frame(SyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> frame.is_detached started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_detached())
-            log_api("<= frame.is_detached succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.is_detached failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("frame.is_detached", self._impl_obj.is_detached)
+        )
 
     def add_script_tag(
         self,
@@ -3336,21 +2880,16 @@ class Frame(SyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> frame.add_script_tag started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.add_script_tag(
-                        url=url, path=path, content=content, type=type
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "frame.add_script_tag",
+                self._impl_obj.add_script_tag,
+                url=url,
+                path=path,
+                content=content,
+                type=type,
             )
-            log_api("<= frame.add_script_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.add_script_tag failed")
-            raise e
+        )
 
     def add_style_tag(
         self,
@@ -3379,19 +2918,15 @@ class Frame(SyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> frame.add_style_tag started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.add_style_tag(url=url, path=path, content=content)
-                )
+        return _from_impl(
+            self._call_sync(
+                "frame.add_style_tag",
+                self._impl_obj.add_style_tag,
+                url=url,
+                path=path,
+                content=content,
             )
-            log_api("<= frame.add_style_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.add_style_tag failed")
-            raise e
+        )
 
     def click(
         self,
@@ -3447,29 +2982,21 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.click started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.click(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        delay=delay,
-                        button=button,
-                        clickCount=click_count,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.click failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.click",
+                self._impl_obj.click,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def dblclick(
         self,
@@ -3525,28 +3052,20 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.dblclick started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.dblclick(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        delay=delay,
-                        button=button,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.dblclick failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.dblclick",
+                self._impl_obj.dblclick,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def tap(
         self,
@@ -3595,26 +3114,18 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.tap started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.tap(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.tap failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.tap",
+                self._impl_obj.tap,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def fill(
         self,
@@ -3647,24 +3158,16 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.fill started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.fill(
-                        selector=selector,
-                        value=value,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.fill succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.fill failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.fill",
+                self._impl_obj.fill,
+                selector=selector,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def focus(self, selector: str, timeout: float = None) -> NoneType:
         """Frame.focus
@@ -3681,17 +3184,11 @@ class Frame(SyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> frame.focus started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.focus(selector=selector, timeout=timeout))
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.focus", self._impl_obj.focus, selector=selector, timeout=timeout
             )
-            log_api("<= frame.focus succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.focus failed")
-            raise e
+        )
 
     def text_content(
         self, selector: str, timeout: float = None
@@ -3713,19 +3210,14 @@ class Frame(SyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> frame.text_content started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.text_content(selector=selector, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.text_content",
+                self._impl_obj.text_content,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= frame.text_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.text_content failed")
-            raise e
+        )
 
     def inner_text(self, selector: str, timeout: float = None) -> str:
         """Frame.inner_text
@@ -3745,19 +3237,14 @@ class Frame(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.inner_text started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.inner_text(selector=selector, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.inner_text",
+                self._impl_obj.inner_text,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= frame.inner_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.inner_text failed")
-            raise e
+        )
 
     def inner_html(self, selector: str, timeout: float = None) -> str:
         """Frame.inner_html
@@ -3777,19 +3264,14 @@ class Frame(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.inner_html started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.inner_html(selector=selector, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.inner_html",
+                self._impl_obj.inner_html,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= frame.inner_html succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.inner_html failed")
-            raise e
+        )
 
     def get_attribute(
         self, selector: str, name: str, timeout: float = None
@@ -3813,21 +3295,15 @@ class Frame(SyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> frame.get_attribute started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.get_attribute(
-                        selector=selector, name=name, timeout=timeout
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.get_attribute",
+                self._impl_obj.get_attribute,
+                selector=selector,
+                name=name,
+                timeout=timeout,
             )
-            log_api("<= frame.get_attribute succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.get_attribute failed")
-            raise e
+        )
 
     def hover(
         self,
@@ -3869,25 +3345,17 @@ class Frame(SyncBase):
         force : Union[bool, NoneType]
             Whether to bypass the [actionability](./actionability.md) checks. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.hover started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.hover(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        timeout=timeout,
-                        force=force,
-                    )
-                )
-            )
-            log_api("<= frame.hover succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.hover failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.hover",
+                self._impl_obj.hover,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+            )
+        )
 
     def select_option(
         self,
@@ -3922,27 +3390,19 @@ class Frame(SyncBase):
         -------
         List[str]
         """
-
-        try:
-            log_api("=> frame.select_option started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.select_option(
-                        selector=selector,
-                        value=value,
-                        index=index,
-                        label=label,
-                        element=mapping.to_impl(element),
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.select_option succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.select_option failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.select_option",
+                self._impl_obj.select_option,
+                selector=selector,
+                value=value,
+                index=index,
+                label=label,
+                element=mapping.to_impl(element),
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def set_input_files(
         self,
@@ -3980,24 +3440,16 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.set_input_files started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_input_files(
-                        selector=selector,
-                        files=files,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.set_input_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.set_input_files failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.set_input_files",
+                self._impl_obj.set_input_files,
+                selector=selector,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def type(
         self,
@@ -4031,25 +3483,17 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.type started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.type(
-                        selector=selector,
-                        text=text,
-                        delay=delay,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.type failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.type",
+                self._impl_obj.type,
+                selector=selector,
+                text=text,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def press(
         self,
@@ -4095,25 +3539,17 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.press started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.press(
-                        selector=selector,
-                        key=key,
-                        delay=delay,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.press failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.press",
+                self._impl_obj.press,
+                selector=selector,
+                key=key,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def check(
         self,
@@ -4153,24 +3589,16 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.check started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.check(
-                        selector=selector,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.check succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.check failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.check",
+                self._impl_obj.check,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def uncheck(
         self,
@@ -4210,24 +3638,16 @@ class Frame(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> frame.uncheck started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.uncheck(
-                        selector=selector,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= frame.uncheck succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.uncheck failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.uncheck",
+                self._impl_obj.uncheck,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def wait_for_timeout(self, timeout: float) -> NoneType:
         """Frame.wait_for_timeout
@@ -4242,17 +3662,13 @@ class Frame(SyncBase):
         timeout : float
             A timeout to wait for
         """
-
-        try:
-            log_api("=> frame.wait_for_timeout started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.wait_for_timeout(timeout=timeout))
+        return _from_maybe_impl(
+            self._call_sync(
+                "frame.wait_for_timeout",
+                self._impl_obj.wait_for_timeout,
+                timeout=timeout,
             )
-            log_api("<= frame.wait_for_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_timeout failed")
-            raise e
+        )
 
     def wait_for_function(
         self,
@@ -4289,25 +3705,17 @@ class Frame(SyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> frame.wait_for_function started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.wait_for_function(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                        timeout=timeout,
-                        polling=polling,
-                    )
-                )
-            )
-            log_api("<= frame.wait_for_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.wait_for_function failed")
-            raise e
+        return _from_impl(
+            self._call_sync(
+                "frame.wait_for_function",
+                self._impl_obj.wait_for_function,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+                timeout=timeout,
+                polling=polling,
+            )
+        )
 
     def title(self) -> str:
         """Frame.title
@@ -4318,15 +3726,7 @@ class Frame(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> frame.title started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.title()))
-            log_api("<= frame.title succeded")
-            return result
-        except Exception as e:
-            log_api("<= frame.title failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("frame.title", self._impl_obj.title))
 
     def expect_load_state(
         self,
@@ -4390,6 +3790,8 @@ mapping.register(FrameImpl, Frame)
 
 
 class Worker(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: WorkerImpl):
         super().__init__(obj)
 
@@ -4401,7 +3803,7 @@ class Worker(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     def evaluate(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -4430,23 +3832,15 @@ class Worker(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> worker.evaluate started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.evaluate(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "worker.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= worker.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= worker.evaluate failed")
-            raise e
+        )
 
     def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -4474,29 +3868,23 @@ class Worker(SyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> worker.evaluate_handle started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.evaluate_handle(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "worker.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= worker.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= worker.evaluate_handle failed")
-            raise e
+        )
 
 
 mapping.register(WorkerImpl, Worker)
 
 
 class Selectors(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: SelectorsImpl):
         super().__init__(obj)
 
@@ -4523,30 +3911,24 @@ class Selectors(SyncBase):
             not any JavaScript objects from the frame's scripts. Defaults to `false`. Note that running as a content script is not
             guaranteed when this engine is used together with other registered engines.
         """
-
-        try:
-            log_api("=> selectors.register started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.register(
-                        name=name,
-                        script=script,
-                        path=path,
-                        contentScript=content_script,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "selectors.register",
+                self._impl_obj.register,
+                name=name,
+                script=script,
+                path=path,
+                contentScript=content_script,
             )
-            log_api("<= selectors.register succeded")
-            return result
-        except Exception as e:
-            log_api("<= selectors.register failed")
-            raise e
+        )
 
 
 mapping.register(SelectorsImpl, Selectors)
 
 
 class ConsoleMessage(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: ConsoleMessageImpl):
         super().__init__(obj)
 
@@ -4562,7 +3944,7 @@ class ConsoleMessage(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return _from_maybe_impl(self._impl_obj.type)
 
     @property
     def text(self) -> str:
@@ -4572,7 +3954,7 @@ class ConsoleMessage(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.text)
+        return _from_maybe_impl(self._impl_obj.text)
 
     @property
     def args(self) -> typing.List["JSHandle"]:
@@ -4582,7 +3964,7 @@ class ConsoleMessage(SyncBase):
         -------
         List[JSHandle]
         """
-        return mapping.from_impl_list(self._impl_obj.args)
+        return _from_impl_list(self._impl_obj.args)
 
     @property
     def location(self) -> "SourceLocation":
@@ -4592,13 +3974,15 @@ class ConsoleMessage(SyncBase):
         -------
         {url: str, line_number: int, column_number: int}
         """
-        return mapping.from_impl(self._impl_obj.location)
+        return _from_impl(self._impl_obj.location)
 
 
 mapping.register(ConsoleMessageImpl, ConsoleMessage)
 
 
 class Dialog(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: DialogImpl):
         super().__init__(obj)
 
@@ -4612,7 +3996,7 @@ class Dialog(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return _from_maybe_impl(self._impl_obj.type)
 
     @property
     def message(self) -> str:
@@ -4624,7 +4008,7 @@ class Dialog(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.message)
+        return _from_maybe_impl(self._impl_obj.message)
 
     @property
     def default_value(self) -> str:
@@ -4636,7 +4020,7 @@ class Dialog(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.default_value)
+        return _from_maybe_impl(self._impl_obj.default_value)
 
     def accept(self, prompt_text: str = None) -> NoneType:
         """Dialog.accept
@@ -4648,38 +4032,28 @@ class Dialog(SyncBase):
         prompt_text : Union[str, NoneType]
             A text to enter in prompt. Does not cause any effects if the dialog's `type` is not prompt. Optional.
         """
-
-        try:
-            log_api("=> dialog.accept started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.accept(promptText=prompt_text))
+        return _from_maybe_impl(
+            self._call_sync(
+                "dialog.accept", self._impl_obj.accept, promptText=prompt_text
             )
-            log_api("<= dialog.accept succeded")
-            return result
-        except Exception as e:
-            log_api("<= dialog.accept failed")
-            raise e
+        )
 
     def dismiss(self) -> NoneType:
         """Dialog.dismiss
 
         Returns when the dialog has been dismissed.
         """
-
-        try:
-            log_api("=> dialog.dismiss started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.dismiss()))
-            log_api("<= dialog.dismiss succeded")
-            return result
-        except Exception as e:
-            log_api("<= dialog.dismiss failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("dialog.dismiss", self._impl_obj.dismiss)
+        )
 
 
 mapping.register(DialogImpl, Dialog)
 
 
 class Download(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: DownloadImpl):
         super().__init__(obj)
 
@@ -4693,7 +4067,7 @@ class Download(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def suggested_filename(self) -> str:
@@ -4708,22 +4082,16 @@ class Download(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.suggested_filename)
+        return _from_maybe_impl(self._impl_obj.suggested_filename)
 
     def delete(self) -> NoneType:
         """Download.delete
 
         Deletes the downloaded file.
         """
-
-        try:
-            log_api("=> download.delete started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.delete()))
-            log_api("<= download.delete succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.delete failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("download.delete", self._impl_obj.delete)
+        )
 
     def failure(self) -> typing.Union[str, NoneType]:
         """Download.failure
@@ -4734,15 +4102,9 @@ class Download(SyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> download.failure started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.failure()))
-            log_api("<= download.failure succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.failure failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("download.failure", self._impl_obj.failure)
+        )
 
     def path(self) -> typing.Union[str, NoneType]:
         """Download.path
@@ -4753,15 +4115,7 @@ class Download(SyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> download.path started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.path()))
-            log_api("<= download.path succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.path failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("download.path", self._impl_obj.path))
 
     def save_as(self, path: typing.Union[str, pathlib.Path]) -> NoneType:
         """Download.save_as
@@ -4773,23 +4127,17 @@ class Download(SyncBase):
         path : Union[pathlib.Path, str]
             Path where the download should be saved.
         """
-
-        try:
-            log_api("=> download.save_as started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.save_as(path=path))
-            )
-            log_api("<= download.save_as succeded")
-            return result
-        except Exception as e:
-            log_api("<= download.save_as failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("download.save_as", self._impl_obj.save_as, path=path)
+        )
 
 
 mapping.register(DownloadImpl, Download)
 
 
 class Video(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: VideoImpl):
         super().__init__(obj)
 
@@ -4803,42 +4151,32 @@ class Video(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> video.path started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.path()))
-            log_api("<= video.path succeded")
-            return result
-        except Exception as e:
-            log_api("<= video.path failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("video.path", self._impl_obj.path))
 
 
 mapping.register(VideoImpl, Video)
 
 
 class BindingCall(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BindingCallImpl):
         super().__init__(obj)
 
     def call(self, func: typing.Callable) -> NoneType:
-
-        try:
-            log_api("=> binding_call.call started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.call(func=self._wrap_handler(func)))
+        return _from_maybe_impl(
+            self._call_sync(
+                "binding_call.call", self._impl_obj.call, func=self._wrap_handler(func)
             )
-            log_api("<= binding_call.call succeded")
-            return result
-        except Exception as e:
-            log_api("<= binding_call.call failed")
-            raise e
+        )
 
 
 mapping.register(BindingCallImpl, BindingCall)
 
 
 class Page(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: PageImpl):
         super().__init__(obj)
 
@@ -4850,7 +4188,7 @@ class Page(SyncBase):
         -------
         Accessibility
         """
-        return mapping.from_impl(self._impl_obj.accessibility)
+        return _from_impl(self._impl_obj.accessibility)
 
     @property
     def keyboard(self) -> "Keyboard":
@@ -4860,7 +4198,7 @@ class Page(SyncBase):
         -------
         Keyboard
         """
-        return mapping.from_impl(self._impl_obj.keyboard)
+        return _from_impl(self._impl_obj.keyboard)
 
     @property
     def mouse(self) -> "Mouse":
@@ -4870,7 +4208,7 @@ class Page(SyncBase):
         -------
         Mouse
         """
-        return mapping.from_impl(self._impl_obj.mouse)
+        return _from_impl(self._impl_obj.mouse)
 
     @property
     def touchscreen(self) -> "Touchscreen":
@@ -4880,7 +4218,7 @@ class Page(SyncBase):
         -------
         Touchscreen
         """
-        return mapping.from_impl(self._impl_obj.touchscreen)
+        return _from_impl(self._impl_obj.touchscreen)
 
     @property
     def context(self) -> "BrowserContext":
@@ -4892,7 +4230,7 @@ class Page(SyncBase):
         -------
         BrowserContext
         """
-        return mapping.from_impl(self._impl_obj.context)
+        return _from_impl(self._impl_obj.context)
 
     @property
     def main_frame(self) -> "Frame":
@@ -4904,7 +4242,7 @@ class Page(SyncBase):
         -------
         Frame
         """
-        return mapping.from_impl(self._impl_obj.main_frame)
+        return _from_impl(self._impl_obj.main_frame)
 
     @property
     def frames(self) -> typing.List["Frame"]:
@@ -4916,7 +4254,7 @@ class Page(SyncBase):
         -------
         List[Frame]
         """
-        return mapping.from_impl_list(self._impl_obj.frames)
+        return _from_impl_list(self._impl_obj.frames)
 
     @property
     def url(self) -> str:
@@ -4928,7 +4266,7 @@ class Page(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return _from_maybe_impl(self._impl_obj.url)
 
     @property
     def workers(self) -> typing.List["Worker"]:
@@ -4943,7 +4281,7 @@ class Page(SyncBase):
         -------
         List[Worker]
         """
-        return mapping.from_impl_list(self._impl_obj.workers)
+        return _from_impl_list(self._impl_obj.workers)
 
     @property
     def video(self) -> typing.Union["Video", NoneType]:
@@ -4955,7 +4293,7 @@ class Page(SyncBase):
         -------
         Union[Video, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.video)
+        return _from_impl_nullable(self._impl_obj.video)
 
     def opener(self) -> typing.Union["Page", NoneType]:
         """Page.opener
@@ -4966,15 +4304,9 @@ class Page(SyncBase):
         -------
         Union[Page, NoneType]
         """
-
-        try:
-            log_api("=> page.opener started")
-            result = mapping.from_impl_nullable(self._sync(self._impl_obj.opener()))
-            log_api("<= page.opener succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.opener failed")
-            raise e
+        return _from_impl_nullable(
+            self._call_sync("page.opener", self._impl_obj.opener)
+        )
 
     def frame(
         self,
@@ -4996,17 +4328,14 @@ class Page(SyncBase):
         -------
         Union[Frame, NoneType]
         """
-
-        try:
-            log_api("=> page.frame started")
-            result = mapping.from_impl_nullable(
-                self._impl_obj.frame(name=name, url=self._wrap_handler(url))
+        return _from_impl_nullable(
+            self._call(
+                "page.frame",
+                self._impl_obj.frame,
+                name=name,
+                url=self._wrap_handler(url),
             )
-            log_api("<= page.frame succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.frame failed")
-            raise e
+        )
 
     def set_default_navigation_timeout(self, timeout: float) -> NoneType:
         """Page.set_default_navigation_timeout
@@ -5027,17 +4356,13 @@ class Page(SyncBase):
         timeout : float
             Maximum navigation time in milliseconds
         """
-
-        try:
-            log_api("=> page.set_default_navigation_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_navigation_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "page.set_default_navigation_timeout",
+                self._impl_obj.set_default_navigation_timeout,
+                timeout=timeout,
             )
-            log_api("<= page.set_default_navigation_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_default_navigation_timeout failed")
-            raise e
+        )
 
     def set_default_timeout(self, timeout: float) -> NoneType:
         """Page.set_default_timeout
@@ -5051,17 +4376,13 @@ class Page(SyncBase):
         timeout : float
             Maximum time in milliseconds
         """
-
-        try:
-            log_api("=> page.set_default_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "page.set_default_timeout",
+                self._impl_obj.set_default_timeout,
+                timeout=timeout,
             )
-            log_api("<= page.set_default_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_default_timeout failed")
-            raise e
+        )
 
     def query_selector(self, selector: str) -> typing.Union["ElementHandle", NoneType]:
         """Page.query_selector
@@ -5080,17 +4401,11 @@ class Page(SyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> page.query_selector started")
-            result = mapping.from_impl_nullable(
-                self._sync(self._impl_obj.query_selector(selector=selector))
+        return _from_impl_nullable(
+            self._call_sync(
+                "page.query_selector", self._impl_obj.query_selector, selector=selector
             )
-            log_api("<= page.query_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.query_selector failed")
-            raise e
+        )
 
     def query_selector_all(self, selector: str) -> typing.List["ElementHandle"]:
         """Page.query_selector_all
@@ -5109,17 +4424,13 @@ class Page(SyncBase):
         -------
         List[ElementHandle]
         """
-
-        try:
-            log_api("=> page.query_selector_all started")
-            result = mapping.from_impl_list(
-                self._sync(self._impl_obj.query_selector_all(selector=selector))
+        return _from_impl_list(
+            self._call_sync(
+                "page.query_selector_all",
+                self._impl_obj.query_selector_all,
+                selector=selector,
             )
-            log_api("<= page.query_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.query_selector_all failed")
-            raise e
+        )
 
     def wait_for_selector(
         self,
@@ -5158,21 +4469,15 @@ class Page(SyncBase):
         -------
         Union[ElementHandle, NoneType]
         """
-
-        try:
-            log_api("=> page.wait_for_selector started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.wait_for_selector(
-                        selector=selector, timeout=timeout, state=state
-                    )
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "page.wait_for_selector",
+                self._impl_obj.wait_for_selector,
+                selector=selector,
+                timeout=timeout,
+                state=state,
             )
-            log_api("<= page.wait_for_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_selector failed")
-            raise e
+        )
 
     def dispatch_event(
         self,
@@ -5214,24 +4519,16 @@ class Page(SyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> page.dispatch_event started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.dispatch_event(
-                        selector=selector,
-                        type=type,
-                        eventInit=mapping.to_impl(event_init),
-                        timeout=timeout,
-                    )
-                )
-            )
-            log_api("<= page.dispatch_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.dispatch_event failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.dispatch_event",
+                self._impl_obj.dispatch_event,
+                selector=selector,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
+                timeout=timeout,
+            )
+        )
 
     def evaluate(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -5268,23 +4565,15 @@ class Page(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.evaluate started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.evaluate(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.evaluate",
+                self._impl_obj.evaluate,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= page.evaluate succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.evaluate failed")
-            raise e
+        )
 
     def evaluate_handle(
         self, expression: str, arg: typing.Any = None, force_expr: bool = None
@@ -5316,23 +4605,15 @@ class Page(SyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> page.evaluate_handle started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.evaluate_handle(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "page.evaluate_handle",
+                self._impl_obj.evaluate_handle,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
             )
-            log_api("<= page.evaluate_handle succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.evaluate_handle failed")
-            raise e
+        )
 
     def eval_on_selector(
         self,
@@ -5368,24 +4649,16 @@ class Page(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.eval_on_selector started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.eval_on_selector(
-                        selector=selector,
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
-            )
-            log_api("<= page.eval_on_selector succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.eval_on_selector failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.eval_on_selector",
+                self._impl_obj.eval_on_selector,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+            )
+        )
 
     def eval_on_selector_all(
         self,
@@ -5419,24 +4692,16 @@ class Page(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.eval_on_selector_all started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.eval_on_selector_all(
-                        selector=selector,
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                    )
-                )
-            )
-            log_api("<= page.eval_on_selector_all succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.eval_on_selector_all failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.eval_on_selector_all",
+                self._impl_obj.eval_on_selector_all,
+                selector=selector,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+            )
+        )
 
     def add_script_tag(
         self,
@@ -5469,21 +4734,16 @@ class Page(SyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> page.add_script_tag started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.add_script_tag(
-                        url=url, path=path, content=content, type=type
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "page.add_script_tag",
+                self._impl_obj.add_script_tag,
+                url=url,
+                path=path,
+                content=content,
+                type=type,
             )
-            log_api("<= page.add_script_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.add_script_tag failed")
-            raise e
+        )
 
     def add_style_tag(
         self,
@@ -5512,19 +4772,15 @@ class Page(SyncBase):
         -------
         ElementHandle
         """
-
-        try:
-            log_api("=> page.add_style_tag started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.add_style_tag(url=url, path=path, content=content)
-                )
+        return _from_impl(
+            self._call_sync(
+                "page.add_style_tag",
+                self._impl_obj.add_style_tag,
+                url=url,
+                path=path,
+                content=content,
             )
-            log_api("<= page.add_style_tag succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.add_style_tag failed")
-            raise e
+        )
 
     def expose_function(self, name: str, callback: typing.Callable) -> NoneType:
         """Page.expose_function
@@ -5549,21 +4805,14 @@ class Page(SyncBase):
         callback : Callable
             Callback function which will be called in Playwright's context.
         """
-
-        try:
-            log_api("=> page.expose_function started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.expose_function(
-                        name=name, callback=self._wrap_handler(callback)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.expose_function",
+                self._impl_obj.expose_function,
+                name=name,
+                callback=self._wrap_handler(callback),
             )
-            log_api("<= page.expose_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.expose_function failed")
-            raise e
+        )
 
     def expose_binding(
         self, name: str, callback: typing.Callable, handle: bool = None
@@ -5595,21 +4844,15 @@ class Page(SyncBase):
             Whether to pass the argument as a handle, instead of passing by value. When passing a handle, only one argument is
             supported. When passing by value, multiple arguments are supported.
         """
-
-        try:
-            log_api("=> page.expose_binding started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.expose_binding(
-                        name=name, callback=self._wrap_handler(callback), handle=handle
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.expose_binding",
+                self._impl_obj.expose_binding,
+                name=name,
+                callback=self._wrap_handler(callback),
+                handle=handle,
             )
-            log_api("<= page.expose_binding succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.expose_binding failed")
-            raise e
+        )
 
     def set_extra_http_headers(self, headers: typing.Dict[str, str]) -> NoneType:
         """Page.set_extra_http_headers
@@ -5623,21 +4866,13 @@ class Page(SyncBase):
         headers : Dict[str, str]
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
-
-        try:
-            log_api("=> page.set_extra_http_headers started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_extra_http_headers(
-                        headers=mapping.to_impl(headers)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.set_extra_http_headers",
+                self._impl_obj.set_extra_http_headers,
+                headers=mapping.to_impl(headers),
             )
-            log_api("<= page.set_extra_http_headers succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_extra_http_headers failed")
-            raise e
+        )
 
     def content(self) -> str:
         """Page.content
@@ -5648,15 +4883,7 @@ class Page(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.content started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.content()))
-            log_api("<= page.content succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.content failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("page.content", self._impl_obj.content))
 
     def set_content(
         self,
@@ -5681,21 +4908,15 @@ class Page(SyncBase):
             - `'load'` - consider operation to be finished when the `load` event is fired.
             - `'networkidle'` - consider operation to be finished when there are no network connections for at least `500` ms.
         """
-
-        try:
-            log_api("=> page.set_content started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_content(
-                        html=html, timeout=timeout, waitUntil=wait_until
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.set_content",
+                self._impl_obj.set_content,
+                html=html,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.set_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_content failed")
-            raise e
+        )
 
     def goto(
         self,
@@ -5749,21 +4970,16 @@ class Page(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.goto started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.goto(
-                        url=url, timeout=timeout, waitUntil=wait_until, referer=referer
-                    )
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "page.goto",
+                self._impl_obj.goto,
+                url=url,
+                timeout=timeout,
+                waitUntil=wait_until,
+                referer=referer,
             )
-            log_api("<= page.goto succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.goto failed")
-            raise e
+        )
 
     def reload(
         self,
@@ -5792,17 +5008,14 @@ class Page(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.reload started")
-            result = mapping.from_impl_nullable(
-                self._sync(self._impl_obj.reload(timeout=timeout, waitUntil=wait_until))
+        return _from_impl_nullable(
+            self._call_sync(
+                "page.reload",
+                self._impl_obj.reload,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.reload succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.reload failed")
-            raise e
+        )
 
     def wait_for_load_state(
         self,
@@ -5832,19 +5045,14 @@ class Page(SyncBase):
             `browser_context.set_default_timeout()`, `page.set_default_navigation_timeout()` or
             `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> page.wait_for_load_state started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.wait_for_load_state",
+                self._impl_obj.wait_for_load_state,
+                state=state,
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_load_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_load_state failed")
-            raise e
+        )
 
     def wait_for_navigation(
         self,
@@ -5886,23 +5094,15 @@ class Page(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.wait_for_navigation started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.wait_for_navigation(
-                        url=self._wrap_handler(url),
-                        waitUntil=wait_until,
-                        timeout=timeout,
-                    )
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "page.wait_for_navigation",
+                self._impl_obj.wait_for_navigation,
+                url=self._wrap_handler(url),
+                waitUntil=wait_until,
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_navigation succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_navigation failed")
-            raise e
+        )
 
     def wait_for_request(
         self,
@@ -5927,22 +5127,14 @@ class Page(SyncBase):
         -------
         Request
         """
-
-        try:
-            log_api("=> page.wait_for_request started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.wait_for_request(
-                        urlOrPredicate=self._wrap_handler(url_or_predicate),
-                        timeout=timeout,
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "page.wait_for_request",
+                self._impl_obj.wait_for_request,
+                urlOrPredicate=self._wrap_handler(url_or_predicate),
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_request succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_request failed")
-            raise e
+        )
 
     def wait_for_response(
         self,
@@ -5967,22 +5159,14 @@ class Page(SyncBase):
         -------
         Response
         """
-
-        try:
-            log_api("=> page.wait_for_response started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.wait_for_response(
-                        urlOrPredicate=self._wrap_handler(url_or_predicate),
-                        timeout=timeout,
-                    )
-                )
+        return _from_impl(
+            self._call_sync(
+                "page.wait_for_response",
+                self._impl_obj.wait_for_response,
+                urlOrPredicate=self._wrap_handler(url_or_predicate),
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_response succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_response failed")
-            raise e
+        )
 
     def wait_for_event(
         self,
@@ -6011,23 +5195,15 @@ class Page(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> page.wait_for_event started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.wait_for_event(
-                        event=event,
-                        predicate=self._wrap_handler(predicate),
-                        timeout=timeout,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.wait_for_event",
+                self._impl_obj.wait_for_event,
+                event=event,
+                predicate=self._wrap_handler(predicate),
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_event failed")
-            raise e
+        )
 
     def go_back(
         self,
@@ -6058,19 +5234,14 @@ class Page(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.go_back started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.go_back(timeout=timeout, waitUntil=wait_until)
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "page.go_back",
+                self._impl_obj.go_back,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.go_back succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.go_back failed")
-            raise e
+        )
 
     def go_forward(
         self,
@@ -6101,19 +5272,14 @@ class Page(SyncBase):
         -------
         Union[Response, NoneType]
         """
-
-        try:
-            log_api("=> page.go_forward started")
-            result = mapping.from_impl_nullable(
-                self._sync(
-                    self._impl_obj.go_forward(timeout=timeout, waitUntil=wait_until)
-                )
+        return _from_impl_nullable(
+            self._call_sync(
+                "page.go_forward",
+                self._impl_obj.go_forward,
+                timeout=timeout,
+                waitUntil=wait_until,
             )
-            log_api("<= page.go_forward succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.go_forward failed")
-            raise e
+        )
 
     def emulate_media(
         self,
@@ -6133,19 +5299,14 @@ class Page(SyncBase):
             `null` disables color scheme emulation. Omitting `colorScheme` or passing `undefined` does not change the emulated
             value. Optional.
         """
-
-        try:
-            log_api("=> page.emulate_media started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.emulate_media(media=media, colorScheme=color_scheme)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.emulate_media",
+                self._impl_obj.emulate_media,
+                media=media,
+                colorScheme=color_scheme,
             )
-            log_api("<= page.emulate_media succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.emulate_media failed")
-            raise e
+        )
 
     def set_viewport_size(self, width: int, height: int) -> NoneType:
         """Page.set_viewport_size
@@ -6163,17 +5324,14 @@ class Page(SyncBase):
         height : int
             page height in pixels. **required**
         """
-
-        try:
-            log_api("=> page.set_viewport_size started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.set_viewport_size(width=width, height=height))
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.set_viewport_size",
+                self._impl_obj.set_viewport_size,
+                width=width,
+                height=height,
             )
-            log_api("<= page.set_viewport_size succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_viewport_size failed")
-            raise e
+        )
 
     def viewport_size(self) -> typing.Union[typing.Tuple[int, int], NoneType]:
         """Page.viewport_size
@@ -6182,32 +5340,18 @@ class Page(SyncBase):
         -------
         Union[typing.Tuple[int, int], NoneType]
         """
-
-        try:
-            log_api("=> page.viewport_size started")
-            result = mapping.from_maybe_impl(self._impl_obj.viewport_size())
-            log_api("<= page.viewport_size succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.viewport_size failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("page.viewport_size", self._impl_obj.viewport_size)
+        )
 
     def bring_to_front(self) -> NoneType:
         """Page.bring_to_front
 
         Brings page to front (activates tab).
         """
-
-        try:
-            log_api("=> page.bring_to_front started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.bring_to_front())
-            )
-            log_api("<= page.bring_to_front succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.bring_to_front failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("page.bring_to_front", self._impl_obj.bring_to_front)
+        )
 
     def add_init_script(
         self, script: str = None, path: typing.Union[str, pathlib.Path] = None
@@ -6232,17 +5376,14 @@ class Page(SyncBase):
         script : Union[str, NoneType]
             Script to be evaluated in the page.
         """
-
-        try:
-            log_api("=> page.add_init_script started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.add_init_script(script=script, path=path))
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.add_init_script",
+                self._impl_obj.add_init_script,
+                script=script,
+                path=path,
             )
-            log_api("<= page.add_init_script succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.add_init_script failed")
-            raise e
+        )
 
     def route(
         self,
@@ -6276,21 +5417,14 @@ class Page(SyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any]]
             handler function to route the request.
         """
-
-        try:
-            log_api("=> page.route started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.route(
-                        url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.route",
+                self._impl_obj.route,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= page.route succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.route failed")
-            raise e
+        )
 
     def unroute(
         self,
@@ -6311,21 +5445,14 @@ class Page(SyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any], NoneType]
             Optional handler function to route the request.
         """
-
-        try:
-            log_api("=> page.unroute started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.unroute(
-                        url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.unroute",
+                self._impl_obj.unroute,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= page.unroute succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.unroute failed")
-            raise e
+        )
 
     def screenshot(
         self,
@@ -6370,27 +5497,19 @@ class Page(SyncBase):
         -------
         bytes
         """
-
-        try:
-            log_api("=> page.screenshot started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.screenshot(
-                        timeout=timeout,
-                        type=type,
-                        path=path,
-                        quality=quality,
-                        omitBackground=omit_background,
-                        fullPage=full_page,
-                        clip=clip,
-                    )
-                )
-            )
-            log_api("<= page.screenshot succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.screenshot failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.screenshot",
+                self._impl_obj.screenshot,
+                timeout=timeout,
+                type=type,
+                path=path,
+                quality=quality,
+                omitBackground=omit_background,
+                fullPage=full_page,
+                clip=clip,
+            )
+        )
 
     def title(self) -> str:
         """Page.title
@@ -6401,15 +5520,7 @@ class Page(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.title started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.title()))
-            log_api("<= page.title succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.title failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("page.title", self._impl_obj.title))
 
     def close(self, run_before_unload: bool = None) -> NoneType:
         """Page.close
@@ -6428,17 +5539,11 @@ class Page(SyncBase):
             Defaults to `false`. Whether to run the
             [before unload](https://developer.mozilla.org/en-US/docs/Web/Events/beforeunload) page handlers.
         """
-
-        try:
-            log_api("=> page.close started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.close(runBeforeUnload=run_before_unload))
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.close", self._impl_obj.close, runBeforeUnload=run_before_unload
             )
-            log_api("<= page.close succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.close failed")
-            raise e
+        )
 
     def is_closed(self) -> bool:
         """Page.is_closed
@@ -6449,15 +5554,7 @@ class Page(SyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> page.is_closed started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_closed())
-            log_api("<= page.is_closed succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.is_closed failed")
-            raise e
+        return _from_maybe_impl(self._call("page.is_closed", self._impl_obj.is_closed))
 
     def click(
         self,
@@ -6515,29 +5612,21 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.click started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.click(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        delay=delay,
-                        button=button,
-                        clickCount=click_count,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.click succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.click failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.click",
+                self._impl_obj.click,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def dblclick(
         self,
@@ -6595,28 +5684,20 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.dblclick started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.dblclick(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        delay=delay,
-                        button=button,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.dblclick succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.dblclick failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.dblclick",
+                self._impl_obj.dblclick,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def tap(
         self,
@@ -6667,26 +5748,18 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.tap started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.tap(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.tap succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.tap failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.tap",
+                self._impl_obj.tap,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def fill(
         self,
@@ -6721,24 +5794,16 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.fill started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.fill(
-                        selector=selector,
-                        value=value,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.fill succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.fill failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.fill",
+                self._impl_obj.fill,
+                selector=selector,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def focus(self, selector: str, timeout: float = None) -> NoneType:
         """Page.focus
@@ -6757,17 +5822,11 @@ class Page(SyncBase):
             Maximum time in milliseconds, defaults to 30 seconds, pass `0` to disable timeout. The default value can be changed by
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
-
-        try:
-            log_api("=> page.focus started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.focus(selector=selector, timeout=timeout))
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.focus", self._impl_obj.focus, selector=selector, timeout=timeout
             )
-            log_api("<= page.focus succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.focus failed")
-            raise e
+        )
 
     def text_content(
         self, selector: str, timeout: float = None
@@ -6789,19 +5848,14 @@ class Page(SyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> page.text_content started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.text_content(selector=selector, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.text_content",
+                self._impl_obj.text_content,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= page.text_content succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.text_content failed")
-            raise e
+        )
 
     def inner_text(self, selector: str, timeout: float = None) -> str:
         """Page.inner_text
@@ -6821,19 +5875,14 @@ class Page(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.inner_text started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.inner_text(selector=selector, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.inner_text",
+                self._impl_obj.inner_text,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= page.inner_text succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.inner_text failed")
-            raise e
+        )
 
     def inner_html(self, selector: str, timeout: float = None) -> str:
         """Page.inner_html
@@ -6853,19 +5902,14 @@ class Page(SyncBase):
         -------
         str
         """
-
-        try:
-            log_api("=> page.inner_html started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.inner_html(selector=selector, timeout=timeout)
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.inner_html",
+                self._impl_obj.inner_html,
+                selector=selector,
+                timeout=timeout,
             )
-            log_api("<= page.inner_html succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.inner_html failed")
-            raise e
+        )
 
     def get_attribute(
         self, selector: str, name: str, timeout: float = None
@@ -6889,21 +5933,15 @@ class Page(SyncBase):
         -------
         Union[str, NoneType]
         """
-
-        try:
-            log_api("=> page.get_attribute started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.get_attribute(
-                        selector=selector, name=name, timeout=timeout
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.get_attribute",
+                self._impl_obj.get_attribute,
+                selector=selector,
+                name=name,
+                timeout=timeout,
             )
-            log_api("<= page.get_attribute succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.get_attribute failed")
-            raise e
+        )
 
     def hover(
         self,
@@ -6947,25 +5985,17 @@ class Page(SyncBase):
         force : Union[bool, NoneType]
             Whether to bypass the [actionability](./actionability.md) checks. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.hover started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.hover(
-                        selector=selector,
-                        modifiers=modifiers,
-                        position=position,
-                        timeout=timeout,
-                        force=force,
-                    )
-                )
-            )
-            log_api("<= page.hover succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.hover failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.hover",
+                self._impl_obj.hover,
+                selector=selector,
+                modifiers=modifiers,
+                position=position,
+                timeout=timeout,
+                force=force,
+            )
+        )
 
     def select_option(
         self,
@@ -7003,27 +6033,19 @@ class Page(SyncBase):
         -------
         List[str]
         """
-
-        try:
-            log_api("=> page.select_option started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.select_option(
-                        selector=selector,
-                        value=value,
-                        index=index,
-                        label=label,
-                        element=mapping.to_impl(element),
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.select_option succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.select_option failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.select_option",
+                self._impl_obj.select_option,
+                selector=selector,
+                value=value,
+                index=index,
+                label=label,
+                element=mapping.to_impl(element),
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def set_input_files(
         self,
@@ -7056,24 +6078,16 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.set_input_files started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_input_files(
-                        selector=selector,
-                        files=files,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.set_input_files succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.set_input_files failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.set_input_files",
+                self._impl_obj.set_input_files,
+                selector=selector,
+                files=files,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def type(
         self,
@@ -7109,25 +6123,17 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.type started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.type(
-                        selector=selector,
-                        text=text,
-                        delay=delay,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.type succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.type failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.type",
+                self._impl_obj.type,
+                selector=selector,
+                text=text,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def press(
         self,
@@ -7175,25 +6181,17 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.press started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.press(
-                        selector=selector,
-                        key=key,
-                        delay=delay,
-                        timeout=timeout,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.press succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.press failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.press",
+                self._impl_obj.press,
+                selector=selector,
+                key=key,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def check(
         self,
@@ -7235,24 +6233,16 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.check started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.check(
-                        selector=selector,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.check succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.check failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.check",
+                self._impl_obj.check,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def uncheck(
         self,
@@ -7294,24 +6284,16 @@ class Page(SyncBase):
             opt out of waiting via setting this flag. You would only need this option in the exceptional cases such as navigating to
             inaccessible pages. Defaults to `false`.
         """
-
-        try:
-            log_api("=> page.uncheck started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.uncheck(
-                        selector=selector,
-                        timeout=timeout,
-                        force=force,
-                        noWaitAfter=no_wait_after,
-                    )
-                )
-            )
-            log_api("<= page.uncheck succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.uncheck failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.uncheck",
+                self._impl_obj.uncheck,
+                selector=selector,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+            )
+        )
 
     def wait_for_timeout(self, timeout: float) -> NoneType:
         """Page.wait_for_timeout
@@ -7328,17 +6310,13 @@ class Page(SyncBase):
         timeout : float
             A timeout to wait for
         """
-
-        try:
-            log_api("=> page.wait_for_timeout started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.wait_for_timeout(timeout=timeout))
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.wait_for_timeout",
+                self._impl_obj.wait_for_timeout,
+                timeout=timeout,
             )
-            log_api("<= page.wait_for_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_timeout failed")
-            raise e
+        )
 
     def wait_for_function(
         self,
@@ -7377,25 +6355,17 @@ class Page(SyncBase):
         -------
         JSHandle
         """
-
-        try:
-            log_api("=> page.wait_for_function started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.wait_for_function(
-                        expression=expression,
-                        arg=mapping.to_impl(arg),
-                        force_expr=force_expr,
-                        timeout=timeout,
-                        polling=polling,
-                    )
-                )
-            )
-            log_api("<= page.wait_for_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.wait_for_function failed")
-            raise e
+        return _from_impl(
+            self._call_sync(
+                "page.wait_for_function",
+                self._impl_obj.wait_for_function,
+                expression=expression,
+                arg=mapping.to_impl(arg),
+                force_expr=force_expr,
+                timeout=timeout,
+                polling=polling,
+            )
+        )
 
     def pdf(
         self,
@@ -7497,33 +6467,25 @@ class Page(SyncBase):
         -------
         bytes
         """
-
-        try:
-            log_api("=> page.pdf started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.pdf(
-                        scale=scale,
-                        displayHeaderFooter=display_header_footer,
-                        headerTemplate=header_template,
-                        footerTemplate=footer_template,
-                        printBackground=print_background,
-                        landscape=landscape,
-                        pageRanges=page_ranges,
-                        format=format,
-                        width=width,
-                        height=height,
-                        preferCSSPageSize=prefer_css_page_size,
-                        margin=margin,
-                        path=path,
-                    )
-                )
-            )
-            log_api("<= page.pdf succeded")
-            return result
-        except Exception as e:
-            log_api("<= page.pdf failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "page.pdf",
+                self._impl_obj.pdf,
+                scale=scale,
+                displayHeaderFooter=display_header_footer,
+                headerTemplate=header_template,
+                footerTemplate=footer_template,
+                printBackground=print_background,
+                landscape=landscape,
+                pageRanges=page_ranges,
+                format=format,
+                width=width,
+                height=height,
+                preferCSSPageSize=prefer_css_page_size,
+                margin=margin,
+                path=path,
+            )
+        )
 
     def expect_event(
         self,
@@ -7578,9 +6540,8 @@ class Page(SyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "console"
         return EventContextManager(
-            self, self._impl_obj.wait_for_event(event, predicate, timeout)
+            self, self._impl_obj.wait_for_event("console", predicate, timeout)
         )
 
     def expect_download(
@@ -7607,9 +6568,8 @@ class Page(SyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "download"
         return EventContextManager(
-            self, self._impl_obj.wait_for_event(event, predicate, timeout)
+            self, self._impl_obj.wait_for_event("download", predicate, timeout)
         )
 
     def expect_file_chooser(
@@ -7636,9 +6596,8 @@ class Page(SyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "filechooser"
         return EventContextManager(
-            self, self._impl_obj.wait_for_event(event, predicate, timeout)
+            self, self._impl_obj.wait_for_event("filechooser", predicate, timeout)
         )
 
     def expect_load_state(
@@ -7722,9 +6681,8 @@ class Page(SyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "popup"
         return EventContextManager(
-            self, self._impl_obj.wait_for_event(event, predicate, timeout)
+            self, self._impl_obj.wait_for_event("popup", predicate, timeout)
         )
 
     def expect_request(
@@ -7811,9 +6769,8 @@ class Page(SyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "worker"
         return EventContextManager(
-            self, self._impl_obj.wait_for_event(event, predicate, timeout)
+            self, self._impl_obj.wait_for_event("worker", predicate, timeout)
         )
 
 
@@ -7821,6 +6778,8 @@ mapping.register(PageImpl, Page)
 
 
 class BrowserContext(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BrowserContextImpl):
         super().__init__(obj)
 
@@ -7835,7 +6794,7 @@ class BrowserContext(SyncBase):
         -------
         List[Page]
         """
-        return mapping.from_impl_list(self._impl_obj.pages)
+        return _from_impl_list(self._impl_obj.pages)
 
     @property
     def browser(self) -> typing.Union["Browser", NoneType]:
@@ -7847,7 +6806,7 @@ class BrowserContext(SyncBase):
         -------
         Union[Browser, NoneType]
         """
-        return mapping.from_impl_nullable(self._impl_obj.browser)
+        return _from_impl_nullable(self._impl_obj.browser)
 
     def set_default_navigation_timeout(self, timeout: float) -> NoneType:
         """BrowserContext.set_default_navigation_timeout
@@ -7868,17 +6827,13 @@ class BrowserContext(SyncBase):
         timeout : float
             Maximum navigation time in milliseconds
         """
-
-        try:
-            log_api("=> browser_context.set_default_navigation_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_navigation_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "browser_context.set_default_navigation_timeout",
+                self._impl_obj.set_default_navigation_timeout,
+                timeout=timeout,
             )
-            log_api("<= browser_context.set_default_navigation_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_default_navigation_timeout failed")
-            raise e
+        )
 
     def set_default_timeout(self, timeout: float) -> NoneType:
         """BrowserContext.set_default_timeout
@@ -7893,17 +6848,13 @@ class BrowserContext(SyncBase):
         timeout : float
             Maximum time in milliseconds
         """
-
-        try:
-            log_api("=> browser_context.set_default_timeout started")
-            result = mapping.from_maybe_impl(
-                self._impl_obj.set_default_timeout(timeout=timeout)
+        return _from_maybe_impl(
+            self._call(
+                "browser_context.set_default_timeout",
+                self._impl_obj.set_default_timeout,
+                timeout=timeout,
             )
-            log_api("<= browser_context.set_default_timeout succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_default_timeout failed")
-            raise e
+        )
 
     def new_page(self) -> "Page":
         """BrowserContext.new_page
@@ -7914,15 +6865,9 @@ class BrowserContext(SyncBase):
         -------
         Page
         """
-
-        try:
-            log_api("=> browser_context.new_page started")
-            result = mapping.from_impl(self._sync(self._impl_obj.new_page()))
-            log_api("<= browser_context.new_page succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.new_page failed")
-            raise e
+        return _from_impl(
+            self._call_sync("browser_context.new_page", self._impl_obj.new_page)
+        )
 
     def cookies(
         self, urls: typing.Union[str, typing.List[str]] = None
@@ -7941,17 +6886,11 @@ class BrowserContext(SyncBase):
         -------
         List[{name: str, value: str, url: Union[str, NoneType], domain: Union[str, NoneType], path: Union[str, NoneType], expires: Union[float, NoneType], httpOnly: Union[bool, NoneType], secure: Union[bool, NoneType], sameSite: Union["Strict", "Lax", "None", NoneType]}]
         """
-
-        try:
-            log_api("=> browser_context.cookies started")
-            result = mapping.from_impl_list(
-                self._sync(self._impl_obj.cookies(urls=urls))
+        return _from_impl_list(
+            self._call_sync(
+                "browser_context.cookies", self._impl_obj.cookies, urls=urls
             )
-            log_api("<= browser_context.cookies succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.cookies failed")
-            raise e
+        )
 
     def add_cookies(self, cookies: typing.List["Cookie"]) -> NoneType:
         """BrowserContext.add_cookies
@@ -7963,32 +6902,24 @@ class BrowserContext(SyncBase):
         ----------
         cookies : List[{name: str, value: str, url: Union[str, NoneType], domain: Union[str, NoneType], path: Union[str, NoneType], expires: Union[float, NoneType], httpOnly: Union[bool, NoneType], secure: Union[bool, NoneType], sameSite: Union["Strict", "Lax", "None", NoneType]}]
         """
-
-        try:
-            log_api("=> browser_context.add_cookies started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.add_cookies(cookies=cookies))
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.add_cookies",
+                self._impl_obj.add_cookies,
+                cookies=cookies,
             )
-            log_api("<= browser_context.add_cookies succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.add_cookies failed")
-            raise e
+        )
 
     def clear_cookies(self) -> NoneType:
         """BrowserContext.clear_cookies
 
         Clears context cookies.
         """
-
-        try:
-            log_api("=> browser_context.clear_cookies started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.clear_cookies()))
-            log_api("<= browser_context.clear_cookies succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.clear_cookies failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.clear_cookies", self._impl_obj.clear_cookies
+            )
+        )
 
     def grant_permissions(
         self, permissions: typing.List[str], origin: str = None
@@ -8021,38 +6952,25 @@ class BrowserContext(SyncBase):
         origin : Union[str, NoneType]
             The [origin] to grant permissions to, e.g. "https://example.com".
         """
-
-        try:
-            log_api("=> browser_context.grant_permissions started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.grant_permissions(
-                        permissions=permissions, origin=origin
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.grant_permissions",
+                self._impl_obj.grant_permissions,
+                permissions=permissions,
+                origin=origin,
             )
-            log_api("<= browser_context.grant_permissions succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.grant_permissions failed")
-            raise e
+        )
 
     def clear_permissions(self) -> NoneType:
         """BrowserContext.clear_permissions
 
         Clears all permission overrides for the browser context.
         """
-
-        try:
-            log_api("=> browser_context.clear_permissions started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.clear_permissions())
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.clear_permissions", self._impl_obj.clear_permissions
             )
-            log_api("<= browser_context.clear_permissions succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.clear_permissions failed")
-            raise e
+        )
 
     def set_geolocation(
         self, latitude: float, longitude: float, accuracy: float = None
@@ -8073,34 +6991,22 @@ class BrowserContext(SyncBase):
         accuracy : Union[float, NoneType]
             Non-negative accuracy value. Defaults to `0`.
         """
-
-        try:
-            log_api("=> browser_context.set_geolocation started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_geolocation(
-                        latitude=latitude, longitude=longitude, accuracy=accuracy
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.set_geolocation",
+                self._impl_obj.set_geolocation,
+                latitude=latitude,
+                longitude=longitude,
+                accuracy=accuracy,
             )
-            log_api("<= browser_context.set_geolocation succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_geolocation failed")
-            raise e
+        )
 
     def reset_geolocation(self) -> NoneType:
-
-        try:
-            log_api("=> browser_context.reset_geolocation started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.reset_geolocation())
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.reset_geolocation", self._impl_obj.reset_geolocation
             )
-            log_api("<= browser_context.reset_geolocation succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.reset_geolocation failed")
-            raise e
+        )
 
     def set_extra_http_headers(self, headers: typing.Dict[str, str]) -> NoneType:
         """BrowserContext.set_extra_http_headers
@@ -8116,21 +7022,13 @@ class BrowserContext(SyncBase):
         headers : Dict[str, str]
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
-
-        try:
-            log_api("=> browser_context.set_extra_http_headers started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.set_extra_http_headers(
-                        headers=mapping.to_impl(headers)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.set_extra_http_headers",
+                self._impl_obj.set_extra_http_headers,
+                headers=mapping.to_impl(headers),
             )
-            log_api("<= browser_context.set_extra_http_headers succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_extra_http_headers failed")
-            raise e
+        )
 
     def set_offline(self, offline: bool) -> NoneType:
         """BrowserContext.set_offline
@@ -8140,17 +7038,13 @@ class BrowserContext(SyncBase):
         offline : bool
             Whether to emulate network being offline for the browser context.
         """
-
-        try:
-            log_api("=> browser_context.set_offline started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.set_offline(offline=offline))
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.set_offline",
+                self._impl_obj.set_offline,
+                offline=offline,
             )
-            log_api("<= browser_context.set_offline succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.set_offline failed")
-            raise e
+        )
 
     def add_init_script(
         self, script: str = None, path: typing.Union[str, pathlib.Path] = None
@@ -8175,17 +7069,14 @@ class BrowserContext(SyncBase):
         script : Union[str, NoneType]
             Script to be evaluated in all pages in the browser context.
         """
-
-        try:
-            log_api("=> browser_context.add_init_script started")
-            result = mapping.from_maybe_impl(
-                self._sync(self._impl_obj.add_init_script(script=script, path=path))
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.add_init_script",
+                self._impl_obj.add_init_script,
+                script=script,
+                path=path,
             )
-            log_api("<= browser_context.add_init_script succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.add_init_script failed")
-            raise e
+        )
 
     def expose_binding(
         self, name: str, callback: typing.Callable, handle: bool = None
@@ -8215,21 +7106,15 @@ class BrowserContext(SyncBase):
             Whether to pass the argument as a handle, instead of passing by value. When passing a handle, only one argument is
             supported. When passing by value, multiple arguments are supported.
         """
-
-        try:
-            log_api("=> browser_context.expose_binding started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.expose_binding(
-                        name=name, callback=self._wrap_handler(callback), handle=handle
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.expose_binding",
+                self._impl_obj.expose_binding,
+                name=name,
+                callback=self._wrap_handler(callback),
+                handle=handle,
             )
-            log_api("<= browser_context.expose_binding succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.expose_binding failed")
-            raise e
+        )
 
     def expose_function(self, name: str, callback: typing.Callable) -> NoneType:
         """BrowserContext.expose_function
@@ -8250,21 +7135,14 @@ class BrowserContext(SyncBase):
         callback : Callable
             Callback function that will be called in the Playwright's context.
         """
-
-        try:
-            log_api("=> browser_context.expose_function started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.expose_function(
-                        name=name, callback=self._wrap_handler(callback)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.expose_function",
+                self._impl_obj.expose_function,
+                name=name,
+                callback=self._wrap_handler(callback),
             )
-            log_api("<= browser_context.expose_function succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.expose_function failed")
-            raise e
+        )
 
     def route(
         self,
@@ -8295,21 +7173,14 @@ class BrowserContext(SyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any]]
             handler function to route the request.
         """
-
-        try:
-            log_api("=> browser_context.route started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.route(
-                        url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.route",
+                self._impl_obj.route,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= browser_context.route succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.route failed")
-            raise e
+        )
 
     def unroute(
         self,
@@ -8332,21 +7203,14 @@ class BrowserContext(SyncBase):
         handler : Union[Callable[[Route, Request], Any], Callable[[Route], Any], NoneType]
             Optional handler function used to register a routing with `browser_context.route()`.
         """
-
-        try:
-            log_api("=> browser_context.unroute started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.unroute(
-                        url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.unroute",
+                self._impl_obj.unroute,
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
             )
-            log_api("<= browser_context.unroute succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.unroute failed")
-            raise e
+        )
 
     def wait_for_event(
         self,
@@ -8373,23 +7237,15 @@ class BrowserContext(SyncBase):
         -------
         Any
         """
-
-        try:
-            log_api("=> browser_context.wait_for_event started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.wait_for_event(
-                        event=event,
-                        predicate=self._wrap_handler(predicate),
-                        timeout=timeout,
-                    )
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "browser_context.wait_for_event",
+                self._impl_obj.wait_for_event,
+                event=event,
+                predicate=self._wrap_handler(predicate),
+                timeout=timeout,
             )
-            log_api("<= browser_context.wait_for_event succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.wait_for_event failed")
-            raise e
+        )
 
     def close(self) -> NoneType:
         """BrowserContext.close
@@ -8398,15 +7254,9 @@ class BrowserContext(SyncBase):
 
         > **NOTE** the default browser context cannot be closed.
         """
-
-        try:
-            log_api("=> browser_context.close started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.close()))
-            log_api("<= browser_context.close succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.close failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("browser_context.close", self._impl_obj.close)
+        )
 
     def storage_state(
         self, path: typing.Union[str, pathlib.Path] = None
@@ -8426,17 +7276,11 @@ class BrowserContext(SyncBase):
         -------
         {cookies: Union[List[{name: str, value: str, url: Union[str, NoneType], domain: Union[str, NoneType], path: Union[str, NoneType], expires: Union[float, NoneType], httpOnly: Union[bool, NoneType], secure: Union[bool, NoneType], sameSite: Union["Strict", "Lax", "None", NoneType]}], NoneType], origins: Union[List[Dict], NoneType]}
         """
-
-        try:
-            log_api("=> browser_context.storage_state started")
-            result = mapping.from_impl(
-                self._sync(self._impl_obj.storage_state(path=path))
+        return _from_impl(
+            self._call_sync(
+                "browser_context.storage_state", self._impl_obj.storage_state, path=path
             )
-            log_api("<= browser_context.storage_state succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_context.storage_state failed")
-            raise e
+        )
 
     def expect_event(
         self,
@@ -8491,9 +7335,8 @@ class BrowserContext(SyncBase):
             The default value can be changed by using the browserContext.set_default_timeout(timeout) or
             page.set_default_timeout(timeout) methods.
         """
-        event = "page"
         return EventContextManager(
-            self, self._impl_obj.wait_for_event(event, predicate, timeout)
+            self, self._impl_obj.wait_for_event("page", predicate, timeout)
         )
 
 
@@ -8501,6 +7344,8 @@ mapping.register(BrowserContextImpl, BrowserContext)
 
 
 class CDPSession(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: CDPSessionImpl):
         super().__init__(obj)
 
@@ -8518,19 +7363,14 @@ class CDPSession(SyncBase):
         -------
         Dict
         """
-
-        try:
-            log_api("=> cdp_session.send started")
-            result = mapping.from_maybe_impl(
-                self._sync(
-                    self._impl_obj.send(method=method, params=mapping.to_impl(params))
-                )
+        return _from_maybe_impl(
+            self._call_sync(
+                "cdp_session.send",
+                self._impl_obj.send,
+                method=method,
+                params=mapping.to_impl(params),
             )
-            log_api("<= cdp_session.send succeded")
-            return result
-        except Exception as e:
-            log_api("<= cdp_session.send failed")
-            raise e
+        )
 
     def detach(self) -> NoneType:
         """CDPSession.detach
@@ -8538,21 +7378,17 @@ class CDPSession(SyncBase):
         Detaches the CDPSession from the target. Once detached, the CDPSession object won't emit any events and can't be used to
         send messages.
         """
-
-        try:
-            log_api("=> cdp_session.detach started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.detach()))
-            log_api("<= cdp_session.detach succeded")
-            return result
-        except Exception as e:
-            log_api("<= cdp_session.detach failed")
-            raise e
+        return _from_maybe_impl(
+            self._call_sync("cdp_session.detach", self._impl_obj.detach)
+        )
 
 
 mapping.register(CDPSessionImpl, CDPSession)
 
 
 class ChromiumBrowserContext(BrowserContext):
+    __slots__ = ()
+
     def __init__(self, obj: ChromiumBrowserContextImpl):
         super().__init__(obj)
 
@@ -8565,15 +7401,12 @@ class ChromiumBrowserContext(BrowserContext):
         -------
         List[Page]
         """
-
-        try:
-            log_api("=> chromium_browser_context.background_pages started")
-            result = mapping.from_impl_list(self._impl_obj.background_pages())
-            log_api("<= chromium_browser_context.background_pages succeded")
-            return result
-        except Exception as e:
-            log_api("<= chromium_browser_context.background_pages failed")
-            raise e
+        return _from_impl_list(
+            self._call(
+                "chromium_browser_context.background_pages",
+                self._impl_obj.background_pages,
+            )
+        )
 
     def service_workers(self) -> typing.List["Worker"]:
         """ChromiumBrowserContext.service_workers
@@ -8584,15 +7417,12 @@ class ChromiumBrowserContext(BrowserContext):
         -------
         List[Worker]
         """
-
-        try:
-            log_api("=> chromium_browser_context.service_workers started")
-            result = mapping.from_impl_list(self._impl_obj.service_workers())
-            log_api("<= chromium_browser_context.service_workers succeded")
-            return result
-        except Exception as e:
-            log_api("<= chromium_browser_context.service_workers failed")
-            raise e
+        return _from_impl_list(
+            self._call(
+                "chromium_browser_context.service_workers",
+                self._impl_obj.service_workers,
+            )
+        )
 
     def new_cdp_session(self, page: "Page") -> "CDPSession":
         """ChromiumBrowserContext.new_cdp_session
@@ -8608,23 +7438,21 @@ class ChromiumBrowserContext(BrowserContext):
         -------
         CDPSession
         """
-
-        try:
-            log_api("=> chromium_browser_context.new_cdp_session started")
-            result = mapping.from_impl(
-                self._sync(self._impl_obj.new_cdp_session(page=page._impl_obj))
+        return _from_impl(
+            self._call_sync(
+                "chromium_browser_context.new_cdp_session",
+                self._impl_obj.new_cdp_session,
+                page=page._impl_obj,
             )
-            log_api("<= chromium_browser_context.new_cdp_session succeded")
-            return result
-        except Exception as e:
-            log_api("<= chromium_browser_context.new_cdp_session failed")
-            raise e
+        )
 
 
 mapping.register(ChromiumBrowserContextImpl, ChromiumBrowserContext)
 
 
 class Browser(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BrowserImpl):
         super().__init__(obj)
 
@@ -8638,7 +7466,7 @@ class Browser(SyncBase):
         -------
         List[BrowserContext]
         """
-        return mapping.from_impl_list(self._impl_obj.contexts)
+        return _from_impl_list(self._impl_obj.contexts)
 
     @property
     def version(self) -> str:
@@ -8650,7 +7478,7 @@ class Browser(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.version)
+        return _from_maybe_impl(self._impl_obj.version)
 
     def is_connected(self) -> bool:
         """Browser.is_connected
@@ -8661,15 +7489,9 @@ class Browser(SyncBase):
         -------
         bool
         """
-
-        try:
-            log_api("=> browser.is_connected started")
-            result = mapping.from_maybe_impl(self._impl_obj.is_connected())
-            log_api("<= browser.is_connected succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.is_connected failed")
-            raise e
+        return _from_maybe_impl(
+            self._call("browser.is_connected", self._impl_obj.is_connected)
+        )
 
     def new_context(
         self,
@@ -8766,44 +7588,36 @@ class Browser(SyncBase):
         -------
         BrowserContext
         """
-
-        try:
-            log_api("=> browser.new_context started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.new_context(
-                        viewport=viewport,
-                        ignoreHTTPSErrors=ignore_https_errors,
-                        javaScriptEnabled=java_script_enabled,
-                        bypassCSP=bypass_csp,
-                        userAgent=user_agent,
-                        locale=locale,
-                        timezoneId=timezone_id,
-                        geolocation=geolocation,
-                        permissions=permissions,
-                        extraHTTPHeaders=mapping.to_impl(extra_http_headers),
-                        offline=offline,
-                        httpCredentials=http_credentials,
-                        deviceScaleFactor=device_scale_factor,
-                        isMobile=is_mobile,
-                        hasTouch=has_touch,
-                        colorScheme=color_scheme,
-                        acceptDownloads=accept_downloads,
-                        defaultBrowserType=default_browser_type,
-                        proxy=proxy,
-                        recordHarPath=record_har_path,
-                        recordHarOmitContent=record_har_omit_content,
-                        recordVideoDir=record_video_dir,
-                        recordVideoSize=record_video_size,
-                        storageState=storage_state,
-                    )
-                )
-            )
-            log_api("<= browser.new_context succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.new_context failed")
-            raise e
+        return _from_impl(
+            self._call_sync(
+                "browser.new_context",
+                self._impl_obj.new_context,
+                viewport=viewport,
+                ignoreHTTPSErrors=ignore_https_errors,
+                javaScriptEnabled=java_script_enabled,
+                bypassCSP=bypass_csp,
+                userAgent=user_agent,
+                locale=locale,
+                timezoneId=timezone_id,
+                geolocation=geolocation,
+                permissions=permissions,
+                extraHTTPHeaders=mapping.to_impl(extra_http_headers),
+                offline=offline,
+                httpCredentials=http_credentials,
+                deviceScaleFactor=device_scale_factor,
+                isMobile=is_mobile,
+                hasTouch=has_touch,
+                colorScheme=color_scheme,
+                acceptDownloads=accept_downloads,
+                defaultBrowserType=default_browser_type,
+                proxy=proxy,
+                recordHarPath=record_har_path,
+                recordHarOmitContent=record_har_omit_content,
+                recordVideoDir=record_video_dir,
+                recordVideoSize=record_video_size,
+                storageState=storage_state,
+            )
+        )
 
     def new_page(
         self,
@@ -8904,44 +7718,36 @@ class Browser(SyncBase):
         -------
         Page
         """
-
-        try:
-            log_api("=> browser.new_page started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.new_page(
-                        viewport=viewport,
-                        ignoreHTTPSErrors=ignore_https_errors,
-                        javaScriptEnabled=java_script_enabled,
-                        bypassCSP=bypass_csp,
-                        userAgent=user_agent,
-                        locale=locale,
-                        timezoneId=timezone_id,
-                        geolocation=geolocation,
-                        permissions=permissions,
-                        extraHTTPHeaders=mapping.to_impl(extra_http_headers),
-                        offline=offline,
-                        httpCredentials=http_credentials,
-                        deviceScaleFactor=device_scale_factor,
-                        isMobile=is_mobile,
-                        hasTouch=has_touch,
-                        colorScheme=color_scheme,
-                        acceptDownloads=accept_downloads,
-                        defaultBrowserType=default_browser_type,
-                        proxy=proxy,
-                        recordHarPath=record_har_path,
-                        recordHarOmitContent=record_har_omit_content,
-                        recordVideoDir=record_video_dir,
-                        recordVideoSize=record_video_size,
-                        storageState=storage_state,
-                    )
-                )
-            )
-            log_api("<= browser.new_page succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.new_page failed")
-            raise e
+        return _from_impl(
+            self._call_sync(
+                "browser.new_page",
+                self._impl_obj.new_page,
+                viewport=viewport,
+                ignoreHTTPSErrors=ignore_https_errors,
+                javaScriptEnabled=java_script_enabled,
+                bypassCSP=bypass_csp,
+                userAgent=user_agent,
+                locale=locale,
+                timezoneId=timezone_id,
+                geolocation=geolocation,
+                permissions=permissions,
+                extraHTTPHeaders=mapping.to_impl(extra_http_headers),
+                offline=offline,
+                httpCredentials=http_credentials,
+                deviceScaleFactor=device_scale_factor,
+                isMobile=is_mobile,
+                hasTouch=has_touch,
+                colorScheme=color_scheme,
+                acceptDownloads=accept_downloads,
+                defaultBrowserType=default_browser_type,
+                proxy=proxy,
+                recordHarPath=record_har_path,
+                recordHarOmitContent=record_har_omit_content,
+                recordVideoDir=record_video_dir,
+                recordVideoSize=record_video_size,
+                storageState=storage_state,
+            )
+        )
 
     def close(self) -> NoneType:
         """Browser.close
@@ -8954,21 +7760,15 @@ class Browser(SyncBase):
 
         The `Browser` object itself is considered to be disposed and cannot be used anymore.
         """
-
-        try:
-            log_api("=> browser.close started")
-            result = mapping.from_maybe_impl(self._sync(self._impl_obj.close()))
-            log_api("<= browser.close succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser.close failed")
-            raise e
+        return _from_maybe_impl(self._call_sync("browser.close", self._impl_obj.close))
 
 
 mapping.register(BrowserImpl, Browser)
 
 
 class BrowserType(SyncBase):
+    __slots__ = ()
+
     def __init__(self, obj: BrowserTypeImpl):
         super().__init__(obj)
 
@@ -8982,7 +7782,7 @@ class BrowserType(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return _from_maybe_impl(self._impl_obj.name)
 
     @property
     def executable_path(self) -> str:
@@ -8994,7 +7794,7 @@ class BrowserType(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.executable_path)
+        return _from_maybe_impl(self._impl_obj.executable_path)
 
     def launch(
         self,
@@ -9085,35 +7885,27 @@ class BrowserType(SyncBase):
         -------
         Browser
         """
-
-        try:
-            log_api("=> browser_type.launch started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.launch(
-                        executablePath=executable_path,
-                        args=args,
-                        ignoreDefaultArgs=ignore_default_args,
-                        handleSIGINT=handle_sigint,
-                        handleSIGTERM=handle_sigterm,
-                        handleSIGHUP=handle_sighup,
-                        timeout=timeout,
-                        env=mapping.to_impl(env),
-                        headless=headless,
-                        devtools=devtools,
-                        proxy=proxy,
-                        downloadsPath=downloads_path,
-                        slowMo=slow_mo,
-                        chromiumSandbox=chromium_sandbox,
-                        firefoxUserPrefs=mapping.to_impl(firefox_user_prefs),
-                    )
-                )
-            )
-            log_api("<= browser_type.launch succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_type.launch failed")
-            raise e
+        return _from_impl(
+            self._call_sync(
+                "browser_type.launch",
+                self._impl_obj.launch,
+                executablePath=executable_path,
+                args=args,
+                ignoreDefaultArgs=ignore_default_args,
+                handleSIGINT=handle_sigint,
+                handleSIGTERM=handle_sigterm,
+                handleSIGHUP=handle_sighup,
+                timeout=timeout,
+                env=mapping.to_impl(env),
+                headless=headless,
+                devtools=devtools,
+                proxy=proxy,
+                downloadsPath=downloads_path,
+                slowMo=slow_mo,
+                chromiumSandbox=chromium_sandbox,
+                firefoxUserPrefs=mapping.to_impl(firefox_user_prefs),
+            )
+        )
 
     def launch_persistent_context(
         self,
@@ -9260,56 +8052,48 @@ class BrowserType(SyncBase):
         -------
         BrowserContext
         """
-
-        try:
-            log_api("=> browser_type.launch_persistent_context started")
-            result = mapping.from_impl(
-                self._sync(
-                    self._impl_obj.launch_persistent_context(
-                        userDataDir=user_data_dir,
-                        executablePath=executable_path,
-                        args=args,
-                        ignoreDefaultArgs=ignore_default_args,
-                        handleSIGINT=handle_sigint,
-                        handleSIGTERM=handle_sigterm,
-                        handleSIGHUP=handle_sighup,
-                        timeout=timeout,
-                        env=mapping.to_impl(env),
-                        headless=headless,
-                        devtools=devtools,
-                        proxy=proxy,
-                        downloadsPath=downloads_path,
-                        slowMo=slow_mo,
-                        viewport=viewport,
-                        ignoreHTTPSErrors=ignore_https_errors,
-                        javaScriptEnabled=java_script_enabled,
-                        bypassCSP=bypass_csp,
-                        userAgent=user_agent,
-                        locale=locale,
-                        timezoneId=timezone_id,
-                        geolocation=geolocation,
-                        permissions=permissions,
-                        extraHTTPHeaders=mapping.to_impl(extra_http_headers),
-                        offline=offline,
-                        httpCredentials=http_credentials,
-                        deviceScaleFactor=device_scale_factor,
-                        isMobile=is_mobile,
-                        hasTouch=has_touch,
-                        colorScheme=color_scheme,
-                        acceptDownloads=accept_downloads,
-                        chromiumSandbox=chromium_sandbox,
-                        recordHarPath=record_har_path,
-                        recordHarOmitContent=record_har_omit_content,
-                        recordVideoDir=record_video_dir,
-                        recordVideoSize=record_video_size,
-                    )
-                )
-            )
-            log_api("<= browser_type.launch_persistent_context succeded")
-            return result
-        except Exception as e:
-            log_api("<= browser_type.launch_persistent_context failed")
-            raise e
+        return _from_impl(
+            self._call_sync(
+                "browser_type.launch_persistent_context",
+                self._impl_obj.launch_persistent_context,
+                userDataDir=user_data_dir,
+                executablePath=executable_path,
+                args=args,
+                ignoreDefaultArgs=ignore_default_args,
+                handleSIGINT=handle_sigint,
+                handleSIGTERM=handle_sigterm,
+                handleSIGHUP=handle_sighup,
+                timeout=timeout,
+                env=mapping.to_impl(env),
+                headless=headless,
+                devtools=devtools,
+                proxy=proxy,
+                downloadsPath=downloads_path,
+                slowMo=slow_mo,
+                viewport=viewport,
+                ignoreHTTPSErrors=ignore_https_errors,
+                javaScriptEnabled=java_script_enabled,
+                bypassCSP=bypass_csp,
+                userAgent=user_agent,
+                locale=locale,
+                timezoneId=timezone_id,
+                geolocation=geolocation,
+                permissions=permissions,
+                extraHTTPHeaders=mapping.to_impl(extra_http_headers),
+                offline=offline,
+                httpCredentials=http_credentials,
+                deviceScaleFactor=device_scale_factor,
+                isMobile=is_mobile,
+                hasTouch=has_touch,
+                colorScheme=color_scheme,
+                acceptDownloads=accept_downloads,
+                chromiumSandbox=chromium_sandbox,
+                recordHarPath=record_har_path,
+                recordHarOmitContent=record_har_omit_content,
+                recordVideoDir=record_video_dir,
+                recordVideoSize=record_video_size,
+            )
+        )
 
 
 mapping.register(BrowserTypeImpl, BrowserType)
@@ -9331,7 +8115,7 @@ class Playwright(SyncBase):
         -------
         Dict[str, {user_agent: Union[str, NoneType], viewport: Union[typing.Tuple[int, int], NoneType], device_scale_factor: Union[int, NoneType], is_mobile: Union[bool, NoneType], has_touch: Union[bool, NoneType]}]
         """
-        return mapping.from_impl_dict(self._impl_obj.devices)
+        return _from_impl_dict(self._impl_obj.devices)
 
     @property
     def selectors(self) -> "Selectors":
@@ -9344,7 +8128,7 @@ class Playwright(SyncBase):
         -------
         Selectors
         """
-        return mapping.from_impl(self._impl_obj.selectors)
+        return _from_impl(self._impl_obj.selectors)
 
     @property
     def chromium(self) -> "BrowserType":
@@ -9356,7 +8140,7 @@ class Playwright(SyncBase):
         -------
         BrowserType
         """
-        return mapping.from_impl(self._impl_obj.chromium)
+        return _from_impl(self._impl_obj.chromium)
 
     @property
     def firefox(self) -> "BrowserType":
@@ -9368,7 +8152,7 @@ class Playwright(SyncBase):
         -------
         BrowserType
         """
-        return mapping.from_impl(self._impl_obj.firefox)
+        return _from_impl(self._impl_obj.firefox)
 
     @property
     def webkit(self) -> "BrowserType":
@@ -9380,18 +8164,10 @@ class Playwright(SyncBase):
         -------
         BrowserType
         """
-        return mapping.from_impl(self._impl_obj.webkit)
+        return _from_impl(self._impl_obj.webkit)
 
     def stop(self) -> NoneType:
-
-        try:
-            log_api("=> playwright.stop started")
-            result = mapping.from_maybe_impl(self._impl_obj.stop())
-            log_api("<= playwright.stop succeded")
-            return result
-        except Exception as e:
-            log_api("<= playwright.stop failed")
-            raise e
+        return _from_maybe_impl(self._call("playwright.stop", self._impl_obj.stop))
 
 
 mapping.register(PlaywrightImpl, Playwright)
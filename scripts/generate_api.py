@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import re
 from types import FunctionType
 from typing import (  # type: ignore
     Any,
+    Dict,
     List,
     Match,
     Union,
@@ -63,8 +65,13 @@ def process_type(value: Any, param: bool = False) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=None)
+def type_hints(value: Any) -> Dict[str, Any]:
+    return get_type_hints(value, api_globals)
+
+
 def signature(func: FunctionType, indent: int) -> str:
-    hints = get_type_hints(func, globals())
+    hints = type_hints(func)
     tokens = ["self"]
     split = ",\n" + " " * indent
 
@@ -77,7 +84,7 @@ def signature(func: FunctionType, indent: int) -> str:
 
 
 def arguments(func: FunctionType, indent: int) -> str:
-    hints = get_type_hints(func, globals())
+    hints = type_hints(func)
     tokens = []
     split = ",\n" + " " * indent
     for [name, value] in hints.items():
@@ -100,7 +107,7 @@ def arguments(func: FunctionType, indent: int) -> str:
 
 
 def return_type(func: FunctionType) -> str:
-    value = get_type_hints(func, globals())["return"]
+    value = type_hints(func)["return"]
     return process_type(value)
 
 
@@ -114,18 +121,36 @@ def short_name(t: Any) -> str:
 def return_value(value: Any) -> List[str]:
     value_str = str(value)
     if "playwright" not in value_str:
-        return ["mapping.from_maybe_impl(", ")"]
+        return ["_from_maybe_impl(", ")"]
     if (
         get_origin(value) == Union
         and len(get_args(value)) == 2
         and str(get_args(value)[1]) == "<class 'NoneType'>"
     ):
-        return ["mapping.from_impl_nullable(", ")"]
+        return ["_from_impl_nullable(", ")"]
     if str(get_origin(value)) == "<class 'list'>":
-        return ["mapping.from_impl_list(", ")"]
+        return ["_from_impl_list(", ")"]
     if str(get_origin(value)) == "<class 'dict'>":
-        return ["mapping.from_impl_dict(", ")"]
-    return ["mapping.from_impl(", ")"]
+        return ["_from_impl_dict(", ")"]
+    return ["_from_impl(", ")"]
+
+
+expect_wait_for_methods = {
+    "event": "wait_for_event(event, predicate, timeout)",
+    "request": "wait_for_request(url_or_predicate, timeout)",
+    "response": "wait_for_response(url_or_predicate, timeout)",
+    "loadstate": "wait_for_load_state(state, timeout)",
+    "navigation": "wait_for_navigation(url, wait_until, timeout)",
+}
+
+
+mapping_aliases = """
+_from_maybe_impl = mapping.from_maybe_impl
+_from_impl = mapping.from_impl
+_from_impl_nullable = mapping.from_impl_nullable
+_from_impl_list = mapping.from_impl_list
+_from_impl_dict = mapping.from_impl_dict
+"""
 
 
 header = """
@@ -183,7 +208,6 @@ from playwright._impl._page import BindingCall as BindingCallImpl, Page as PageI
 from playwright._impl._playwright import Playwright as PlaywrightImpl
 from playwright._impl._selectors import Selectors as SelectorsImpl
 from playwright._impl._video import Video as VideoImpl
-from playwright._impl._logger import log_api
 
 """
 
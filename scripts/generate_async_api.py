@@ -16,28 +16,32 @@
 import inspect
 import re
 from types import FunctionType
-from typing import Any, get_type_hints  # type: ignore
+from typing import Any, List, Tuple
 
 from playwright._impl._helper import to_snake_case
 from scripts.documentation_provider import DocumentationProvider
 from scripts.generate_api import (
     all_types,
-    api_globals,
     arguments,
+    expect_wait_for_methods,
     header,
+    mapping_aliases,
     process_type,
     return_type,
     return_value,
     short_name,
     signature,
+    type_hints,
 )
 
 documentation_provider = DocumentationProvider()
+impl_type_re = re.compile(r"\"([^\"]+)Impl\"")
 
 
 def generate(t: Any) -> None:
     print("")
     class_name = short_name(t)
+    snake_class_name = to_snake_case(class_name)
     base_class = t.__bases__[0].__name__
     base_sync_class = (
         "AsyncBase"
@@ -45,10 +49,15 @@ def generate(t: Any) -> None:
         else base_class
     )
     print(f"class {class_name}({base_sync_class}):")
-    print("")
+    # Playwright keeps a __dict__, the context managers attach stop() to it.
+    if class_name != "Playwright":
+        print("    __slots__ = ()")
+        print("")
+    else:
+        print("")
     print(f"    def __init__(self, obj: {class_name}Impl):")
     print("        super().__init__(obj)")
-    for [name, type] in get_type_hints(t, api_globals).items():
+    for [name, type] in type_hints(t).items():
         print("")
         print("    @property")
         print(f"    def {name}(self) -> {process_type(type)}:")
@@ -56,64 +65,53 @@ def generate(t: Any) -> None:
         [prefix, suffix] = return_value(type)
         prefix = "        return " + prefix + f"self._impl_obj.{name}"
         print(f"{prefix}{suffix}")
+    properties: List[Tuple[str, Any]] = []
+    methods: List[Tuple[str, Any]] = []
     for [name, value] in t.__dict__.items():
         if name.startswith("_"):
             continue
-        if not name.startswith("_") and str(value).startswith("<property"):
-            value = value.fget
-            print("")
-            print("    @property")
-            print(
-                f"    def {name}({signature(value, len(name) + 9)}) -> {return_type(value)}:"
-            )
-            documentation_provider.print_entry(
-                class_name, name, get_type_hints(value, api_globals)
-            )
-            [prefix, suffix] = return_value(
-                get_type_hints(value, api_globals)["return"]
-            )
-            prefix = "        return " + prefix + f"self._impl_obj.{name}"
-            print(f"{prefix}{arguments(value, len(prefix))}{suffix}")
-    for [name, value] in t.__dict__.items():
-        if (
-            not name.startswith("_")
-            and isinstance(value, FunctionType)
-            and "expect_" not in name
-            and "remove_listener" != name
+        if isinstance(value, property):
+            properties.append((name, value.fget))
+        elif "expect_" in name or (
+            isinstance(value, FunctionType) and name != "remove_listener"
         ):
+            methods.append((name, value))
+    for [name, value] in properties:
+        print("")
+        print("    @property")
+        print(
+            f"    def {name}({signature(value, len(name) + 9)}) -> {return_type(value)}:"
+        )
+        hints = type_hints(value)
+        documentation_provider.print_entry(class_name, name, hints)
+        [prefix, suffix] = return_value(hints["return"])
+        prefix = "        return " + prefix + f"self._impl_obj.{name}"
+        print(f"{prefix}{arguments(value, len(prefix))}{suffix}")
+    for [name, value] in methods:
+        if "expect_" not in name:
             is_async = inspect.iscoroutinefunction(value)
             print("")
             async_prefix = "async " if is_async else ""
-            await_prefix = "await " if is_async else ""
             print(
                 f"    {async_prefix}def {name}({signature(value, len(name) + 9)}) -> {return_type(value)}:"
             )
-            documentation_provider.print_entry(
-                class_name, name, get_type_hints(value, api_globals)
-            )
-            [prefix, suffix] = return_value(
-                get_type_hints(value, api_globals)["return"]
-            )
-            prefix = prefix + f"{await_prefix}self._impl_obj.{name}("
+            hints = type_hints(value)
+            documentation_provider.print_entry(class_name, name, hints)
+            [prefix, suffix] = return_value(hints["return"])
+            api_name = f"{snake_class_name}.{name}"
+            call = "await self._call_async" if is_async else "self._call"
+            prefix = "        return " + prefix
+            prefix = prefix + f'{call}("{api_name}", self._impl_obj.{name}'
             suffix = ")" + suffix
-            print(
-                f"""
-        try:
-            log_api("=> {to_snake_case(class_name)}.{name} started")
-            result = {prefix}{arguments(value, len(prefix))}{suffix}
-            log_api("<= {to_snake_case(class_name)}.{name} succeded")
-            return result
-        except Exception as e:
-            log_api("<= {to_snake_case(class_name)}.{name} failed")
-            raise e"""
-            )
-        if "expect_" in name:
+            args = arguments(value, len(prefix))
+            print(f"{prefix}{', ' + args if args else ''}{suffix}")
+        else:
             print("")
             return_type_value = return_type(value)
-            return_type_value = re.sub(r"\"([^\"]+)Impl\"", r"\1", return_type_value)
-            event_name = re.sub(r"expect_(.*)", r"\1", name)
-            event_name = re.sub(r"_", "", event_name)
-            event_name = re.sub(r"consolemessage", "console", event_name)
+            return_type_value = impl_type_re.sub(r"\1", return_type_value)
+            event_name = name.replace("expect_", "", 1).replace("_", "")
+            if event_name == "consolemessage":
+                event_name = "console"
 
             print(
                 f"""    def {name}({signature(value, len(name) + 9)}) -> Async{return_type_value}:
@@ -138,17 +136,9 @@ def generate(t: Any) -> None:
         \"\"\""""
             )
 
-            wait_for_method = "wait_for_event(event, predicate, timeout)"
-            if event_name == "request":
-                wait_for_method = "wait_for_request(url_or_predicate, timeout)"
-            elif event_name == "response":
-                wait_for_method = "wait_for_response(url_or_predicate, timeout)"
-            elif event_name == "loadstate":
-                wait_for_method = "wait_for_load_state(state, timeout)"
-            elif event_name == "navigation":
-                wait_for_method = "wait_for_navigation(url, wait_until, timeout)"
-            elif event_name != "event":
-                print(f'        event = "{event_name}"')
+            wait_for_method = expect_wait_for_methods.get(
+                event_name, f'wait_for_event("{event_name}", predicate, timeout)'
+            )
 
             print(
                 f"        return AsyncEventContextManager(self._impl_obj.{wait_for_method})"
@@ -164,6 +154,7 @@ def main() -> None:
         "from playwright._impl._async_base import AsyncEventContextManager, AsyncBase, mapping"
     )
     print("NoneType = type(None)")
+    print(mapping_aliases)
 
     for t in all_types:
         generate(t)
@@ -227,6 +227,37 @@ async def test_frame_name(page, server, utils):
     assert page.frames[2].name == "theFrameName"
 
 
+async def test_frame_by_name_with_duplicate_names_and_renames(page, server):
+    await page.goto(server.EMPTY_PAGE)
+    await page.evaluate(
+        """url => Promise.all(['x', 'x'].map(name => {
+            const frame = document.createElement('iframe');
+            frame.name = name;
+            frame.src = url;
+            document.body.appendChild(frame);
+            return new Promise(x => frame.onload = x);
+        }))""",
+        server.EMPTY_PAGE,
+    )
+    [_, first, second] = page.frames
+    assert page.frame(name="x") == first
+
+    await first.evaluate("window.name = 'y'")
+    await first.goto(server.EMPTY_PAGE)
+    assert first.name == "y"
+    assert page.frame(name="x") == second
+    assert page.frame(name="y") == first
+
+    await first.evaluate("window.name = 'x'")
+    await first.goto(server.EMPTY_PAGE)
+    assert page.frame(name="x") == first
+
+    async with page.expect_event("framedetached"):
+        await page.evaluate("() => document.querySelector('iframe').remove()")
+    assert page.frame(name="x") == second
+    assert page.frame(name="y") is None
+
+
 async def test_frame_parent(page, server, utils):
     await utils.attach_frame(page, "frame1", server.EMPTY_PAGE)
     await utils.attach_frame(page, "frame2", server.EMPTY_PAGE)
@@ -358,6 +358,24 @@ async def test_expose_function_should_await_returned_promise(page):
     assert await page.evaluate("compute(3, 5)") == 15
 
 
+async def test_expose_function_should_await_async_callback(page):
+    async def mul(a, b):
+        await asyncio.sleep(0)
+        return a * b
+
+    await page.expose_function("compute", mul)
+    assert await page.evaluate("compute(3, 5)") == 15
+
+
+async def test_expose_binding_should_await_async_callback(page):
+    async def frame_url(source, suffix):
+        await asyncio.sleep(0)
+        return source["frame"].url + suffix
+
+    await page.expose_binding("frameUrl", frame_url)
+    assert await page.evaluate("frameUrl('#hash')") == "about:blank#hash"
+
+
 async def test_expose_function_should_work_on_frames(page, server):
     await page.expose_function("compute", lambda a, b: a * b)
     await page.goto(server.PREFIX + "/frames/nested-frames.html")
@@ -1222,3 +1240,38 @@ async def test_frame_press_should_work(page, server):
     frame = page.frame("inner")
     await frame.press("textarea", "a")
     assert await frame.evaluate("document.querySelector('textarea').value") == "a"
+
+
+async def test_file_chooser_listeners_toggled_in_same_tick_keep_interception(page):
+    await page.set_content("<input type=file>")
+    fc_done: asyncio.Future = asyncio.Future()
+
+    def first(file_chooser):
+        pass
+
+    page.on("filechooser", first)
+    page.remove_listener("filechooser", first)
+    page.once("filechooser", lambda file_chooser: fc_done.set_result(file_chooser))
+    await page.click("input")
+    file_chooser = await fc_done
+    assert file_chooser.page == page
+
+
+async def test_file_chooser_interception_is_restored_after_last_listener_removed(
+    page,
+):
+    await page.set_content("<input type=file>")
+
+    def listener(file_chooser):
+        pass
+
+    page.on("filechooser", listener)
+    page.remove_listener("filechooser", listener)
+    # Let the deferred release of the interception go out.
+    await asyncio.sleep(0)
+    await page.evaluate("1")
+
+    async with page.expect_event("filechooser") as fc_info:
+        await page.click("input")
+    file_chooser = await fc_info.value
+    assert file_chooser.page == page
@@ -0,0 +1,110 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from playwright._impl._transport import Transport
+
+
+class FakeOutput:
+    def __init__(self):
+        self.writes = []
+        self.closed = False
+        self.error = None
+
+    def write(self, data):
+        assert not self.closed
+        if self.error:
+            raise self.error
+        self.writes.append(data)
+
+    def close(self):
+        self.closed = True
+
+
+def decode_frames(data):
+    messages = []
+    stream = io.BytesIO(data)
+    header = stream.read(4)
+    while header:
+        length = int.from_bytes(header, byteorder="little", signed=False)
+        messages.append(json.loads(stream.read(length)))
+        header = stream.read(4)
+    return messages
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def transport(loop):
+    transport = Transport(Path("driver"))
+    transport._loop = loop
+    transport._output = FakeOutput()
+    return transport
+
+
+def test_first_message_is_written_immediately(transport):
+    transport.send({"id": 1})
+    assert decode_frames(b"".join(transport._output.writes)) == [{"id": 1}]
+
+
+def test_burst_is_coalesced_in_order(loop, transport):
+    for id in range(1, 5):
+        transport.send({"id": id})
+    assert len(transport._output.writes) == 1
+    loop.run_until_complete(asyncio.sleep(0))
+    assert len(transport._output.writes) == 2
+    assert decode_frames(b"".join(transport._output.writes)) == [
+        {"id": 1},
+        {"id": 2},
+        {"id": 3},
+        {"id": 4},
+    ]
+
+    transport.send({"id": 5})
+    assert decode_frames(transport._output.writes[-1]) == [{"id": 5}]
+
+
+def test_stop_flushes_pending_frames(loop, transport):
+    transport.send({"id": 1})
+    transport.send({"id": 2})
+    transport.stop()
+    assert transport._output.closed
+    assert decode_frames(b"".join(transport._output.writes)) == [
+        {"id": 1},
+        {"id": 2},
+    ]
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def test_failed_flush_reports_pending_message_ids(loop, transport):
+    failures = []
+    transport.on_send_error = lambda ids, error: failures.append((ids, error))
+    transport.send({"id": 1})
+    transport.send({"id": 2})
+    transport.send({"id": 3})
+    error = BrokenPipeError()
+    transport._output.error = error
+    loop.run_until_complete(asyncio.sleep(0))
+    assert failures == [([2, 3], error)]